@@ -14,6 +14,7 @@ from starhtml import *
 from starhtml.plugins import motion, scroll
 
 from component_registry import get_registry
+from components.runtime import StarUIRuntime, register_runtime
 from head import SITE_URL, hdrs
 from layouts.base import DocsLayout, LayoutConfig, SidebarConfig
 from layouts.landing import LandingLayout
@@ -147,6 +148,7 @@ app, rt = star_app(
     lifespan=lifespan,
 )
 app.register(position, clipboard, motion, scroll)
+register_runtime(app)
 
 DOCS_NAV_ITEMS = [
     {"href": "/components", "label": "Components"},
@@ -745,11 +747,13 @@ iframe_app, iframe_rt = star_app(
             }
         """),
         Link(rel="stylesheet", href="/static/css/starui.css"),
+        StarUIRuntime(),
     ),
     htmlkw=dict(lang="en", dir="ltr"),
     bodykw=dict(cls="min-h-screen bg-background text-foreground"),
 )
 iframe_app.register(position, clipboard)
+register_runtime(iframe_app)
 
 @iframe_rt("/toast-sse-demo")
 @sse
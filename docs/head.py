@@ -3,6 +3,7 @@
 Centralizes favicon, theme-color, structured data, fonts, and stylesheets.
 """
 
+from components.runtime import StarUIRuntime
 from starhtml import JsonLd, Link, Meta, theme_script
 
 SITE_URL = "https://ui.starhtml.com"
@@ -49,6 +50,9 @@ def _build_hdrs() -> tuple:
         # Stylesheets
         Link(rel="stylesheet", href="/static/css/starui.css"),
 
+        # Shared component behaviors (calendar, command, combobox, scroll area)
+        StarUIRuntime(),
+
         # Fonts
         Link(rel="preconnect", href="https://fonts.googleapis.com"),
         Link(rel="preconnect", href="https://fonts.gstatic.com", crossorigin=""),
@@ -155,11 +155,22 @@ star build --output static/css/app.css --no-minify""",
                 _options_table(
                     ("--output, -o PATH", "CSS output path (default: from config or auto-detected)"),
                     ("--minify / --no-minify", "Minify the output CSS (default: minified)"),
+                    ("--cache / --no-cache", "Reuse a previous build when nothing it depends on changed (default: enabled)"),
+                    ("--fingerprint / --no-fingerprint", "Also write starui.<hash>.css with .gz/.br siblings and assets.json (.br needs starui[compress])"),
+                    ("--tree-shake / --no-tree-shake", "Drop theme color variables no source uses (default: from config)"),
+                    ("--critical", "Also build critical/<output stem>/<route>.css for each route in critical_routes"),
+                    ("--app PATH, --route ROUTE", "App file and routes rendered for --critical (default: from config)"),
+                    ("--target, -t NAME", "Build only this [tool.starui.targets] entry; repeatable (default: all targets)"),
+                    ("--jobs, -j N", "Targets built at once (default: CPU count + 4)"),
+                    ("--report json", "Write phase timings and raw/gzip/brotli sizes to .starui/build-report.json"),
+                    ("--report-file PATH", "Where --report writes"),
                     ("--verbose, -v", "Show detailed output"),
                 ),
                 _callout(
                     "The Tailwind binary is downloaded once and cached at ~/.starui/cache/. "
-                    "Subsequent builds reuse the cached binary with zero network overhead."
+                    "Subsequent builds reuse the cached binary with zero network overhead. "
+                    "Build output is also cached in ~/.starui/cache/builds/, keyed by the binary, input CSS, "
+                    "build mode and the content of your source files, so unchanged projects skip Tailwind entirely."
                 ),
             ),
 
@@ -257,6 +268,29 @@ star sort --check""",
                 ),
             ),
 
+            # 10. star optimize
+            _command_card(
+                "10", "star optimize",
+                "Fold cn() and cva() calls whose arguments are all literals into pre-merged class strings, removing the merge cost from production hot paths.",
+                CodeBlock(
+                    """# Optimize installed components (defaults to component_dir)
+star optimize
+
+# Preview what would be folded
+star optimize --check""",
+                    language="bash",
+                ),
+                _options_table(
+                    ("<paths>", "Files or directories to optimize (optional \u2014 defaults to component_dir)"),
+                    ("--check", "Report foldable calls without rewriting files"),
+                    ("--verbose, -v", "Show detailed output"),
+                ),
+                _callout(
+                    "Optimized files are recorded in .starui/manifest.json, so star status still reports them as up to date "
+                    "and star diff compares against an equally optimized registry copy. star update reinstalls the original source."
+                ),
+            ),
+
             onwards_section(
                 onwards_card("01", "Configuration", "Project settings, auto-detection, manifest, and cache.", "/configuration", "View Configuration"),
                 onwards_card("02", "Deployment", "Production builds, CI/CD pipelines, and GitHub Actions.", "/deployment", "View Deployment"),
@@ -249,7 +249,7 @@ API_REFERENCE = build_api_reference(
     components=[
         Component("Combobox", "Root container managing selection state via Datastar signals"),
         Component("ComboboxTrigger", "Search input with chevron button that opens the dropdown"),
-        Component("ComboboxContent", "Popover panel listing filterable options"),
+        Component("ComboboxContent", "Popover panel listing filterable options. Pass options_url= (served by VirtualOptions) to virtualize thousands of options"),
         Component("ComboboxItem", "Individual selectable option with value, label, and check indicator"),
         Component("ComboboxEmpty", "Shown when no items match the search query"),
         Component("ComboboxGroup", "Group related options under a heading"),
@@ -312,6 +312,7 @@ API_REFERENCE = build_api_reference(
         Component("CommandSeparator", "Visual separator between command groups"),
         Component("CommandShortcut", "Display keyboard shortcut for a command"),
         Component("CommandDialog", "Command palette in a modal dialog overlay"),
+        Component("CommandIndex", "Server-side n-gram index; pass search_url= to Command and stream results() from an @sse route for very large item sets"),
     ]
 )
 
@@ -287,7 +287,7 @@ API_REFERENCE = build_api_reference(
         Component("Select", "Main container managing selected state via Datastar signals"),
         Component("SelectTrigger", "Button that opens the dropdown menu"),
         Component("SelectValue", "Displays current selection or placeholder"),
-        Component("SelectContent", "Dropdown panel listing available items"),
+        Component("SelectContent", "Dropdown panel listing available items. Pass options_url= (served by VirtualOptions) to virtualize thousands of options"),
         Component("SelectItem", "Individual selectable option with value and label"),
         Component("SelectGroup", "Group related options for easier scanning"),
         Component("SelectLabel", "Label heading for a group of options"),
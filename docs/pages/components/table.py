@@ -340,12 +340,13 @@ API_REFERENCE = build_api_reference(
     components=[
         Component("Table", "Root container. Wraps the HTML table in a scroll-enabled div. Use wrapper_cls for the outer div and cls for the inner table"),
         Component("TableHeader", "Groups header rows. Adds a bottom border to child rows"),
-        Component("TableBody", "Groups data rows. Removes the border from the last row"),
+        Component("TableBody", "Groups data rows. Removes the border from the last row. table_body_from_rows(rows, columns) renders large bodies in one pass from dicts, objects or a columnar mapping"),
         Component("TableFooter", "Summary row area with muted background and top border"),
         Component("TableRow", "Row with hover highlight. Set selected=True for persistent muted background"),
         Component("TableHead", "Header cell with muted text, medium font weight, and h-10 height"),
         Component("TableCell", "Data cell with p-2 padding. Use colspan for spanning columns"),
         Component("TableCaption", "Descriptive text below the table. Renders as HTML caption element"),
+        Component("DataTable", "Fixed-height windowed table for large datasets. Columns are DataColumn(key, header, sortable); rows stream from src via data_table_rows() with DataTableParams.from_request() for server-side sort and paging"),
     ]
 )
 
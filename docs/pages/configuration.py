@@ -62,6 +62,7 @@ css_dir = "static/css" """,
                         _config_key("component_dir", "Directory where components are installed. Relative to project root."),
                         _config_key("css_output", "Path for the generated CSS file."),
                         _config_key("css_dir", "Directory containing input.css. Defaults to the parent directory of css_output."),
+                        _config_key("targets", "Named builds under [tool.starui.targets.<name>], each with its own css_output and optional css_dir. star build runs them concurrently."),
                         cls="mt-4 divide-y divide-border rounded-md border border-border bg-muted/20 px-4"
                     ),
                 ),
@@ -259,7 +260,7 @@ css_dir = "static/css" """,
                             Span("Immutable versions", cls="text-sm font-medium"),
                             P(
                                 "e.g. ", Code("v0.3.2", cls="text-sm"),
-                                " \u2014 cached permanently, never re-fetched",
+                                " \u2014 downloaded once as a single archive of the whole registry, cached permanently, never re-fetched",
                                 cls="mt-0.5 text-sm text-muted-foreground",
                             ),
                             cls="py-2"
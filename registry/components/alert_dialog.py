@@ -1,12 +1,12 @@
 from typing import Any, Literal
 
-from starhtml import FT, Div, Signal, Style
+from starhtml import FT, Div, Signal
 from starhtml import H2 as HTMLH2
 from starhtml import Dialog as HTMLDialog
 from starhtml import P as HTMLP
 from starhtml.datastar import document
 
-from .utils import cn, gen_id, inject_context, merge_actions
+from .utils import cn, component_style, gen_id, inject_context, merge_actions
 
 __metadata__ = {"description": "Alert dialog for confirmations"}
 
@@ -47,7 +47,7 @@ def AlertDialog(
     ctx = {"open_state": open_state, "dialog_ref": dialog_ref, "sig": sig}
 
     return Div(
-        Style(_ALERT_DIALOG_STYLES),
+        component_style(_ALERT_DIALOG_STYLES),
         trigger(**ctx) if trigger else None,
         HTMLDialog(
             content(**ctx) if content else None,
@@ -3,7 +3,7 @@ from typing import Literal
 from starhtml import FT
 from starhtml import Button as HTMLButton
 
-from .utils import cn, cva
+from .utils import cva
 
 __metadata__ = {"description": "Button with variants"}
 
@@ -40,6 +40,7 @@ button_variants = cva(
         },
         "defaultVariants": {"variant": "default", "size": "default"},
     },
+    precompile=True,
 )
 
 
@@ -54,7 +55,7 @@ def Button(
 ) -> FT:
     return HTMLButton(
         *children,
-        cls=cn(button_variants(variant=variant, size=size), cls),
+        cls=button_variants(variant=variant, size=size, cls=cls),
         disabled=disabled,
         type=type,
         **kwargs,
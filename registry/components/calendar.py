@@ -2,10 +2,11 @@ from datetime import datetime
 from typing import Any, Literal, Protocol
 
 from starhtml import Button as HTMLButton
-from starhtml import Div, Icon, Signal, Span, Style, js
+from starhtml import Div, Icon, Signal, Span, js
 
 from .button import Button
-from .utils import cn, gen_id, with_signals
+from .runtime import runtime_call
+from .utils import cn, component_style, gen_id, with_signals
 
 __metadata__ = {"description": "Date picker with range and multiple selection"}
 
@@ -79,7 +80,7 @@ def Calendar(
 
     return with_signals(
         Div(
-            Style(_CALENDAR_STYLES),
+            component_style(_CALENDAR_STYLES),
             (month_sig := Signal(sig + "_month", current_month)),
             (year_sig := Signal(sig + "_year", current_year)),
             (month_display_sig := Signal(sig + "_month_display", MONTHS[current_month - 1])),
@@ -280,7 +281,7 @@ def _build_calendar_grid(
     on_select: str | None,
 ) -> Div:
     return Div(
-        data_effect=js(_render_days_effect(sig, selected, mode, disabled, today_str)),
+        data_effect=_render_days_effect(sig, selected, mode, disabled, today_str),
         data_on_click=js(_day_select_handler(selected, mode, on_select)) if not disabled else None,
         cls="cal-body",
         data_calendar_body=sig,
@@ -329,22 +330,7 @@ def _day_select_handler(selected, mode: CalendarMode, on_select: str | list | No
     return ";".join(parts)
 
 
-def _render_days_effect(sig: str, selected, mode: CalendarMode, disabled: bool, today_str: str) -> str:
-    gen_cal = "const f=new Date(y,mm-1,1),days=new Date(y,mm,0).getDate(),o=f.getDay(),prevDays=new Date(y,mm-1,0).getDate(),a=[];for(let i=0;i<42;i++){const n=i-o+1;if(n<1){const pd=prevDays+n,pm=mm-1<1?12:mm-1,py=mm-1<1?y-1:y;a.push({day:pd.toString(),date:`${py}-${pm.toString().padStart(2,'0')}-${pd.toString().padStart(2,'0')}`,outside:true})}else if(n>days){const nd=n-days,nm=mm+1>12?1:mm+1,ny=mm+1>12?y+1:y;a.push({day:nd.toString(),date:`${ny}-${nm.toString().padStart(2,'0')}-${nd.toString().padStart(2,'0')}`,outside:true})}else{a.push({day:n.toString(),date:`${y}-${mm.toString().padStart(2,'0')}-${n.toString().padStart(2,'0')}`,outside:false})}}"
-
-    sel_check = {
-        "single": "s===c.date",
-        "multiple": "s.includes(c.date)",
-        "range": "s.length===1?c.date===s[0]:s.length===2?c.date>=s[0]&&c.date<=s[1]:false",
-    }[mode]
-
-    range_logic = (
-        "if(m==='range'&&s.length===2&&!o){const[a,b]=s;if(c.date===a&&a!==b)l+=' range-start';else if(c.date===b&&a!==b)l+=' range-end';else if(c.date>a&&c.date<b){l+=' range-middle';if(yy===0)l+=' range-week-start';if(yy===6)l+=' range-week-end'}else if(a===b&&c.date===a)l+=' range-single'}"
-        if mode == "range"
-        else ""
+def _render_days_effect(sig: str, selected, mode: CalendarMode, disabled: bool, today_str: str):
+    return runtime_call(
+        "calendarDays", sig, js(f"${sig}_year"), js(f"${sig}_month"), selected, mode, today_str, disabled
     )
-
-    selected_setup = f"s={selected}||''" if mode == "single" else f"s={selected}||[]"
-
-    disabled_check = "if(!o&&!e)l+=' disabled';" if disabled else ""
-    return f"""const b=document.querySelector('[data-calendar-body="{sig}"]'),m='{mode}';if(!b)return;{selected};const y=parseInt(${sig}_year),mm=parseInt(${sig}_month);{gen_cal};const {selected_setup};let h='';let lastWeekWithDates=5;for(let w=5;w>=0;w--){{let hasDate=false;for(let yy=0;yy<7;yy++){{const i=w*7+yy,c=a[i]||{{}};if(c.date&&!c.outside){{hasDate=true;break}}}}if(hasDate){{lastWeekWithDates=w;break}}}}for(let w=0;w<=lastWeekWithDates;w++){{h+='<div role="row" class="flex w-full mt-2">';for(let yy=0;yy<7;yy++){{const i=w*7+yy,c=a[i]||{{}},o=c.outside,e=!c.date,t=c.date==='{today_str}'&&!o,x=!o&&({sel_check});let l='cal-cell h-8 min-w-8 flex-1 text-center text-sm rounded-md transition-colors flex items-center justify-center';if(!o&&!e&&!{str(disabled).lower()})l+=' cursor-pointer';{disabled_check}if(o)l+=' outside';if(t)l+=' today';if(x)l+=' selected';{range_logic}h+=`<div class="${{l}}" data-date="${{o?'':c.date||''}}" role="gridcell" aria-selected="${{!!x}}"${{o?' aria-disabled="true"':''}}>${{c.day||''}}</div>`}}h+='</div>'}}b.innerHTML=h"""
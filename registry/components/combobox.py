@@ -1,12 +1,13 @@
 from itertools import count
 
-from starhtml import FT, Div, Icon, Input, Signal, Span, Style, expr, js
+from starhtml import FT, Div, Icon, Input, Signal, Span, expr, js
 from starhtml import Button as HTMLButton
 from starhtml import Label as HTMLLabel
 from starhtml import P as HTMLP
 from starhtml.datastar import evt
 
-from .utils import cn, gen_id, inject_context, merge_actions, with_signals
+from .runtime import VirtualRows, runtime_call, setter, virtual_list
+from .utils import cn, component_style, gen_id, inject_context, merge_actions, with_signals
 
 __metadata__ = {
     "description": "Searchable dropdown selection",
@@ -29,38 +30,24 @@ def _js_esc(s: str) -> str:
 
 def _get_combobox_handler(
     sig, search, visible_items, highlighted, *, multiple=False, selected=None, selected_label=None
-) -> str:
-    tab = (
-        "case'Tab':if(isOpen)pop.hidePopover();break;"
+):
+    pop_last = (
+        js(
+            f"()=>{{if({selected}.length>0){{{selected}={selected}.slice(0,-1);{selected_label}={selected_label}.slice(0,-1);return true}}}}"
+        )
         if multiple
-        else "case'Tab':if(isOpen){{if(ci>=0&&vi[ci])clk();else pop.hidePopover()}};break;"
+        else None
     )
-    backspace = (
-        f"case'Backspace':if(inp?.value===''&&{selected}.length>0){{evt.preventDefault();{selected}={selected}.slice(0,-1);{selected_label}={selected_label}.slice(0,-1)}};break;"
-        if multiple
-        else ""
+    return runtime_call(
+        "comboboxKeys",
+        js("evt"),
+        sig,
+        visible_items,
+        highlighted,
+        setter(highlighted),
+        js(f"()=>{search}=''"),
+        pop_last,
     )
-    return f"""\
-if(evt.isComposing||evt.keyCode===229)return;
-const inp=document.getElementById('{sig}_input');
-const pop=document.getElementById('{sig}_content');
-const isOpen=pop&&pop.matches(':popover-open');
-const vi={visible_items}||[];
-const ci=vi.findIndex(x=>x.index==={highlighted});
-const hi=idx=>{{if(idx<0)return;{highlighted}=idx;inp?.setAttribute('aria-activedescendant','{sig}_opt_'+idx);document.getElementById('{sig}_opt_'+idx)?.scrollIntoView({{block:'nearest'}})}};
-const openPop=()=>{{if(pop&&!isOpen)pop.showPopover()}};
-const clk=()=>document.getElementById('{sig}_opt_'+vi[ci]?.index)?.click();
-const move=(fi,ni)=>{{evt.preventDefault();if(!isOpen){{openPop();if(vi.length>0)hi(vi[fi].index)}}else if(vi.length>0)hi(vi[ni].index)}};
-switch(evt.key){{
-case'ArrowDown':move(0,ci<vi.length-1?ci+1:0);break;
-case'ArrowUp':move(vi.length-1,ci>0?ci-1:vi.length-1);break;
-case'Enter':evt.preventDefault();if(isOpen&&ci>=0&&vi[ci])clk();break;
-case'Escape':if(isOpen){{evt.preventDefault();pop.hidePopover()}}else if(inp?.value){{evt.preventDefault();inp.value='';{search}=''}};break;
-{tab}
-case'Home':if(isOpen&&vi.length>0){{evt.preventDefault();hi(vi[0].index)}};break;
-case'End':if(isOpen&&vi.length>0){{evt.preventDefault();hi(vi[vi.length-1].index)}};break;
-{backspace}default:if(evt.key.length===1&&!evt.ctrlKey&&!evt.metaKey&&!evt.altKey){{openPop();inp?.removeAttribute('aria-activedescendant');{highlighted}=-1}};break;
-}}"""
 
 
 def _chip_effect(sig, selected, selected_label) -> str:
@@ -138,7 +125,7 @@ def Combobox(
 
     return with_signals(
         Div(
-            Style(_POPOVER_ANIMATE),
+            component_style(_POPOVER_ANIMATE),
             selected,
             selected_label,
             open_state,
@@ -186,16 +173,14 @@ def ComboboxTrigger(
         input_el = Input(
             data_ref=input_ref,
             data_on_input=search.set(evt.target.value),
-            data_on_keydown=js(
-                _get_combobox_handler(
-                    sig,
-                    search,
-                    visible_items,
-                    highlighted,
-                    multiple=multiple,
-                    selected=selected,
-                    selected_label=selected_label,
-                )
+            data_on_keydown=_get_combobox_handler(
+                sig,
+                search,
+                visible_items,
+                highlighted,
+                multiple=multiple,
+                selected=selected,
+                selected_label=selected_label,
             ),
             data_on_click=content_ref.showPopover(),
             value=None if multiple else (selected_label._initial or None),
@@ -282,6 +267,9 @@ def ComboboxContent(
     align: str = "start",
     side_offset: int = 4,
     container: str = "none",
+    options_url: str | None = None,
+    row_height: int = 32,
+    overscan: int = 6,
     cls: str = "",
     **kwargs,
 ) -> FT:
@@ -303,6 +291,24 @@ if(v.length>0&&{highlighted}===-1){highlighted}=parseInt(v[0].dataset.index||'0'
 const sr=document.getElementById('{sig}_sr');
 if(sr&&document.getElementById('{sig}_content')?.matches(':popover-open'))sr.textContent=`${{v.length}} option${{v.length!==1?'s':''}} available`}})""")
 
+        if options_url:
+            scan_effect = virtual_list(
+                content_ref._id,
+                options_url,
+                sig=sig,
+                select=_virtual_select(sig, search, ctx["selected"], selected_label, multiple),
+                query=search,
+                highlighted=highlighted,
+                selected=ctx["selected"],
+                row_height=row_height,
+                overscan=overscan,
+                highlight=setter(highlighted),
+                visible=setter(visible_items),
+                announce=js(
+                    f"n=>{{const sr=document.getElementById('{sig}_sr');if(sr)sr.textContent=n+' option'+(n!==1?'s':'')+' available'}}"
+                ),
+            )
+
         ctx = dict(
             sig=sig,
             open_state=open_state,
@@ -318,6 +324,7 @@ if(sr&&document.getElementById('{sig}_content')?.matches(':popover-open'))sr.tex
         return Div(
             Div(
                 *[inject_context(child, **ctx) for child in children],
+                VirtualRows(_virtual_row(sig, row_height)) if options_url else None,
                 data_effect=scan_effect,
                 cls="p-1",
             ),
@@ -353,6 +360,38 @@ if(sr&&document.getElementById('{sig}_content')?.matches(':popover-open'))sr.tex
     return _
 
 
+def _virtual_select(sig, search, selected, selected_label, multiple: bool):
+    if multiple:
+        return js(
+            f"(v,l)=>{{const idx={selected}.indexOf(v);"
+            f"{selected}=idx>=0?{selected}.filter((_,i)=>i!==idx):[...{selected},v];"
+            f"{selected_label}=idx>=0?{selected_label}.filter((_,i)=>i!==idx):[...{selected_label},l];"
+            f"{search}='';document.getElementById('{sig}_input').value=''}}"
+        )
+    return js(f"(v,l)=>{{{selected}=v;{selected_label}=l;document.getElementById('{sig}_content').hidePopover()}}")
+
+
+def _virtual_row(sig: str, row_height: int) -> FT:
+    return Div(
+        Span(data_virtual_label="", cls="truncate"),
+        Span(
+            Icon("lucide:check", cls="size-4"),
+            style="opacity: 0",
+            data_virtual_indicator="",
+            cls="pointer-events-none absolute right-2 flex size-4 items-center justify-center",
+            data_slot="combobox-item-indicator",
+        ),
+        role="option",
+        data_combobox_item=sig,
+        data_slot="combobox-item",
+        style=f"height:{row_height}px",
+        cls=(
+            "relative flex w-full cursor-default items-center gap-2 rounded-sm py-1.5 pr-8 pl-2 text-sm outline-hidden select-none "
+            "data-[highlighted=true]:bg-accent data-[highlighted=true]:text-accent-foreground"
+        ),
+    )
+
+
 def ComboboxItem(
     *children,
     value: str = "",
@@ -1,10 +1,13 @@
+import heapq
+from collections.abc import Callable, Iterable
 from itertools import count
-from typing import Literal
+from typing import Literal, NamedTuple
 
-from starhtml import FT, Div, Icon, Input, Signal, Span, expr, js, set_timeout
+from starhtml import FT, Div, Icon, Input, Signal, Span, elements, expr, get, js, set_timeout, signals
 from starhtml import Dialog as HTMLDialog
 from starhtml.datastar import document, evt, seq
 
+from .runtime import runtime_call, setter
 from .utils import cn, cva, gen_id, inject_context, merge_actions, with_signals
 
 __metadata__ = {"description": "Command palette interface"}
@@ -13,10 +16,12 @@ __metadata__ = {"description": "Command palette interface"}
 CommandSize = Literal["sm", "md", "lg"]
 # Native dialog needs a frame to finish opening before input can receive focus
 _DIALOG_FOCUS_DELAY_MS = 50
+_SEARCH_DEBOUNCE_MS = 150
+_NGRAM = 3
 
 
-def _get_nav_handler(sig, search, selected, visible_items) -> str:
-    return f"const i={visible_items}||[];let c=-1;for(let x=0;x<i.length;x++)if(i[x].index==={selected}){{c=x;break}}const sel=idx=>({selected}=idx,document.querySelector('[data-command-item=\"{sig}\"][data-index=\"'+idx+'\"]')?.scrollIntoView({{block:'nearest'}}));switch(evt.key){{case'ArrowDown':evt.preventDefault();i.length>0&&sel(i[c<i.length-1?c+1:0].index);break;case'ArrowUp':evt.preventDefault();i.length>0&&sel(i[c>0?c-1:i.length-1].index);break;case'Enter':evt.preventDefault();c>=0&&i[c]&&document.querySelector('[data-command-item=\"{sig}\"][data-index=\"'+i[c].index+'\"]')?.click();break;case'Escape':{search}&&(evt.preventDefault(),{search}='',{selected}=0);break}}"
+def _get_nav_handler(sig, search, selected, visible_items):
+    return runtime_call("commandNav", js("evt"), sig, visible_items, selected, search, setter(selected), setter(search))
 
 
 command_variants = cva(
@@ -34,6 +39,7 @@ command_variants = cva(
         },
         "defaultVariants": {"size": "md"},
     },
+    precompile=True,
 )
 
 
@@ -42,6 +48,7 @@ def Command(
     signal: str | Signal = "",
     size: CommandSize = "md",
     label: str = "Command Menu",
+    search_url: str | None = None,
     cls: str = "",
     _dialog_ref=None,
     **kwargs,
@@ -62,6 +69,7 @@ def Command(
         "input_ref": input_ref,
         "_item_index": count(),
         "dialog_ref": _dialog_ref,
+        "search_url": search_url,
     }
 
     return with_signals(
@@ -75,7 +83,7 @@ def Command(
             data_slot="command",
             aria_label=label,
             tabindex="-1",
-            cls=cn(command_variants(size=size), cls),
+            cls=command_variants(size=size, cls=cls),
             **kwargs,
         ),
         search=search,
@@ -90,6 +98,7 @@ def CommandDialog(
     modal: bool = True,
     shortcut: str | None = None,
     label: str = "Command Menu",
+    search_url: str | None = None,
     cls: str = "",
     **kwargs,
 ) -> FT:
@@ -102,6 +111,7 @@ def CommandDialog(
         signal=sig,
         _dialog_ref=dialog_ref,
         label=label,
+        search_url=search_url,
         cls="border-0 **:data-[slot=command-input-wrapper]:h-12",
     )
 
@@ -167,14 +177,17 @@ def CommandInput(
     cls: str = "",
     **kwargs,
 ):
-    def _(*, sig, search, selected, visible_items, input_ref, **_):
+    def _(*, sig, search, selected, visible_items, input_ref, search_url=None, **_):
+        # Datastar aborts the previous in-flight @get from the same element, so stale queries never land
+        on_input = (get(search_url), {"debounce": f"{_SEARCH_DEBOUNCE_MS}ms"}) if search_url else None
         return Div(
             Div(
                 Icon("lucide:search", cls="size-4 shrink-0 opacity-50"),
                 Input(
                     data_ref=input_ref,
                     data_bind=search,
-                    data_on_keydown=js(_get_nav_handler(sig, search, selected, visible_items)),
+                    data_on_keydown=_get_nav_handler(sig, search, selected, visible_items),
+                    data_on_input=on_input,
                     placeholder=placeholder,
                     data_slot="command-input",
                     cls="min-w-0 flex-1 bg-transparent px-2 text-sm text-ellipsis outline-hidden placeholder:text-muted-foreground disabled:cursor-not-allowed disabled:opacity-50",
@@ -202,7 +215,29 @@ def CommandList(
     cls: str = "",
     **kwargs,
 ):
-    def _(*, sig, visible_count, visible_items, search, selected, **ctx):
+    def _(*, sig, visible_count, visible_items, search, selected, search_url=None, **ctx):
+        context = dict(
+            sig=sig,
+            visible_count=visible_count,
+            visible_items=visible_items,
+            search=search,
+            selected=selected,
+            search_url=search_url,
+            **ctx,
+        )
+        if search_url:
+            # Matches (and the visible-item signals) are streamed into the results slot by CommandIndex.results()
+            return Div(
+                *[inject_context(c, **context) for c in children],
+                Div(id=f"{sig}_results", data_init=get(search_url)),
+                role="listbox",
+                aria_label="Commands",
+                data_command_list=sig,
+                data_slot="command-list",
+                cls=cn("max-h-[300px] scroll-py-1 overflow-x-hidden overflow-y-auto", cls),
+                **kwargs,
+            )
+
         # RAF ensures DOM updates (data-show hiding) complete before scanning
         scan_effect = js(f"""
             {search};
@@ -216,18 +251,7 @@ def CommandList(
         """)
 
         return Div(
-            *[
-                inject_context(
-                    c,
-                    sig=sig,
-                    visible_count=visible_count,
-                    visible_items=visible_items,
-                    search=search,
-                    selected=selected,
-                    **ctx,
-                )
-                for c in children
-            ],
+            *[inject_context(c, **context) for c in children],
             data_effect=scan_effect,
             role="listbox",
             aria_label="Commands",
@@ -306,12 +330,12 @@ def CommandItem(
     cls: str = "",
     **kwargs,
 ):
-    def _(*, sig, search, selected, _item_index, dialog_ref, **_):
+    def _(*, sig, search, selected, _item_index, dialog_ref, search_url=None, **_):
         index = next(_item_index)
 
         item_show = (
             show
-            if show is not None or disabled
+            if show is not None or disabled or search_url
             else (
                 ~search
                 | expr(value).lower().contains(search.lower())
@@ -382,3 +406,100 @@ def CommandShortcut(
         ),
         **kwargs,
     )
+
+
+class CommandEntry(NamedTuple):
+    value: str
+    label: str
+    keywords: str = ""
+    onclick: str | None = None
+
+
+class CommandIndex:
+    """In-memory n-gram index for server-filtered Command palettes with thousands of items.
+
+    Pair with ``Command(search_url=...)`` and stream ``results()`` from an ``@sse`` route:
+
+        index = CommandIndex(CommandEntry(p.slug, p.title) for p in pages)
+
+        @rt("/palette/search")
+        @sse
+        def palette_search(palette_search: str = ""):
+            yield from index.results("palette", palette_search)
+    """
+
+    def __init__(self, entries: Iterable[CommandEntry | tuple[str, str] | str], *, limit: int = 50):
+        self.limit = limit
+        self.entries: list[CommandEntry] = [
+            e if isinstance(e, CommandEntry) else CommandEntry(e, e) if isinstance(e, str) else CommandEntry(*e)
+            for e in entries
+        ]
+        # Same haystack as client-side filtering: value and keywords, never the label
+        self._values = [e.value.lower() for e in self.entries]
+        self._haystacks = [f"{e.value}\x00{e.keywords}".lower() for e in self.entries]
+        self._postings: dict[str, list[int]] = {}
+        for i, hay in enumerate(self._haystacks):
+            grams = {hay[j : j + n] for n in range(1, _NGRAM + 1) for j in range(len(hay) - n + 1)}
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(i)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def _candidates(self, q: str) -> Iterable[int]:
+        if len(q) <= _NGRAM:
+            return self._postings.get(q, ())
+        # Rarest trigram bounds the candidate set; a substring check confirms each hit
+        shortest = min(
+            (self._postings.get(q[j : j + _NGRAM], ()) for j in range(len(q) - _NGRAM + 1)),
+            key=len,
+        )
+        return (i for i in shortest if q in self._haystacks[i])
+
+    def _rank(self, q: str, i: int) -> tuple[int, int]:
+        value = self._values[i]
+        if value.startswith(q):
+            return 0, i
+        pos = value.find(q)
+        if pos > 0 and not value[pos - 1].isalnum():
+            return 1, i
+        return (2 if pos > 0 else 3), i
+
+    def search(self, query: str, limit: int | None = None) -> list[CommandEntry]:
+        """Top matches: value prefix, then word start, then substring, then keyword-only; ties keep input order."""
+        limit = self.limit if limit is None else limit
+        q = query.strip().lower()
+        if not q:
+            return self.entries[:limit]
+        hits = heapq.nsmallest(limit, (self._rank(q, i) for i in self._candidates(q)))
+        return [self.entries[i] for _, i in hits]
+
+    def results(
+        self,
+        signal: str | Signal,
+        query: str,
+        *,
+        limit: int | None = None,
+        render: Callable[[CommandEntry], FT | Callable] | None = None,
+        dialog: bool = False,
+    ):
+        """SSE items that replace the list contents with the top matches and reset selection."""
+        sig = getattr(signal, "_id", signal)
+        matches = self.search(query, limit)
+        render = render or (lambda e: CommandItem(e.label, value=e.value, keywords=e.keywords, onclick=e.onclick))
+        ctx = {
+            "sig": sig,
+            "search": Signal(f"{sig}_search", ""),
+            "selected": Signal(f"{sig}_selected", 0),
+            "_item_index": count(),
+            "dialog_ref": Signal(f"{sig}_dialog", _ref_only=True) if dialog else None,
+            "search_url": True,
+        }
+        yield elements(Div(*[inject_context(render(e), **ctx) for e in matches], id=f"{sig}_results"))
+        yield signals(
+            **{
+                f"{sig}_visible": len(matches),
+                f"{sig}_visible_items": [{"index": i} for i in range(len(matches))],
+                f"{sig}_selected": 0,
+            }
+        )
@@ -1,13 +1,13 @@
 from typing import Any, Literal
 
-from starhtml import FT, Div, Icon, Signal, Span, Style
+from starhtml import FT, Div, Icon, Signal, Span
 from starhtml import H2 as HTMLH2
 from starhtml import Button as HTMLButton
 from starhtml import Dialog as HTMLDialog
 from starhtml import P as HTMLP
 from starhtml.datastar import document, evt, seq
 
-from .utils import cn, cva, gen_id, inject_context, merge_actions
+from .utils import cn, component_style, cva, gen_id, inject_context, merge_actions
 
 __metadata__ = {"description": "Modal dialog"}
 
@@ -72,7 +72,7 @@ def Dialog(
     }
 
     return Div(
-        Style(_DIALOG_STYLES),
+        component_style(_DIALOG_STYLES),
         open_state,
         trigger(**ctx) if trigger else None,
         HTMLDialog(
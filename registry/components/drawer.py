@@ -1,11 +1,11 @@
 from typing import Literal
 
-from starhtml import FT, Div, Icon, P, Signal, Span, Style, js
+from starhtml import FT, Div, Icon, P, Signal, Span, js
 from starhtml import H2 as HTMLH2
 from starhtml import Dialog as HTMLDialog
 from starhtml.datastar import document, evt, seq
 
-from .utils import cn, gen_id, inject_context, merge_actions
+from .utils import cn, component_style, gen_id, inject_context, merge_actions
 
 __metadata__ = {"description": "Draggable drawer panel"}
 
@@ -127,7 +127,7 @@ def Drawer(
         drag_style_attrs["data_style_transition"] = js(f"${sig}_dg ? 'none' : ''")
 
     return Div(
-        Style(_DRAWER_STYLES),
+        component_style(_DRAWER_STYLES),
         drawer_open,
         trigger(**ctx) if trigger else None,
         HTMLDialog(
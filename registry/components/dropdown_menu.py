@@ -1,9 +1,9 @@
 from typing import Literal
 
-from starhtml import FT, Div, Hr, Icon, Signal, Span, Style, js
+from starhtml import FT, Div, Hr, Icon, Signal, Span, js
 from starhtml import Button as HTMLButton
 
-from .utils import cn, cva, gen_id, inject_context, merge_actions
+from .utils import cn, component_style, cva, gen_id, inject_context, merge_actions
 
 __metadata__ = {
     "description": "Dropdown menu with items",
@@ -77,7 +77,7 @@ def DropdownMenu(*children, signal: str | Signal = "", cls: str = "", **kwargs)
     }
 
     return Div(
-        Style(_POPOVER_ANIMATE),
+        component_style(_POPOVER_ANIMATE),
         open_state,
         *[inject_context(child, **ctx) for child in children],
         data_slot="dropdown-menu",
@@ -1,8 +1,8 @@
-from starhtml import FT, Div, Icon, Signal, Style, js, set_timeout
+from starhtml import FT, Div, Icon, Signal, js, set_timeout
 from starhtml import Input as HTMLInput
 from starhtml.datastar import evt
 
-from .utils import cn, gen_id, inject_context
+from .utils import cn, component_style, gen_id, inject_context
 
 __metadata__ = {"description": "One-time password input"}
 
@@ -59,7 +59,7 @@ def InputOTP(
     }
 
     return Div(
-        Style(_OTP_STYLES),
+        component_style(_OTP_STYLES),
         otp,
         HTMLInput(type="hidden", name=name, data_bind=otp) if name else None,
         *slot_signals,
@@ -1,11 +1,11 @@
 from itertools import count
 from typing import Literal
 
-from starhtml import FT, Div, Hr, Icon, Signal, Span, Style, clear_timeout, js, reset_timeout
+from starhtml import FT, Div, Hr, Icon, Signal, Span, clear_timeout, js, reset_timeout
 from starhtml import Button as HTMLButton
 from starhtml.datastar import seq
 
-from .utils import cn, cva, gen_id, inject_context, merge_actions
+from .utils import cn, component_style, cva, gen_id, inject_context, merge_actions
 
 __metadata__ = {
     "description": "Desktop-style persistent menu bar",
@@ -79,7 +79,7 @@ def Menubar(*children, signal: str | Signal = "", cls: str = "", **kwargs) -> FT
     }
 
     return Div(
-        Style(_POPOVER_ANIMATE),
+        component_style(_POPOVER_ANIMATE),
         active,
         *[inject_context(child, **ctx) for child in children],
         role="menubar",
@@ -0,0 +1,260 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from typing import Any
+
+from starhtml import FT, Div, Script, Template, js
+from starhtml.datastar import Expr
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+__metadata__ = {"description": "Shared client runtime for component behaviors"}
+
+# Behaviors shared by every instance live here once; components emit short StarUI.*(...) calls.
+# Setters are passed as arrow functions so the runtime never needs to know signal names.
+RUNTIME_JS = """\
+(function(){
+if(window.StarUI)return;
+const byId=id=>document.getElementById(id);
+const pad=n=>n.toString().padStart(2,'0');
+window.StarUI={
+autoHide(id,d){
+const v=byId(id);if(!v)return;let h;
+const s=()=>{clearTimeout(h);v.setAttribute('data-scroll-area-hidden','false')},
+x=()=>{clearTimeout(h);h=setTimeout(()=>v.setAttribute('data-scroll-area-hidden','true'),d)};
+'mouseenter mousemove wheel touchstart touchmove pointerenter pointerdown focus'.split(' ').forEach(e=>v.addEventListener(e,s));
+'mouseleave pointerleave blur'.split(' ').forEach(e=>v.addEventListener(e,x));
+v.addEventListener('scroll',()=>{s();x()});
+v.addEventListener('keydown',e=>{if(['ArrowUp','ArrowDown','ArrowLeft','ArrowRight','PageUp','PageDown','Home','End'].includes(e.key))s()});
+x()},
+commandNav(evt,sig,items,selected,search,setSelected,setSearch){
+const i=items||[],c=i.findIndex(x=>x.index===selected);
+const item=idx=>document.querySelector('[data-command-item="'+sig+'"][data-index="'+idx+'"]');
+const sel=idx=>{setSelected(idx);item(idx)?.scrollIntoView({block:'nearest'})};
+switch(evt.key){
+case'ArrowDown':evt.preventDefault();i.length>0&&sel(i[c<i.length-1?c+1:0].index);break;
+case'ArrowUp':evt.preventDefault();i.length>0&&sel(i[c>0?c-1:i.length-1].index);break;
+case'Enter':evt.preventDefault();c>=0&&item(i[c].index)?.click();break;
+case'Escape':if(search){evt.preventDefault();setSearch('');setSelected(0)}break}},
+comboboxKeys(evt,sig,items,highlighted,setHighlighted,clearSearch,popLast){
+if(evt.isComposing||evt.keyCode===229)return;
+const inp=byId(sig+'_input'),pop=byId(sig+'_content'),isOpen=pop&&pop.matches(':popover-open');
+const vl=pop&&pop._starVirtual,vi=items||[],n=vl?vl.total:vi.length,at=k=>vl?k:vi[k].index;
+const ci=vl?(highlighted<n?highlighted:-1):vi.findIndex(x=>x.index===highlighted);
+const hi=idx=>{if(idx<0)return;setHighlighted(idx);vl?.reveal(idx);inp?.setAttribute('aria-activedescendant',sig+'_opt_'+idx);byId(sig+'_opt_'+idx)?.scrollIntoView({block:'nearest'})};
+const openPop=()=>{if(pop&&!isOpen)pop.showPopover()};
+const clk=()=>byId(sig+'_opt_'+at(ci))?.click();
+const move=(fi,ni)=>{evt.preventDefault();if(!isOpen){openPop();if(n>0)hi(at(fi))}else if(n>0)hi(at(ni))};
+switch(evt.key){
+case'ArrowDown':move(0,ci<n-1?ci+1:0);break;
+case'ArrowUp':move(n-1,ci>0?ci-1:n-1);break;
+case'Enter':evt.preventDefault();if(isOpen&&ci>=0&&ci<n)clk();break;
+case'Escape':if(isOpen){evt.preventDefault();pop.hidePopover()}else if(inp?.value){evt.preventDefault();inp.value='';clearSearch()}break;
+case'Tab':if(isOpen){if(!popLast&&ci>=0&&ci<n)clk();else pop.hidePopover()}break;
+case'Home':if(isOpen&&n>0){evt.preventDefault();hi(at(0))}break;
+case'End':if(isOpen&&n>0){evt.preventDefault();hi(at(n-1))}break;
+case'Backspace':if(popLast&&inp?.value===''&&popLast())evt.preventDefault();break;
+default:if(evt.key.length===1&&!evt.ctrlKey&&!evt.metaKey&&!evt.altKey){openPop();inp?.removeAttribute('aria-activedescendant');setHighlighted(-1)}}},
+virtualList(id,cfg){
+const el=byId(id);if(!el)return null;
+if(el._starVirtual){Object.assign(el._starVirtual.cfg,cfg);return el._starVirtual}
+const spacer=el.querySelector('[data-virtual-spacer]'),box=el.querySelector('[data-virtual-rows]'),tpl=el.querySelector('template[data-virtual-row]');
+const rh=cfg.rowHeight,ov=cfg.overscan,size=cfg.pageSize;
+const v={cfg,total:0,q:null,hl:-1,sel:null,pages:new Map(),pending:new Set(),ctrl:null,rows:[],first:0,last:0,
+item(i){const p=this.pages.get(Math.floor(i/size));return p&&p[i%size]},
+load(p){
+if(this.pages.has(p)||this.pending.has(p))return;this.pending.add(p);
+const ctrl=this.ctrl,u=new URL(this.cfg.url,location.href);
+u.searchParams.set('q',this.q);u.searchParams.set('offset',p*size);u.searchParams.set('limit',size);
+fetch(u,{signal:ctrl.signal,headers:{accept:'application/json'}}).then(r=>r.json()).then(d=>{
+if(ctrl!==this.ctrl)return;this.pending.delete(p);this.pages.set(p,d.items);const fresh=this.total!==d.total||p===0;this.total=d.total;
+spacer.style.height=this.total*rh+'px';this.render(true);
+if(fresh&&p===0){if(this.hl===-1&&this.total>0)this.cfg.highlight?.(0);this.cfg.announce?.(this.total)}
+}).catch(()=>this.pending.delete(p))},
+query(q){this.ctrl?.abort();this.ctrl=new AbortController();this.q=q;this.pages.clear();this.pending.clear();el.scrollTop=0;this.load(0)},
+render(force){
+const first=Math.max(0,Math.floor(el.scrollTop/rh)-ov),last=Math.min(this.total,Math.ceil((el.scrollTop+el.clientHeight)/rh)+ov);
+for(let p=Math.floor(first/size);p*size<last;p++)this.load(p);
+if(force||first!==this.first||last!==this.last){this.first=first;this.last=last;const w=[];for(let i=first;i<last;i++)w.push({index:i});this.cfg.visible?.(w)}
+box.style.transform=`translateY(${first*rh}px)`;
+while(this.rows.length<last-first){const r=tpl.content.firstElementChild.cloneNode(true);box.appendChild(r);this.rows.push(r)}
+this.rows.forEach((r,k)=>{
+const i=first+k,it=i<last&&this.item(i);r.hidden=i>=last;if(r.hidden)return;
+const s=!!it&&(Array.isArray(this.sel)?this.sel.includes(it.value):this.sel===it.value);
+r.id=this.cfg.sig+'_opt_'+i;r.dataset.index=i;r.dataset.value=it?it.value:'';r.dataset.highlighted=i===this.hl;r.setAttribute('aria-selected',s);
+r.querySelector('[data-virtual-label]').textContent=it?it.label:'';const ind=r.querySelector('[data-virtual-indicator]');if(ind)ind.style.opacity=s?'1':'0'})},
+update(q,hl,sel){this.hl=hl;this.sel=sel;if(q!==this.q)this.query(q);else this.render()},
+reveal(i){const top=i*rh;if(top<el.scrollTop)el.scrollTop=top;else if(top+rh>el.scrollTop+el.clientHeight)el.scrollTop=top+rh-el.clientHeight;this.hl=i;this.render()}};
+el._starVirtual=v;
+el.addEventListener('scroll',()=>v.render(),{passive:true});
+el.addEventListener('toggle',()=>v.render());
+box.addEventListener('click',e=>{const r=e.target.closest('[data-index]'),it=r&&v.item(+r.dataset.index);if(it)v.cfg.select(it.value,it.label)});
+box.addEventListener('mousemove',e=>{const r=e.target.closest('[data-index]');if(r&&+r.dataset.index!==v.hl)v.cfg.highlight?.(+r.dataset.index)});
+return v},
+calendarDays(sig,year,month,selected,mode,today,disabled){
+const b=document.querySelector('[data-calendar-body="'+sig+'"]');if(!b)return;
+const y=parseInt(year),mm=parseInt(month),days=new Date(y,mm,0).getDate(),first=new Date(y,mm-1,1).getDay(),prevDays=new Date(y,mm-1,0).getDate(),a=[];
+for(let i=0;i<42;i++){const n=i-first+1;
+if(n<1){const pd=prevDays+n,pm=mm-1<1?12:mm-1,py=mm-1<1?y-1:y;a.push({day:''+pd,date:`${py}-${pad(pm)}-${pad(pd)}`,outside:true})}
+else if(n>days){const nd=n-days,nm=mm+1>12?1:mm+1,ny=mm+1>12?y+1:y;a.push({day:''+nd,date:`${ny}-${pad(nm)}-${pad(nd)}`,outside:true})}
+else a.push({day:''+n,date:`${y}-${pad(mm)}-${pad(n)}`,outside:false})}
+const s=selected||(mode==='single'?'':[]);
+const isSel=d=>mode==='single'?s===d:mode==='multiple'?s.includes(d):s.length===1?d===s[0]:s.length===2?d>=s[0]&&d<=s[1]:false;
+let last=5;for(let w=5;w>=0;w--)if(a.slice(w*7,w*7+7).some(c=>c.date&&!c.outside)){last=w;break}
+let h='';
+for(let w=0;w<=last;w++){h+='<div role="row" class="flex w-full mt-2">';
+for(let yy=0;yy<7;yy++){const c=a[w*7+yy]||{},o=c.outside,e=!c.date,t=c.date===today&&!o,x=!o&&isSel(c.date);
+let l='cal-cell h-8 min-w-8 flex-1 text-center text-sm rounded-md transition-colors flex items-center justify-center';
+if(!o&&!e&&!disabled)l+=' cursor-pointer';if(disabled&&!o&&!e)l+=' disabled';if(o)l+=' outside';if(t)l+=' today';if(x)l+=' selected';
+if(mode==='range'&&s.length===2&&!o){const[r0,r1]=s;if(c.date===r0&&r0!==r1)l+=' range-start';else if(c.date===r1&&r0!==r1)l+=' range-end';else if(c.date>r0&&c.date<r1){l+=' range-middle';if(yy===0)l+=' range-week-start';if(yy===6)l+=' range-week-end'}else if(r0===r1&&c.date===r0)l+=' range-single'}
+h+=`<div class="${l}" data-date="${o?'':c.date||''}" role="gridcell" aria-selected="${!!x}"${o?' aria-disabled="true"':''}>${c.day||''}</div>`}
+h+='</div>'}
+b.innerHTML=h}
+};
+})();
+"""
+
+RUNTIME_VERSION = hashlib.sha256(RUNTIME_JS.encode()).hexdigest()[:10]
+RUNTIME_PATH = f"/starui-runtime.{RUNTIME_VERSION}.js"
+
+
+async def _serve_runtime(request: Request) -> Response:
+    return Response(
+        RUNTIME_JS,
+        media_type="text/javascript",
+        headers={"Cache-Control": "public, max-age=31536000, immutable"},
+    )
+
+
+def register_runtime(app) -> None:
+    """Serve the runtime at its versioned path, ahead of any catch-all static route."""
+    if not any(getattr(r, "path", None) == RUNTIME_PATH for r in app.router.routes):
+        app.router.routes.insert(0, Route(RUNTIME_PATH, _serve_runtime, methods=["GET"]))
+
+
+def StarUIRuntime(inline: bool = False) -> FT:
+    """<head> script for the component runtime; must load before Datastar evaluates attributes."""
+    return Script(RUNTIME_JS) if inline else Script(src=RUNTIME_PATH)
+
+
+def setter(signal: Any) -> Expr:
+    """Arrow function assigning its argument to ``signal``, for runtime callbacks."""
+    return js(f"v=>{signal}=v")
+
+
+def _encode(value: Any) -> str:
+    if isinstance(value, Expr):
+        return str(value)
+    if isinstance(value, dict):
+        return "{" + ",".join(f"{k}:{_encode(v)}" for k, v in value.items() if v is not None) + "}"
+    return json.dumps(value)
+
+
+def runtime_call(name: str, *args: Any) -> Expr:
+    """``StarUI.<name>(...)`` expression; Datastar expressions pass through, Python values are JSON-encoded."""
+    return js(f"StarUI.{name}({','.join(_encode(a) for a in args)})")
+
+
+VIRTUAL_PAGE_SIZE = 100
+_VIRTUAL_MAX_LIMIT = 500
+_VIRTUAL_QUERY_CACHE = 32
+
+
+def VirtualRows(row: FT) -> FT:
+    """Spacer, recycled-row container and row prototype for a virtualized list."""
+    return Div(
+        Div(data_virtual_rows="", style="position:absolute;top:0;left:0;right:0;will-change:transform"),
+        Template(row, data_virtual_row=""),
+        data_virtual_spacer="",
+        style="position:relative",
+    )
+
+
+def virtual_list(
+    content_id: str,
+    url: str,
+    *,
+    sig: str,
+    select: Expr,
+    query: Any = "",
+    highlighted: Any = -1,
+    selected: Any = "",
+    row_height: int = 32,
+    overscan: int = 6,
+    highlight: Expr | None = None,
+    visible: Expr | None = None,
+    announce: Expr | None = None,
+) -> Expr:
+    """Effect that drives a virtualized list; re-runs whenever the query, highlight or selection signals change."""
+    config = {
+        "sig": sig,
+        "url": url,
+        "rowHeight": row_height,
+        "overscan": overscan,
+        "pageSize": VIRTUAL_PAGE_SIZE,
+        "select": select,
+        "highlight": highlight,
+        "visible": visible,
+        "announce": announce,
+    }
+    return js(
+        f"{runtime_call('virtualList', content_id, config)}?.update({_encode(query)},{_encode(highlighted)},{_encode(selected)})"
+    )
+
+
+class VirtualOptions:
+    """Server side of a virtualized Select/Combobox: filters and pages options as JSON.
+
+    countries = VirtualOptions((c.code, c.name) for c in COUNTRIES)
+
+    @rt("/options/countries")
+    def country_options(req: Request):
+        return countries.response(req)
+    """
+
+    def __init__(self, options: Iterable[str | tuple[str, str]]):
+        self.options: list[tuple[str, str]] = [(o, o) if isinstance(o, str) else (o[0], o[1]) for o in options]
+        # Same fields the client-side filter matches: value and label
+        self._keys = [f"{value}\x00{label}".lower() for value, label in self.options]
+        self._matches: OrderedDict[str, list[int]] = OrderedDict()
+        # Sync handlers run in Starlette's threadpool, so concurrent keystrokes share the cache
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.options)
+
+    def _filter(self, query: str) -> list[int] | None:
+        if not query:
+            return None
+        with self._lock:
+            if (hit := self._matches.get(query)) is not None:
+                self._matches.move_to_end(query)
+                return hit
+            # Refining a cached query only needs to rescan its matches
+            base = next((m for q, m in reversed(self._matches.items()) if q in query), range(len(self._keys)))
+        matches = [i for i in base if query in self._keys[i]]
+        with self._lock:
+            self._matches[query] = matches
+            if len(self._matches) > _VIRTUAL_QUERY_CACHE:
+                self._matches.popitem(last=False)
+        return matches
+
+    def page(self, query: str = "", offset: int = 0, limit: int = VIRTUAL_PAGE_SIZE) -> dict:
+        offset, limit = max(offset, 0), min(max(limit, 0), _VIRTUAL_MAX_LIMIT)
+        matches = self._filter(query.strip().lower())
+        if matches is None:
+            total, window = len(self.options), self.options[offset : offset + limit]
+        else:
+            total, window = len(matches), [self.options[i] for i in matches[offset : offset + limit]]
+        return {"total": total, "items": [{"value": v, "label": label} for v, label in window]}
+
+    def response(self, request: Request) -> JSONResponse:
+        params = request.query_params
+        try:
+            offset, limit = int(params.get("offset", 0)), int(params.get("limit", VIRTUAL_PAGE_SIZE))
+        except ValueError:
+            offset, limit = 0, VIRTUAL_PAGE_SIZE
+        return JSONResponse(self.page(params.get("q", ""), offset, limit))
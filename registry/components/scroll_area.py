@@ -1,8 +1,9 @@
 from typing import Literal
 
-from starhtml import FT, Div, Script, Style
+from starhtml import FT, Div, Script
 
-from .utils import cn, gen_id
+from .runtime import runtime_call
+from .utils import cn, component_style, gen_id
 
 __metadata__ = {"description": "Scrollable viewport with styled scrollbars"}
 
@@ -28,18 +29,6 @@ _OVERFLOW_CLASSES = {
     "both": "overflow-auto",
 }
 
-_AUTO_HIDE_SCRIPT = (
-    "(function(){const v=document.getElementById('%s');"
-    "if(!v)return;let h;const d=%d,"
-    "s=()=>{clearTimeout(h);v.setAttribute('data-scroll-area-hidden','false')},"
-    "x=()=>{clearTimeout(h);h=setTimeout(()=>v.setAttribute('data-scroll-area-hidden','true'),d)};"
-    "'mouseenter mousemove wheel touchstart touchmove pointerenter pointerdown focus'.split(' ').forEach(e=>v.addEventListener(e,s));"
-    "'mouseleave pointerleave blur'.split(' ').forEach(e=>v.addEventListener(e,x));"
-    "v.addEventListener('scroll',()=>{s();x()});"
-    "v.addEventListener('keydown',e=>{if(['ArrowUp','ArrowDown','ArrowLeft','ArrowRight','PageUp','PageDown','Home','End'].includes(e.key))s()});"
-    "x()})()"
-)
-
 
 def ScrollArea(
     *children,
@@ -54,7 +43,7 @@ def ScrollArea(
     viewport_id = f"{gen_id('scroll')}_viewport"
 
     return Div(
-        Style(_SCROLL_AREA_BASE_STYLES),
+        component_style(_SCROLL_AREA_BASE_STYLES),
         Div(
             *children,
             data_slot="scroll-area-viewport",
@@ -66,7 +55,7 @@ def ScrollArea(
             cls=cn("size-full rounded-[inherit]", _OVERFLOW_CLASSES[orientation]),
         ),
         Div(data_slot="scroll-area-corner", data_dir=dir) if orientation == "both" else None,
-        Script(_AUTO_HIDE_SCRIPT % (viewport_id, scroll_hide_delay)) if auto_hide else None,
+        Script(str(runtime_call("autoHide", viewport_id, scroll_hide_delay))) if auto_hide else None,
         data_slot="scroll-area",
         cls=cn("relative", cls),
         **kwargs,
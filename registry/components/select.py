@@ -1,10 +1,11 @@
-from starhtml import FT, Div, Icon, Signal, Span, Style
+from starhtml import FT, Div, Icon, Signal, Span, js
 from starhtml import Button as HTMLButton
 from starhtml import Label as HTMLLabel
 from starhtml import P as HTMLP
 from starhtml.datastar import evt
 
-from .utils import cn, gen_id, inject_context, merge_actions
+from .runtime import VirtualRows, virtual_list
+from .utils import cn, component_style, gen_id, inject_context, merge_actions
 
 __metadata__ = {
     "description": "Dropdown selection",
@@ -41,7 +42,7 @@ def Select(
     }
 
     return Div(
-        Style(_POPOVER_ANIMATE),
+        component_style(_POPOVER_ANIMATE),
         selected,
         selected_label,
         open_state,
@@ -138,6 +139,9 @@ def SelectContent(
     align: str = "start",
     side_offset: int = 4,
     container: str = "none",
+    options_url: str | None = None,
+    row_height: int = 32,
+    overscan: int = 6,
     cls: str = "",
     **kwargs,
 ) -> FT:
@@ -157,11 +161,28 @@ def SelectContent(
 
         context = dict(sig=sig, open_state=open_state, **ctx)
 
+        virtual = {}
+        if options_url:
+            selected, selected_label = ctx["selected"], ctx["selected_label"]
+            virtual["data_effect"] = virtual_list(
+                content_ref._id,
+                options_url,
+                sig=sig,
+                select=js(
+                    f"(v,l)=>{{{selected}=v;{selected_label}=l;document.getElementById('{content_ref._id}').hidePopover()}}"
+                ),
+                selected=selected,
+                row_height=row_height,
+                overscan=overscan,
+            )
+
         return Div(
             Div(
                 *[inject_context(child, **context) for child in children],
+                VirtualRows(_virtual_row(row_height)) if options_url else None,
                 cls="p-1",
             ),
+            **virtual,
             data_ref=content_ref,
             data_on_toggle=open_state.set(evt.newState == "open"),
             data_style_min_width=trigger_ref.if_(trigger_ref.offsetWidth + "px", "8rem"),
@@ -234,6 +255,26 @@ def SelectItem(
     return _
 
 
+def _virtual_row(row_height: int) -> FT:
+    return Div(
+        Span(data_virtual_label="", cls="truncate"),
+        Span(
+            Icon("lucide:check", cls="size-4"),
+            style="opacity: 0",
+            data_virtual_indicator="",
+            cls="absolute right-2 flex size-3.5 items-center justify-center",
+            data_slot="select-item-indicator",
+        ),
+        role="option",
+        style=f"height:{row_height}px",
+        cls=(
+            "relative flex w-full cursor-default items-center gap-2 rounded-sm py-1.5 pr-8 pl-2 text-sm outline-hidden select-none "
+            "hover:bg-accent hover:text-accent-foreground"
+        ),
+        data_slot="select-item",
+    )
+
+
 def SelectGroup(
     *children,
     label: str | None = None,
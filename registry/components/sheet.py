@@ -1,11 +1,11 @@
 from typing import Literal
 
-from starhtml import FT, Div, Icon, P, Signal, Span, Style
+from starhtml import FT, Div, Icon, P, Signal, Span
 from starhtml import H2 as HTMLH2
 from starhtml import Dialog as HTMLDialog
 from starhtml.datastar import document, evt, seq
 
-from .utils import cn, gen_id, inject_context, merge_actions
+from .utils import cn, component_style, gen_id, inject_context, merge_actions
 
 __metadata__ = {"description": "Slide-out panel"}
 
@@ -92,7 +92,7 @@ def Sheet(
     show_action = dialog_ref.showModal() if modal else dialog_ref.show()
 
     return Div(
-        Style(_SHEET_STYLES),
+        component_style(_SHEET_STYLES),
         sheet_open,
         trigger(**ctx) if trigger else None,
         HTMLDialog(
@@ -1,21 +1,35 @@
-from typing import Any
+import json
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from html import escape
+from itertools import islice
+from operator import itemgetter
+from typing import Any, NamedTuple
 
 from starhtml import (
     FT,
+    Button,
     Caption,
     Div,
+    Icon,
+    NotStr,
+    Signal,
     Tbody,
     Td,
     Tfoot,
     Th,
     Thead,
     Tr,
+    elements,
+    get,
+    js,
+    signals,
+    to_xml,
 )
 from starhtml import (
     Table as HTMLTable,
 )
 
-from .utils import cn
+from .utils import cn, gen_id
 
 __metadata__ = {"description": "Data display in rows and columns"}
 
@@ -77,6 +91,11 @@ def TableFooter(
     )
 
 
+_ROW_CLS = "border-b transition-colors hover:bg-muted/50 data-[state=selected]:bg-muted"
+_HEAD_CLS = "text-foreground h-10 px-2 text-left align-middle font-medium whitespace-nowrap [&:has([role=checkbox])]:pr-0 [&>[role=checkbox]]:translate-y-[2px]"
+_CELL_CLS = "p-2 align-middle whitespace-nowrap [&:has([role=checkbox])]:pr-0 [&>[role=checkbox]]:translate-y-[2px]"
+
+
 def TableRow(
     *children: Any,
     selected: bool = False,
@@ -87,10 +106,7 @@ def TableRow(
         *children,
         data_slot="table-row",
         data_state="selected" if selected else None,
-        cls=cn(
-            "border-b transition-colors hover:bg-muted/50 data-[state=selected]:bg-muted",
-            cls,
-        ),
+        cls=cn(_ROW_CLS, cls),
         **kwargs,
     )
 
@@ -105,10 +121,7 @@ def TableHead(
         *children,
         scope=scope,
         data_slot="table-head",
-        cls=cn(
-            "text-foreground h-10 px-2 text-left align-middle font-medium whitespace-nowrap [&:has([role=checkbox])]:pr-0 [&>[role=checkbox]]:translate-y-[2px]",
-            cls,
-        ),
+        cls=cn(_HEAD_CLS, cls),
         **kwargs,
     )
 
@@ -121,10 +134,7 @@ def TableCell(
     return Td(
         *children,
         data_slot="table-cell",
-        cls=cn(
-            "p-2 align-middle whitespace-nowrap [&:has([role=checkbox])]:pr-0 [&>[role=checkbox]]:translate-y-[2px]",
-            cls,
-        ),
+        cls=cn(_CELL_CLS, cls),
         **kwargs,
     )
 
@@ -140,3 +150,276 @@ def TableCaption(
         cls=cn("mt-4 text-sm text-muted-foreground", cls),
         **kwargs,
     )
+
+
+# ── DataTable ─────────────────────────────────────────────────────────────
+
+_FETCH_EVENT = "datatable-fetch"
+
+
+class DataColumn(NamedTuple):
+    key: str
+    header: str
+    sortable: bool = False
+    cls: str = ""
+    render: Callable[[Any], Any] | None = None
+
+
+class DataTableParams(NamedTuple):
+    """Window and sort state sent by a DataTable with each request."""
+
+    offset: int = 0
+    limit: int = 50
+    sort: str | None = None
+    desc: bool = False
+    row_height: int = 40
+
+    @classmethod
+    def from_request(cls, signal: str | Signal, request: Any, columns: Sequence[DataColumn | str]) -> "DataTableParams":
+        """Read the table's signals from a Datastar request; unknown sort keys are dropped."""
+        sig = getattr(signal, "_id", signal)
+        try:
+            data = json.loads(request.query_params.get("datastar") or "{}")
+        except ValueError:
+            data = {}
+
+        def _int(name: str, default: int) -> int:
+            try:
+                return max(int(data.get(f"{sig}_{name}", default)), 0)
+            except (TypeError, ValueError):
+                return default
+
+        sort = data.get(f"{sig}_sort")
+        sortable = {c.key for c in _columns(columns) if c.sortable}
+        return cls(
+            offset=_int("offset", 0),
+            limit=min(_int("limit", 50), 1000) or 50,
+            sort=sort if sort in sortable else None,
+            desc=bool(data.get(f"{sig}_desc")),
+            row_height=_int("row_height", 40) or 40,
+        )
+
+    def apply(self, rows: Iterable[Any]) -> Iterator[Any]:
+        """Sort and slice in-memory rows; unsorted generators are sliced lazily without materializing."""
+        if self.sort:
+            rows = sorted(rows, key=_cell_getter(self.sort), reverse=self.desc)
+        return islice(rows, self.offset, self.offset + self.limit)
+
+
+def _cell_getter(key: str) -> Callable[[Any], Any]:
+    item = itemgetter(key)
+    return lambda row: item(row) if isinstance(row, Mapping) else getattr(row, key)
+
+
+def _columns(columns: Sequence[DataColumn | str]) -> list[DataColumn]:
+    return [DataColumn(c, c) if isinstance(c, str) else c for c in columns]
+
+
+def _cell_html(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return escape(value, quote=False)
+    if isinstance(value, FT | tuple | list) or hasattr(value, "__ft__"):
+        return to_xml(value, indent=False)
+    return escape(str(value), quote=False)
+
+
+def _rows_html(
+    rows: Iterable[Any],
+    columns: Sequence[DataColumn],
+    *,
+    row_cls: str = "",
+    row_attrs: str = "",
+    start: int | None = None,
+) -> str:
+    """Render <tr> markup directly; class strings are merged and escaped once per column, not per cell."""
+    cells = [
+        (_cell_getter(c.key), c.render, f'<td data-slot="table-cell" class="{escape(cn(_CELL_CLS, c.cls))}">')
+        for c in columns
+    ]
+    tr_open = f'<tr data-slot="table-row" class="{escape(cn(_ROW_CLS, row_cls))}"{row_attrs}'
+    parts: list[str] = []
+    append = parts.append
+    for i, row in enumerate(rows):
+        append(tr_open)
+        # aria-rowindex is 1-based and counts the header row
+        append(f' aria-rowindex="{start + i + 2}">' if start is not None else ">")
+        for get_, render, td_open in cells:
+            value = get_(row)
+            append(td_open)
+            append(_cell_html(render(value) if render else value))
+            append("</td>")
+        append("</tr>")
+    return "".join(parts)
+
+
+def table_body_from_rows(
+    rows: Iterable[Any] | Mapping[str, Sequence[Any]],
+    columns: Sequence[DataColumn | str],
+    *,
+    cls: str = "",
+    row_cls: str = "",
+    **kwargs: Any,
+) -> FT:
+    """TableBody markup from list-of-dicts/objects or columnar ``{key: values}`` data, without per-cell FT nodes.
+
+    Output matches composing TableRow/TableCell per cell, with the same escaping.
+    """
+    if isinstance(rows, Mapping):
+        keys = list(rows)
+        rows = (dict(zip(keys, values, strict=True)) for values in zip(*rows.values(), strict=True))
+    return Tbody(
+        NotStr(_rows_html(rows, _columns(columns), row_cls=row_cls)),
+        data_slot="table-body",
+        cls=cn("[&_tr:last-child]:border-0", cls),
+        **kwargs,
+    )
+
+
+def DataTable(
+    columns: Sequence[DataColumn | str],
+    *,
+    src: str,
+    signal: str | Signal = "",
+    total: int = 0,
+    sort: str | None = None,
+    desc: bool = False,
+    height: int = 480,
+    row_height: int = 40,
+    overscan: int = 10,
+    cls: str = "",
+    **kwargs: Any,
+) -> FT:
+    """Fixed-height table whose rows are fetched and streamed from ``src`` one window at a time.
+
+    The ``src`` route yields ``data_table_rows(...)``; only the visible window plus overscan is in the DOM.
+    """
+    sig = getattr(signal, "_id", signal) or gen_id("datatable")
+    columns = _columns(columns)
+    sort_sig = Signal(f"{sig}_sort", sort or "")
+    desc_sig = Signal(f"{sig}_desc", desc)
+    offset = Signal(f"{sig}_offset", 0)
+    limit = Signal(f"{sig}_limit", -(-height // row_height) + 2 * overscan)
+    height_sig = Signal(f"{sig}_row_height", row_height)
+    total_sig = Signal(f"{sig}_total", total)
+    viewport_id = f"{sig}_viewport"
+
+    fetch = str(get(src))
+    on_scroll = js(
+        f"const o=Math.max(0,Math.floor(evt.currentTarget.scrollTop/{row_height})-{overscan});"
+        f"if(Math.abs(o-{offset})>={overscan}||(o===0&&{offset}!==0)){{{offset}=o;{fetch}}}"
+    )
+
+    def _head(col: DataColumn) -> FT:
+        if not col.sortable:
+            return TableHead(col.header, cls=col.cls)
+        active = sort_sig.eq(col.key)
+        return TableHead(
+            Button(
+                col.header,
+                Icon("lucide:arrow-up-down", cls="size-3.5 opacity-50"),
+                type="button",
+                data_on_click=js(
+                    f"if({sort_sig}==='{col.key}'){{{desc_sig}=!{desc_sig}}}else{{{sort_sig}='{col.key}';{desc_sig}=false}};"
+                    f"{offset}=0;const v=document.getElementById('{viewport_id}');v.scrollTop=0;"
+                    f"v.dispatchEvent(new CustomEvent('{_FETCH_EVENT}'))"
+                ),
+                cls="-ml-2 inline-flex h-8 items-center gap-1.5 rounded-md px-2 hover:bg-accent hover:text-accent-foreground",
+            ),
+            aria_sort="none",
+            data_attr_aria_sort=active.if_(desc_sig.if_("descending", "ascending"), "none"),
+            cls=col.cls,
+        )
+
+    return Div(
+        sort_sig,
+        desc_sig,
+        offset,
+        limit,
+        height_sig,
+        total_sig,
+        HTMLTable(
+            TableHeader(
+                Tr(*[_head(c) for c in columns], data_slot="table-row", cls=_ROW_CLS),
+                cls="sticky top-0 z-10 bg-background",
+            ),
+            Tbody(
+                Tr(id=f"{sig}_top", style="height:0px", aria_hidden="true"),
+                Tr(id=f"{sig}_bottom", style=f"height:{total * row_height}px", aria_hidden="true"),
+                id=f"{sig}_body",
+                data_slot="table-body",
+                cls="[&_tr:last-child]:border-0",
+            ),
+            data_slot="table",
+            aria_rowcount=str(total + 1) if total else None,
+            data_attr_aria_rowcount=total_sig + 1,
+            cls="w-full caption-bottom text-sm",
+        ),
+        id=viewport_id,
+        data_init=fetch,
+        # Every fetch originates here, so Datastar aborts a superseded request automatically
+        data_on_scroll=(on_scroll, {"throttle": "100ms"}),
+        data_on_datatable_fetch=fetch,
+        data_slot="data-table",
+        style=f"height:{height}px",
+        cls=cn("relative w-full overflow-auto rounded-md border", cls),
+        **kwargs,
+    )
+
+
+def data_table_rows(
+    signal: str | Signal,
+    columns: Sequence[DataColumn | str],
+    rows: Iterable[Any],
+    *,
+    params: DataTableParams,
+    total: int | None = None,
+    chunk_size: int = 50,
+) -> Iterator[tuple]:
+    """SSE items that stream one window of ``rows`` into a DataTable in chunks.
+
+    ``rows`` may be a generator (e.g. a server-side cursor already sorted and offset by ``params``);
+    at most ``chunk_size`` rows are materialized as elements at a time.
+    """
+    sig = getattr(signal, "_id", signal)
+    rh = params.row_height
+    body = f"#{sig}_body"
+    columns = _columns(columns)
+    row_attrs = f' style="height:{rh}px"'
+
+    remaining = params.limit if total is None else max(min(params.limit, total - params.offset), 0)
+    yield elements(
+        (
+            Tr(id=f"{sig}_top", style=f"height:{params.offset * rh}px", aria_hidden="true"),
+            Tr(
+                id=f"{sig}_bottom",
+                style=f"height:{max((total or 0) - params.offset - remaining, 0) * rh}px",
+                aria_hidden="true",
+            ),
+        ),
+        selector=body,
+        mode="inner",
+    )
+
+    count = 0
+    it = iter(rows)
+    while chunk := list(islice(it, min(chunk_size, params.limit - count))):
+        yield elements(
+            NotStr(_rows_html(chunk, columns, row_attrs=row_attrs, start=params.offset + count)),
+            selector=f"#{sig}_bottom",
+            mode="before",
+        )
+        count += len(chunk)
+
+    final_total = total if total is not None else params.offset + count
+    if count != remaining or total is None:
+        yield elements(
+            Tr(
+                id=f"{sig}_bottom",
+                style=f"height:{max(final_total - params.offset - count, 0) * rh}px",
+                aria_hidden="true",
+            ),
+            selector=f"#{sig}_bottom",
+        )
+    yield signals(**{f"{sig}_total": final_total})
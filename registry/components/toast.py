@@ -34,6 +34,7 @@ toast_variants = cva(
         },
         "defaultVariants": {"variant": "default"},
     },
+    precompile=True,
 )
 
 
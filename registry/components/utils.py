@@ -1,8 +1,15 @@
-from collections.abc import Callable
+import os
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from itertools import count, product
+from math import prod
 from typing import Any
 from uuid import uuid4
 
 from fastcore.xml import FT
+from starhtml import Style
 
 try:
     from starmerge import merge
@@ -26,6 +33,29 @@ DEFAULT_THEME = "light"
 ALT_THEME = "dark"
 
 
+CN_CACHE_SIZE = 4096
+
+
+def _merge(classes: tuple[str, ...]) -> str:
+    return merge(*classes)
+
+
+_cached_merge = lru_cache(maxsize=CN_CACHE_SIZE)(_merge)
+
+
+def configure_cn_cache(maxsize: int = CN_CACHE_SIZE) -> None:
+    """Resize the cn() merge cache. ``maxsize=0`` disables caching."""
+    global _cached_merge
+    if maxsize < 0:
+        raise ValueError("maxsize must be >= 0")
+    _cached_merge = lru_cache(maxsize=maxsize)(_merge)
+
+
+def cn_cache_info():
+    """Hit/miss counters for the cn() merge cache."""
+    return _cached_merge.cache_info()
+
+
 def cn(*classes: Any) -> str:
     """Merge class names and truthy class mappings."""
     processed: list[str] = []
@@ -45,21 +75,23 @@ def cn(*classes: Any) -> str:
         else:
             processed.append(str(cls))
 
-    return merge(*processed) if processed else ""
+    return _cached_merge(tuple(processed)) if processed else ""
+
+
+MAX_PRECOMPILED_VARIANTS = 4096
 
 
-def cva(base: str = "", config: dict[str, Any] | None = None) -> Callable[..., str]:
+def cva(base: str = "", config: dict[str, Any] | None = None, *, precompile: bool = False) -> Callable[..., str]:
+    """Build a variant class resolver; ``precompile=True`` merges every combination up front."""
     config = config or {}
 
     variants = config.get("variants", {})
     compound_variants = config.get("compoundVariants", [])
     default_variants = config.get("defaultVariants", {})
 
-    def variant_function(**props: Any) -> str:
+    def resolve(final_props: dict[str, Any]) -> str:
         classes = [base] if base else []
 
-        final_props = {**default_variants, **props}
-
         for variant_key, variant_values in variants.items():
             prop_value = final_props.get(variant_key)
             if prop_value and prop_value in variant_values:
@@ -72,13 +104,169 @@ def cva(base: str = "", config: dict[str, Any] | None = None) -> Callable[..., s
 
         return cn(*classes)
 
-    return variant_function
+    if not precompile:
+
+        def variant_function(cls: Any = None, **props: Any) -> str:
+            resolved = resolve({**default_variants, **props})
+            return cn(resolved, cls) if cls else resolved
+
+        return variant_function
+
+    keys = tuple(variants)
+    if prod(len(variants[k]) for k in keys) > MAX_PRECOMPILED_VARIANTS:
+        raise ValueError(f"cva: more than {MAX_PRECOMPILED_VARIANTS} variant combinations to precompile")
+
+    table = {
+        combo: resolve({**default_variants, **dict(zip(keys, combo, strict=True))})
+        for combo in product(*(variants[k] for k in keys))
+    }
+    variant_keys = frozenset(keys)
+
+    def precompiled_function(cls: Any = None, **props: Any) -> str:
+        resolved = None
+        if variant_keys.issuperset(props):
+            resolved = table.get(tuple(props.get(k, default_variants.get(k)) for k in keys))
+        if resolved is None:
+            resolved = resolve({**default_variants, **props})
+        return cn(resolved, cls) if cls else resolved
+
+    return precompiled_function
+
+
+_BASE36 = "0123456789abcdefghijklmnopqrstuvwxyz"
+try:
+    # Share the scope with the starui package so either copy of the middleware drives component IDs
+    from starui.utils import id_scope
+
+    _id_counter = id_scope()
+except ImportError:
+    _id_counter: ContextVar[tuple[str, Iterator[int]] | None] = ContextVar("starui_id_counter", default=None)
+
+
+def _base36(n: int) -> str:
+    digits = ""
+    while True:
+        n, r = divmod(n, 36)
+        digits = _BASE36[r] + digits
+        if not n:
+            return digits
+
+
+@contextmanager
+def deterministic_ids(namespace: str = "") -> Iterator[None]:
+    """Make gen_id() sequential within this scope, prefixed by ``namespace`` if given."""
+    token = _id_counter.set((namespace, count()))
+    try:
+        yield
+    finally:
+        _id_counter.reset(token)
+
+
+class DeterministicIdMiddleware:
+    """ASGI middleware scoping deterministic_ids() to each HTTP request; Datastar requests get a namespace."""
+
+    def __init__(self, app: Any) -> None:
+        self.app = app
+
+    async def __call__(self, scope: dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        is_datastar = (b"datastar-request", b"true") in scope.get("headers", [])
+        with deterministic_ids(uuid4().hex[:6] if is_datastar else ""):
+            await self.app(scope, receive, send)
 
 
 def gen_id(prefix: str) -> str:
+    if (scope := _id_counter.get()) is not None:
+        namespace, counter = scope
+        n = _base36(next(counter))
+        return f"{prefix}_{namespace}_{n}" if namespace else f"{prefix}_{n}"
     return f"{prefix}_{uuid4().hex[:8]}"
 
 
+class StyleCollector:
+    """Component CSS collected during a render, deduplicated."""
+
+    def __init__(self, inline_first: bool = False) -> None:
+        self._css: dict[str, None] = {}
+        self.inline_first = inline_first
+
+    def add(self, css: str) -> bool:
+        """Register ``css``; False if it was already collected."""
+        css = css.strip()
+        if css in self._css:
+            return False
+        self._css[css] = None
+        return True
+
+    def __len__(self) -> int:
+        return len(self._css)
+
+    @property
+    def css(self) -> str:
+        return "\n".join(self._css)
+
+    def style(self) -> FT | None:
+        return Style(self.css) if self._css else None
+
+
+try:
+    from starui.utils import style_scope
+
+    _style_collector = style_scope()
+except ImportError:
+    _style_collector: ContextVar["StyleCollector | None"] = ContextVar("starui_style_collector", default=None)
+HOIST_STYLES_ENV = "STARUI_HOIST_STYLES"
+try:
+    from starui.utils import style_settings
+
+    _style_settings = style_settings()
+except ImportError:
+    _style_settings = {"hoisted": os.environ.get(HOIST_STYLES_ENV) == "1"}
+
+
+@contextmanager
+def collect_styles(inline_first: bool = False) -> Iterator[StyleCollector]:
+    """Collect component_style() CSS instead of emitting it inline; ``inline_first`` keeps first uses inline."""
+    collector = StyleCollector(inline_first)
+    token = _style_collector.set(collector)
+    try:
+        yield collector
+    finally:
+        _style_collector.reset(token)
+
+
+def hoist_component_styles(enabled: bool = True) -> None:
+    """Skip component CSS at runtime; `star build --hoist-styles` bundles it instead."""
+    _style_settings["hoisted"] = enabled
+
+
+def component_style(css: str) -> FT | None:
+    """Inline <style>, or register with the active collect_styles() scope."""
+    if _style_settings["hoisted"]:
+        return None
+    if (collector := _style_collector.get()) is not None:
+        is_new = collector.add(css)
+        if not (is_new and collector.inline_first):
+            return None
+    return Style(css)
+
+
+class StyleCollectorMiddleware:
+    """ASGI middleware emitting each component stylesheet once per response, where it is first used."""
+
+    def __init__(self, app: Any) -> None:
+        self.app = app
+
+    async def __call__(self, scope: dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        with collect_styles(inline_first=True):
+            await self.app(scope, receive, send)
+
+
 def _flatten(*items: Any) -> list:
     result: list = []
     for item in items:
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""Benchmark table_body_from_rows against per-cell TableRow/TableCell composition.
+
+Usage: python scripts/bench_table.py [--rows 500] [--cols 10] [--repeat 20]
+"""
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "registry"))
+
+from components.table import DataColumn, TableBody, TableCell, TableRow, table_body_from_rows  # noqa: E402
+from starhtml import to_xml  # noqa: E402
+
+
+def make_rows(n_rows: int, n_cols: int) -> list[dict]:
+    return [{f"c{j}": f"r{i}c{j}" for j in range(n_cols)} for i in range(n_rows)]
+
+
+def composed(rows: list[dict], keys: list[str]) -> str:
+    return to_xml(TableBody(*[TableRow(*[TableCell(row[k]) for k in keys]) for row in rows]))
+
+
+def bulk(rows: list[dict], columns: list[DataColumn]) -> str:
+    return to_xml(table_body_from_rows(rows, columns))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=500)
+    parser.add_argument("--cols", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows, args.cols)
+    keys = [f"c{j}" for j in range(args.cols)]
+    columns = [DataColumn(k, k) for k in keys]
+
+    per_cell = min(timeit.repeat(lambda: composed(rows, keys), number=1, repeat=args.repeat))
+    from_rows = min(timeit.repeat(lambda: bulk(rows, columns), number=1, repeat=args.repeat))
+
+    print(f"{args.rows}x{args.cols} table, best of {args.repeat}")
+    print(f"  TableRow/TableCell   {per_cell * 1000:8.2f} ms")
+    print(f"  table_body_from_rows {from_rows * 1000:8.2f} ms  ({per_cell / from_rows:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,12 +4,21 @@ from importlib.metadata import version
 
 __version__ = version("starui")
 
+from .assets import CriticalStyles, asset_url, critical_css, register_assets
 from .utils import (
     ALT_THEME,
     DEFAULT_THEME,
+    DeterministicIdMiddleware,
+    StyleCollectorMiddleware,
     cn,
+    cn_cache_info,
+    collect_styles,
+    component_style,
+    configure_cn_cache,
     cva,
+    deterministic_ids,
     gen_id,
+    hoist_component_styles,
     inject_context,
     with_signals,
 )
@@ -17,10 +26,22 @@ from .utils import (
 __all__ = [
     "__version__",
     "cn",
+    "cn_cache_info",
+    "configure_cn_cache",
     "cva",
     "gen_id",
+    "deterministic_ids",
+    "DeterministicIdMiddleware",
+    "collect_styles",
+    "component_style",
+    "StyleCollectorMiddleware",
+    "hoist_component_styles",
     "inject_context",
     "with_signals",
     "DEFAULT_THEME",
     "ALT_THEME",
+    "asset_url",
+    "register_assets",
+    "critical_css",
+    "CriticalStyles",
 ]
@@ -0,0 +1,131 @@
+"""Resolve and serve stylesheets written by ``star build --fingerprint`` and ``--critical``."""
+
+import json
+import mimetypes
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from starhtml import FT, Link, Noscript, Style
+from starlette.requests import Request
+from starlette.responses import FileResponse, Response
+from starlette.routing import Route
+
+from .critical import route_slug
+from .css import ASSET_MANIFEST, critical_dir
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+
+# Preferred first; the file must exist as <name><suffix> next to the original
+_ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+_files: dict[Path, tuple[int, Any]] = {}
+
+
+def _read_cached[T](path: Path, parse: Callable[[str], T], default: T) -> T:
+    """Parsed file contents, re-read only when its mtime changes (rebuilds while the app runs)."""
+    try:
+        mtime = path.stat().st_mtime_ns
+    except OSError:
+        return default
+    cached = _files.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    try:
+        value = parse(path.read_text())
+    except (OSError, ValueError):
+        value = default
+    _files[path] = (mtime, value)
+    return value
+
+
+def _parse_manifest(text: str) -> dict[str, str]:
+    data = json.loads(text)
+    return {k: v for k, v in data.items() if isinstance(v, str)} if isinstance(data, dict) else {}
+
+
+def load_manifest(path: Path) -> dict[str, str]:
+    """Original-to-fingerprinted name mapping from an ``assets.json``."""
+    return _read_cached(path, _parse_manifest, {})
+
+
+def asset_url(url: str, manifest: str | Path | None = None) -> str:
+    """Current fingerprinted URL for a built asset, or ``url`` if it has not been fingerprinted.
+
+    ``asset_url("/static/css/starui.css")`` reads ``static/css/assets.json``
+    relative to the working directory, matching StarHTML's static file root.
+    """
+    directory, _, name = url.rpartition("/")
+    path = Path(manifest) if manifest else Path(url.lstrip("/")).parent / ASSET_MANIFEST
+    hashed = load_manifest(path).get(name)
+    return f"{directory}/{hashed}" if hashed else url
+
+
+def _accepted_encodings(header: str) -> set[str]:
+    accepted = set()
+    for part in header.split(","):
+        coding, _, params = part.partition(";")
+        try:
+            weight = float(params.strip().removeprefix("q=") or 1)
+        except ValueError:
+            weight = 1.0
+        if weight > 0:
+            accepted.add(coding.strip().lower())
+    return accepted
+
+
+def register_assets(app, prefix: str = "/static/css", directory: str | Path = "static/css") -> None:
+    """Serve fingerprinted files under ``prefix`` with immutable caching and precompressed variants.
+
+    Files not listed in the manifest are served as-is without long-lived caching,
+    so the route can sit ahead of StarHTML's catch-all static route.
+    """
+    root = Path(directory)
+    path = f"{prefix.rstrip('/')}/{{name}}"
+
+    async def serve(request: Request) -> Response:
+        name = request.path_params["name"]
+        file = root / name
+        if not file.is_file():
+            return Response("Not Found", status_code=404)
+        if name not in load_manifest(root / ASSET_MANIFEST).values():
+            return FileResponse(file)
+
+        headers = {"Cache-Control": IMMUTABLE, "Vary": "Accept-Encoding"}
+        media_type = mimetypes.guess_type(name)[0]
+        accepted = _accepted_encodings(request.headers.get("accept-encoding", ""))
+        for encoding, suffix in _ENCODINGS:
+            variant = file.with_name(name + suffix)
+            if encoding in accepted and variant.is_file():
+                headers["Content-Encoding"] = encoding
+                return FileResponse(variant, media_type=media_type, headers=headers)
+        return FileResponse(file, media_type=media_type, headers=headers)
+
+    if not any(getattr(r, "path", None) == path for r in app.router.routes):
+        app.router.routes.insert(0, Route(path, serve, methods=["GET", "HEAD"]))
+
+
+def critical_css(route: str, directory: str | Path = "static/css", target: str = "starui") -> str:
+    """Critical stylesheet built for ``route`` with ``<directory>/<target>.css``, or an empty string if there is none."""
+    path = critical_dir(Path(directory) / f"{target}.css") / f"{route_slug(route)}.css"
+    return _read_cached(path, str, "")
+
+
+def CriticalStyles(
+    route: str, href: str = "/static/css/starui.css", directory: str | Path = "static/css", target: str | None = None
+) -> tuple[FT, ...]:
+    """<head> tags for ``route``: its critical CSS inline, then the full stylesheet without blocking render.
+
+    ``target`` is the stem of the built stylesheet and defaults to the one ``href``
+    names, so ``CriticalStyles("/", "/static/css/admin.css")`` reads ``critical/admin/``.
+    Without a critical build for the route this is a plain stylesheet link.
+    """
+    target = target or Path(href).stem
+    href = asset_url(href)
+    if not (css := critical_css(route, directory, target)):
+        return (Link(rel="stylesheet", href=href),)
+    return (
+        Style(css),
+        Link(rel="preload", href=href, onload="this.onload=null;this.rel='stylesheet'", **{"as": "style"}),
+        Noscript(Link(rel="stylesheet", href=href)),
+    )
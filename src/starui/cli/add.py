@@ -4,8 +4,9 @@ import typer
 
 from ..config import ProjectConfig, get_project_config
 from ..registry.client import RegistryClient
-from ..registry.manifest import Manifest
+from ..registry.manifest import ItemKind, Manifest
 from .utils import (
+    MSG_RUNTIME_SETUP,
     confirm,
     console,
     error,
@@ -164,6 +165,7 @@ def add_command(
         comp_deps: dict[str, str] = {}
         blocks_to_install: dict[str, tuple[str, str]] = {}
 
+        found: list[tuple[str, ItemKind, dict]] = []
         for name in components:
             normalized = name.replace("-", "_")
             if verbose:
@@ -174,7 +176,14 @@ def add_command(
             except FileNotFoundError:
                 error(f"'{name}' not found in registry")
                 raise typer.Exit(1) from None
+            found.append((normalized, kind, entry))
 
+        # Everything requested plus dependencies in one concurrent round of fetches
+        client.prefetch(
+            [(normalized if kind == "component" else entry["name"], kind) for normalized, kind, entry in found]
+        )
+
+        for normalized, kind, entry in found:
             if kind == "component":
                 deps, item_source = client.get_with_dependencies(normalized)
                 comp_deps.update(deps)
@@ -260,6 +269,9 @@ def add_command(
         if verbose:
             info(f"Location: {comp_dir}")
 
+        if "runtime" in comp_deps:
+            info(MSG_RUNTIME_SETUP)
+
         if first_name := next(iter(comp_deps or requested), None):
             class_name = first_name.title().replace("_", "")
             import_path = str(config.component_dir).replace("/", ".").replace("\\", ".")
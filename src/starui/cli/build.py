@@ -1,13 +1,30 @@
+import json
+import time
+from enum import StrEnum
 from pathlib import Path
 
 import typer
 from rich.table import Table
 
-from ..config import get_project_config
-from ..css import BuildMode, CSSBuilder
+from ..config import ProjectConfig, get_project_config
+from ..critical import build_critical_css, load_app, render_routes
+from ..css import (
+    BUILD_REPORT_FILE,
+    BuildMode,
+    BuildResult,
+    CSSBuilder,
+    build_report,
+    build_targets,
+    critical_dir,
+    fingerprint_css,
+)
 from .utils import console, error, info, success
 
 
+class ReportFormat(StrEnum):
+    JSON = "json"
+
+
 def format_size(size: int) -> str:
     if size < 1024:
         return f"{size} B"
@@ -16,15 +33,179 @@ def format_size(size: int) -> str:
     return f"{size / (1024 * 1024):.1f} MB"
 
 
+def _write_report(path: Path, results: dict[str, BuildResult], mode: BuildMode, config: ProjectConfig) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(build_report(results, mode, config.project_root), indent=2, sort_keys=True) + "\n")
+    info(f"Report written to {path}")
+
+
+def _build_critical(
+    builder: CSSBuilder, config: ProjectConfig, app_file: str | None, routes: list[str] | None, mode: BuildMode
+) -> None:
+    app = load_app(Path(app_file) if app_file else config.app_file_absolute)
+    with console.status("[bold green]Rendering routes..."):
+        pages = render_routes(app, routes or config.critical_routes)
+    with console.status("[bold green]Building critical CSS..."):
+        results = build_critical_css(builder, pages, critical_dir(config.css_output_absolute), mode)
+
+    table = Table(show_header=False)
+    table.add_column("Route", style="cyan")
+    table.add_column("Critical CSS", style="green")
+    for route, result in results.items():
+        if result.success:
+            size = format_size(result.css_size_bytes) if result.css_size_bytes is not None else ""
+            table.add_row(route, f"{result.css_path} {size}".strip())
+    console.print(table)
+
+    if failed := [route for route, result in results.items() if not result.success]:
+        for route in failed:
+            error(f"Critical CSS for {route} failed: {results[route].error_message}")
+        raise typer.Exit(1)
+
+
+def _outputs(config: ProjectConfig) -> list[Path]:
+    """Every stylesheet the project builds, so no target hashes another's output as a source."""
+    return [config.css_output_absolute, *(target.css_output_absolute for target in config.targets.values())]
+
+
+def _build_targets(
+    config: ProjectConfig,
+    names: list[str] | None,
+    mode: BuildMode,
+    *,
+    cache: bool,
+    jobs: int | None,
+    hoist_styles: bool | None,
+    fingerprint: bool | None,
+    tree_shake: bool | None,
+    report_file: Path | None,
+) -> dict[str, ProjectConfig]:
+    if unknown := [name for name in names or () if name not in config.targets]:
+        error(f"Unknown target(s): {', '.join(unknown)} (configured: {', '.join(config.targets)})")
+        raise typer.Exit(1)
+
+    selected = {name: config.targets[name] for name in names or config.targets}
+    for target in selected.values():
+        if hoist_styles is not None:
+            target.hoist_styles = hoist_styles
+        if fingerprint is not None:
+            target.fingerprint = fingerprint
+        if tree_shake is not None:
+            target.tree_shake = tree_shake
+        target.css_output_absolute.unlink(missing_ok=True)
+        target.css_output_absolute.parent.mkdir(parents=True, exist_ok=True)
+
+    start = time.perf_counter()
+    with console.status(f"[bold green]Building {len(selected)} targets..."):
+        results = build_targets(selected, mode, cache=cache, jobs=jobs, outputs=_outputs(config))
+    elapsed = time.perf_counter() - start
+
+    table = Table()
+    table.add_column("Target", style="cyan")
+    table.add_column("Output")
+    table.add_column("Time", justify="right")
+    table.add_column("Size", justify="right")
+    table.add_column("Status")
+    for name, target in selected.items():
+        result = results.get(name)
+        if result is None:
+            table.add_row(name, str(target.css_output_absolute), "", "", "[yellow]skipped[/yellow]")
+            continue
+        if not result.success:
+            table.add_row(name, str(target.css_output_absolute), "", "", "[red]failed[/red]")
+            continue
+        hashed = fingerprint_css(result.css_path) if target.fingerprint and result.css_path else None
+        table.add_row(
+            name,
+            str(hashed or result.css_path),
+            f"{result.build_time:.1f}s" if result.build_time is not None else "",
+            format_size(result.css_size_bytes) if result.css_size_bytes is not None else "",
+            "[green]cached[/green]" if result.cache_hit else "[green]built[/green]",
+        )
+    console.print(table)
+    if report_file is not None:
+        _write_report(report_file, results, mode, config)
+
+    if failed := next((name for name, result in results.items() if not result.success), None):
+        error(f"Build failed for {failed}: {results[failed].error_message}")
+        raise typer.Exit(1)
+
+    success(f"Built {len(selected)} target(s) in {elapsed:.1f}s")
+    return selected
+
+
 def build_command(
     output: str | None = typer.Option(None, "--output", "-o", help="CSS output path"),
     minify: bool = typer.Option(True, "--minify/--no-minify", help="Minify CSS"),
+    hoist_styles: bool | None = typer.Option(
+        None,
+        "--hoist-styles/--no-hoist-styles",
+        help="Bundle component CSS into the stylesheet (default: \\[tool.starui] hoist_styles)",
+    ),
+    cache: bool = typer.Option(
+        True, "--cache/--no-cache", help="Reuse output from ~/.starui/cache/builds when no input changed"
+    ),
+    fingerprint: bool | None = typer.Option(
+        None,
+        "--fingerprint/--no-fingerprint",
+        help="Also write a content-hashed copy with .gz/.br siblings and assets.json (default: \\[tool.starui] fingerprint)",
+    ),
+    tree_shake: bool | None = typer.Option(
+        None,
+        "--tree-shake/--no-tree-shake",
+        help="Drop theme color variables no source uses (default: \\[tool.starui] tree_shake)",
+    ),
+    critical: bool = typer.Option(
+        False, "--critical", help="Also build critical CSS for each route in \\[tool.starui] critical_routes"
+    ),
+    app_file: str | None = typer.Option(
+        None, "--app", help="App file rendered for --critical (default: \\[tool.starui] app_file or app.py)"
+    ),
+    routes: list[str] | None = typer.Option(None, "--route", help="Route rendered for --critical (repeatable)"),
+    targets: list[str] | None = typer.Option(
+        None, "--target", "-t", help="Build only this \\[tool.starui.targets] entry (repeatable)"
+    ),
+    report: ReportFormat | None = typer.Option(
+        None,
+        "--report",
+        help=f"Write phase timings and raw/gzip/brotli sizes to --report-file (default: {BUILD_REPORT_FILE})",
+    ),
+    report_file: str = typer.Option(BUILD_REPORT_FILE, "--report-file", help="Where --report writes"),
+    jobs: int | None = typer.Option(None, "--jobs", "-j", min=1, help="Targets built at once (default: CPU count + 4)"),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Show details"),
 ) -> None:
     """Build production CSS."""
 
     try:
         config = get_project_config()
+        mode = BuildMode.PRODUCTION if minify else BuildMode.DEVELOPMENT
+        report_path = Path(report_file) if report else None
+
+        if config.targets and not output:
+            built = _build_targets(
+                config,
+                targets,
+                mode,
+                cache=cache,
+                jobs=jobs,
+                hoist_styles=hoist_styles,
+                fingerprint=fingerprint,
+                tree_shake=tree_shake,
+                report_file=report_path,
+            )
+            if critical:
+                for target in built.values():
+                    builder = CSSBuilder(target, cache=cache, outputs=_outputs(config))
+                    _build_critical(builder, target, app_file, routes, mode)
+            return
+
+        if targets:
+            error(
+                "No \\[tool.starui.targets] configured"
+                if not config.targets
+                else "--target can't be combined with --output"
+            )
+            raise typer.Exit(1)
 
         if output:
             path = Path(output)
@@ -32,20 +213,30 @@ def build_command(
                 path = path.with_suffix(".css")
             config.css_output = path
 
+        if hoist_styles is not None:
+            config.hoist_styles = hoist_styles
+        if fingerprint is not None:
+            config.fingerprint = fingerprint
+        if tree_shake is not None:
+            config.tree_shake = tree_shake
+
         if verbose:
             info(f"Output: {config.css_output_absolute}")
 
         config.css_output_absolute.unlink(missing_ok=True)
         config.css_output_absolute.parent.mkdir(parents=True, exist_ok=True)
 
-        builder = CSSBuilder(config)
+        builder = CSSBuilder(config, cache=cache)
         with console.status("[bold green]Building CSS..."):
-            result = builder.build(
-                mode=BuildMode.PRODUCTION if minify else BuildMode.DEVELOPMENT,
-            )
+            result = builder.build(mode=mode)
+        if report_path is not None:
+            _write_report(report_path, {"default": result}, mode, config)
 
         if result.success:
-            success("Build completed!")
+            hashed = fingerprint_css(result.css_path) if config.fingerprint and result.css_path else None
+            success("Build completed (cached)" if result.cache_hit else "Build completed!")
+            if config.hoist_styles:
+                info("Component styles bundled; call hoist_component_styles() or set STARUI_HOIST_STYLES=1 in your app")
 
             table = Table(show_header=False)
             table.add_column("Metric", style="cyan")
@@ -53,12 +244,17 @@ def build_command(
 
             if result.css_path is not None:
                 table.add_row("Output", str(result.css_path))
+            if hashed is not None:
+                table.add_row("Fingerprinted", str(hashed))
             if result.build_time is not None:
                 table.add_row("Time", f"{result.build_time:.1f}s")
             if result.css_size_bytes is not None:
                 table.add_row("Size", format_size(result.css_size_bytes))
 
             console.print(table)
+
+            if critical:
+                _build_critical(builder, config, app_file, routes, mode)
         else:
             error(f"Build failed: {result.error_message}")
             raise typer.Exit(1)
@@ -3,6 +3,7 @@ import difflib
 import typer
 
 from ..config import get_project_config
+from ..optimize import optimize_source
 from ..registry.client import RegistryClient
 from ..registry.manifest import Manifest
 from .utils import (
@@ -52,6 +53,9 @@ def diff_command(
             registry_source = client.get_source(label, kind=kind)
             if kind == "block":
                 registry_source = rewrite_block_imports(registry_source)
+            if record.get("optimized"):
+                # Compare like with like: fold the registry copy the same way `star optimize` did
+                registry_source = optimize_source(registry_source)[0]
         except FileNotFoundError:
             error(f"'{label}' not found in registry")
             raise typer.Exit(1) from None
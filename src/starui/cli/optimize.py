@@ -0,0 +1,89 @@
+"""CLI command for folding static cn()/cva() calls in installed components."""
+
+from pathlib import Path
+
+import typer
+
+from ..config import get_project_config
+from ..optimize import optimize_file
+from ..registry.checksum import compute_checksum
+from ..registry.manifest import SECTIONS, ItemKind, Manifest
+from .utils import console, error, info, status_context, success, warning
+
+
+def _installed_by_path(manifest: Manifest, component_dir: Path) -> dict[Path, tuple[str, ItemKind]]:
+    items: dict[Path, tuple[str, ItemKind]] = {}
+    for kind in SECTIONS:
+        for name, record in manifest.get_installed(kind).items():
+            items[manifest.resolve_path(record, name, component_dir).resolve()] = (name, kind)
+    return items
+
+
+def optimize_command(
+    paths: list[str] | None = typer.Argument(None, help="Files or directories to optimize (default: component_dir)"),
+    check: bool = typer.Option(False, "--check", help="Report foldable calls without rewriting files"),
+    verbose: bool = typer.Option(False, "--verbose", "-v", help="Show details"),
+) -> None:
+    """Fold static cn()/cva() calls in installed components into merged class strings."""
+    try:
+        config = get_project_config()
+        targets = [Path(p) for p in paths] if paths else [config.component_dir_absolute]
+
+        files: list[Path] = []
+        for target in targets:
+            if target.is_file() and target.suffix == ".py":
+                files.append(target)
+            elif target.is_dir():
+                files.extend(sorted(p for p in target.rglob("*.py") if "__pycache__" not in p.parts))
+
+        if not files:
+            error("No .py files found")
+            raise typer.Exit(1)
+
+        if verbose:
+            info(f"Processing {len(files)} file(s)")
+
+        manifest = Manifest(config.project_root)
+        component_dir = config.component_dir_absolute
+        # Only pristine installs get recorded; hand-edited files stay flagged as modified
+        pristine = {
+            path: (name, kind)
+            for path, (name, kind) in _installed_by_path(manifest, component_dir).items()
+            if not manifest.is_modified(name, component_dir, kind=kind)
+        }
+
+        with status_context("[bold green]Folding static class merges..."):
+            results = {path: optimize_file(path, check=check) for path in files}
+
+        folded = {p: n for p, n in results.items() if n}
+        if not folded:
+            success("Nothing to fold")
+            return
+
+        verb = "would fold" if check else "folded"
+        for p, n in folded.items():
+            console.print(f"  {verb} {n} call(s) in [cyan]{p}[/cyan]")
+
+        if check:
+            info(f"{sum(folded.values())} call(s) in {len(folded)} file(s) can be folded")
+            return
+
+        recorded = False
+        for path, count in folded.items():
+            if entry := pristine.get(path.resolve()):
+                name, kind = entry
+                manifest.record_optimized(name, compute_checksum(path), count, kind=kind)
+                recorded = True
+        if recorded:
+            try:
+                manifest.save()
+            except OSError as e:
+                warning(f"Failed to record optimizations in manifest: {e}")
+
+        success(f"Folded {sum(folded.values())} call(s) in {len(folded)} file(s)")
+
+    except typer.Exit:
+        raise
+    except Exception as e:
+        error(f"Optimize failed: {e}")
+        raise typer.Exit(1) from e
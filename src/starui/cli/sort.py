@@ -1,29 +1,63 @@
 """CLI command for sorting Tailwind classes in Python files."""
 
+import sys
 from pathlib import Path
 
 import typer
 
-from ..sort import sort_files
+from ..sort import SORT_CACHE_FILE, changed_since, sort_files
 from .utils import console, error, info, status_context, success
 
 _SKIP = {".venv", "venv", "__pycache__", "node_modules", ".git"}
 
 
+def _in_target(path: Path, target: Path) -> bool:
+    if path == target:
+        return True
+    return path.is_relative_to(target) and not (_SKIP & set(path.relative_to(target).parts))
+
+
 def sort_command(
     paths: list[str] | None = typer.Argument(None, help="Files or directories to sort (default: current directory)"),
     check: bool = typer.Option(False, "--check", help="Check only — exit 1 if changes needed"),
+    jobs: int | None = typer.Option(None, "--jobs", "-j", min=1, help="Worker processes (default: CPU count)"),
+    since: str | None = typer.Option(
+        None, "--changed-since", metavar="REF", help="Only files changed relative to a git ref (e.g. origin/main)"
+    ),
+    cache: bool = typer.Option(
+        True, "--cache/--no-cache", help=f"Skip files unchanged since their last clean sort ({SORT_CACHE_FILE})"
+    ),
+    serve: bool = typer.Option(
+        False, "--serve", help="Run as a daemon answering JSON-RPC sort requests on stdin/stdout (for editors)"
+    ),
+    socket: str | None = typer.Option(None, "--socket", metavar="PATH", help="With --serve, listen on a Unix socket"),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Show details"),
 ) -> None:
     """Sort Tailwind classes in Python source files."""
+    if serve:
+        _serve(socket)
+        return
+
     targets = [Path(p) for p in paths] if paths else [Path.cwd()]
 
     files: list[Path] = []
-    for target in targets:
-        if target.is_file() and target.suffix == ".py":
-            files.append(target)
-        elif target.is_dir():
-            files.extend(sorted(p for p in target.rglob("*.py") if not (_SKIP & set(p.relative_to(target).parts))))
+    if since:
+        try:
+            recent = changed_since(since)
+        except (OSError, RuntimeError) as e:
+            error(f"Could not list changes since {since}: {e}")
+            raise typer.Exit(1) from e
+        roots = [t.resolve() for t in targets]
+        files = [p for p in recent if p.suffix == ".py" and p.is_file() and any(_in_target(p, r) for r in roots)]
+        if not files:
+            success(f"No .py files changed since {since}")
+            return
+    else:
+        for target in targets:
+            if target.is_file() and target.suffix == ".py":
+                files.append(target)
+            elif target.is_dir():
+                files.extend(sorted(p for p in target.rglob("*.py") if _in_target(p, target)))
 
     if not files:
         error("No .py files found")
@@ -33,7 +67,7 @@ def sort_command(
         info(f"Processing {len(files)} file(s)")
 
     with status_context("[bold green]Sorting Tailwind classes..."):
-        results = sort_files(files, check=check)
+        results = sort_files(files, check=check, jobs=jobs, cache_path=Path.cwd() / SORT_CACHE_FILE if cache else None)
 
     changed = [p for p, c in results.items() if c]
 
@@ -49,3 +83,21 @@ def sort_command(
             success(f"Sorted {len(changed)} file(s)")
     else:
         success("All files already sorted")
+
+
+def _serve(socket: str | None) -> None:
+    from ..sort_server import SortServer, serve_socket, serve_stdio
+
+    try:
+        server = SortServer()
+        if socket:
+            info(f"Serving sort requests on {socket}")
+            serve_socket(server, Path(socket))
+        else:
+            # stdout carries the protocol; nothing else may be printed there
+            serve_stdio(server, sys.stdin, sys.stdout)
+    except KeyboardInterrupt:
+        pass
+    except Exception as e:
+        print(f"star sort --serve: {e}", file=sys.stderr)
+        raise typer.Exit(1) from e
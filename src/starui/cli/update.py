@@ -6,6 +6,7 @@ from ..registry.manifest import ItemKind, Manifest
 from .utils import (
     MSG_NO_COMPONENTS,
     MSG_NO_MANIFEST,
+    MSG_RUNTIME_SETUP,
     error,
     find_block_by_install_name,
     info,
@@ -58,6 +59,7 @@ def update_command(
         component_dir = config.component_dir_absolute
 
         updated: list[str] = []
+        added: list[str] = []
         skipped: list[str] = []
 
         all_targets: list[tuple[str, ItemKind]] = [
@@ -92,19 +94,22 @@ def update_command(
             install_item(name, source, kind=kind, install_name=iname, config=config, client=client, manifest=manifest)
             updated.append(name)
 
-            if kind == "block":
-                try:
-                    for dep_name in client.resolve_dependencies(name, kind="block"):
-                        if not (component_dir / f"{dep_name}.py").exists():
-                            dep_source = client.get_source(dep_name)
-                            install_item(dep_name, dep_source, config=config, client=client, manifest=manifest)
-                            updated.append(dep_name)
-                except Exception as e:
-                    warning(f"Could not install dependency for {name}: {e}")
+            # New versions can depend on components that weren't needed before (e.g. runtime)
+            try:
+                for dep_name in client.resolve_dependencies(name, kind=kind):
+                    if dep_name != name and not (component_dir / f"{dep_name}.py").exists():
+                        dep_source = client.get_source(dep_name)
+                        install_item(dep_name, dep_source, config=config, client=client, manifest=manifest)
+                        updated.append(dep_name)
+                        added.append(dep_name)
+            except Exception as e:
+                warning(f"Could not install dependency for {name}: {e}")
 
         if updated:
             manifest.save()
             success(f"Updated {len(updated)} item(s): {', '.join(updated)}")
+            if "runtime" in added:
+                warning(MSG_RUNTIME_SETUP)
         elif skipped:
             warning(f"Skipped {len(skipped)} modified item(s)")
         else:
@@ -87,3 +87,6 @@ def find_block_by_install_name(name: str, installed_blocks: dict[str, dict]) ->
 
 MSG_NO_MANIFEST = "No manifest found. Run 'star init' or 'star add' first."
 MSG_NO_COMPONENTS = "No components installed."
+MSG_RUNTIME_SETUP = (
+    "Add StarUIRuntime() to your app's hdrs and call register_runtime(app) to serve the component runtime"
+)
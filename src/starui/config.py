@@ -2,7 +2,7 @@
 
 import re
 import tomllib
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 
 
@@ -14,6 +14,13 @@ class ProjectConfig:
     css_output: Path
     component_dir: Path
     css_dir: Path | None = None
+    hoist_styles: bool = False
+    fingerprint: bool = False
+    tree_shake: bool = False
+    app_file: Path = Path("app.py")
+    critical_routes: tuple[str, ...] = ("/",)
+    # Named builds from [tool.starui.targets.<name>]; each is this config with its own overrides
+    targets: dict[str, "ProjectConfig"] = field(default_factory=dict)
 
     def _absolute(self, path: Path) -> Path:
         return path if path.is_absolute() else self.project_root / path
@@ -26,6 +33,10 @@ class ProjectConfig:
     def component_dir_absolute(self) -> Path:
         return self._absolute(self.component_dir)
 
+    @property
+    def app_file_absolute(self) -> Path:
+        return self._absolute(self.app_file)
+
     @property
     def css_dir_absolute(self) -> Path:
         if self.css_dir is None:
@@ -68,14 +79,36 @@ def load_pyproject_config(project_root: Path) -> ProjectConfig | None:
     if starui is None:
         return None
 
-    return ProjectConfig(
+    config = ProjectConfig(
         project_root=project_root,
         css_output=Path(starui["css_output"]) if "css_output" in starui else detect_css_output(project_root),
         component_dir=Path(starui["component_dir"])
         if "component_dir" in starui
         else detect_component_dir(project_root),
         css_dir=Path(starui["css_dir"]) if "css_dir" in starui else None,
+        hoist_styles=bool(starui.get("hoist_styles", False)),
+        fingerprint=bool(starui.get("fingerprint", False)),
+        tree_shake=bool(starui.get("tree_shake", False)),
+        app_file=Path(starui.get("app_file", "app.py")),
+        critical_routes=tuple(starui.get("critical_routes", ("/",))),
     )
+    config.targets = {name: _load_target(config, name, table) for name, table in starui.get("targets", {}).items()}
+    return config
+
+
+_TARGET_PATHS = ("css_output", "css_dir", "component_dir", "app_file")
+_TARGET_FLAGS = ("hoist_styles", "fingerprint", "tree_shake")
+
+
+def _load_target(base: ProjectConfig, name: str, table: dict) -> ProjectConfig:
+    if "css_output" not in table:
+        raise ValueError(f"[tool.starui.targets.{name}] needs a css_output")
+    overrides: dict = {"css_dir": None, "targets": {}}
+    overrides |= {key: Path(table[key]) for key in _TARGET_PATHS if key in table}
+    overrides |= {key: bool(table[key]) for key in _TARGET_FLAGS if key in table}
+    if "critical_routes" in table:
+        overrides["critical_routes"] = tuple(table["critical_routes"])
+    return replace(base, **overrides)
 
 
 def save_config(
@@ -0,0 +1,97 @@
+"""Per-route critical CSS: render app routes and build stylesheets from the classes they use."""
+
+import importlib.util
+import re
+import sys
+from collections.abc import Iterable
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Any
+
+from .css import BuildMode, BuildResult, CSSBuilder
+from .sort import tokenize
+
+
+class CriticalCSSError(Exception): ...
+
+
+class _ClassCollector(HTMLParser):
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.classes: set[str] = set()
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        for name, value in attrs:
+            if name == "class" and value:
+                self.classes.update(tokenize(value))
+            elif name.startswith("data-class:"):
+                # Datastar toggles these later; include them so the first toggle doesn't flash
+                self.classes.add(name.removeprefix("data-class:"))
+
+
+def page_classes(html: str) -> set[str]:
+    """Class tokens used by a rendered page, including ones Datastar may toggle on."""
+    collector = _ClassCollector()
+    collector.feed(html)
+    collector.close()
+    return collector.classes
+
+
+def route_slug(route: str) -> str:
+    """File stem for a route's critical stylesheet: ``/`` is ``index``, ``/docs/button`` is ``docs-button``."""
+    path = route.split("?", 1)[0].strip("/")
+    return re.sub(r"[^A-Za-z0-9_.-]+", "-", path).strip("-") or "index"
+
+
+def load_app(app_file: Path, attr: str = "app") -> Any:
+    """Import an app module from its file and return its ASGI app."""
+    app_file = app_file.resolve()
+    if not app_file.is_file():
+        raise CriticalCSSError(f"App file not found: {app_file}")
+
+    spec = importlib.util.spec_from_file_location(f"_starui_critical_{app_file.stem}", app_file)
+    if spec is None or spec.loader is None:
+        raise CriticalCSSError(f"Cannot import {app_file}")
+    module = importlib.util.module_from_spec(spec)
+    # Sibling imports (components/, ui/) resolve the way they do under uvicorn
+    sys.path.insert(0, str(app_file.parent))
+    try:
+        spec.loader.exec_module(module)
+    finally:
+        sys.path.remove(str(app_file.parent))
+
+    if (app := getattr(module, attr, None)) is None:
+        raise CriticalCSSError(f"{app_file.name} has no '{attr}'")
+    return app
+
+
+def render_routes(app: Any, routes: Iterable[str]) -> dict[str, str]:
+    """HTML for each route, rendered in-process through the Starlette test client."""
+    from starlette.testclient import TestClient
+
+    pages: dict[str, str] = {}
+    with TestClient(app) as client:
+        for route in routes:
+            response = client.get(route)
+            if response.status_code >= 400:
+                raise CriticalCSSError(f"GET {route} returned {response.status_code}")
+            pages[route] = response.text
+    return pages
+
+
+def build_critical_css(
+    builder: CSSBuilder,
+    pages: dict[str, str],
+    output_dir: Path,
+    mode: BuildMode = BuildMode.PRODUCTION,
+) -> dict[str, BuildResult]:
+    """Write ``<output_dir>/<slug>.css`` for each rendered page, with stale route files removed."""
+    results = {
+        route: builder.build_critical(page_classes(html), output_dir / f"{route_slug(route)}.css", mode)
+        for route, html in pages.items()
+    }
+    keep = {f"{route_slug(route)}.css" for route in pages}
+    for path in output_dir.glob("*.css"):
+        if path.name not in keep:
+            path.unlink(missing_ok=True)
+    return results
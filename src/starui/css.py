@@ -1,11 +1,23 @@
 """Tailwind CSS binary management and build pipeline."""
 
+import ast
+import gzip
+import hashlib
+import json
+import logging
+import os
 import platform
+import re
 import shutil
 import subprocess
+import sys
 import tempfile
+import threading
 import time
-from dataclasses import dataclass
+from collections.abc import Callable, Collection, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from enum import StrEnum
 from pathlib import Path
 
@@ -14,6 +26,21 @@ import requests
 from .config import ProjectConfig
 from .templates import generate_css_input
 
+logger = logging.getLogger(__name__)
+
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# sha256 of release assets by tag and asset name, copied from each release's
+# sha256sums.txt. Pinned entries win over that file, which is only fetched for
+# unpinned versions; without either, downloads are refused unless
+# ALLOW_UNVERIFIED_ENV is set.
+TAILWIND_CHECKSUMS: dict[str, dict[str, str]] = {}
+ALLOW_UNVERIFIED_ENV = "STARUI_ALLOW_UNVERIFIED_TAILWIND"
+
+ASSET_MANIFEST = "assets.json"
+FINGERPRINT_LENGTH = 10
+CRITICAL_DIR = "critical"
+
 
 class BinaryError(Exception): ...
 
@@ -33,6 +60,23 @@ class BuildResult:
     build_time: float | None = None
     css_size_bytes: int | None = None
     error_message: str | None = None
+    cache_hit: bool = False
+    # Seconds spent in each of BUILD_PHASES that ran
+    phases: dict[str, float] = field(default_factory=dict)
+
+
+BUILD_PHASES = ("binary", "input", "cache", "tailwind", "stat")
+BUILD_REPORT_SCHEMA = 1
+BUILD_REPORT_FILE = ".starui/build-report.json"
+
+
+@contextmanager
+def _timed(phases: dict[str, float], name: str) -> Iterator[None]:
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        phases[name] = phases.get(name, 0.0) + time.perf_counter() - start
 
 
 def get_platform_info() -> tuple[str, str]:
@@ -61,14 +105,246 @@ def get_cache_dir(version: str) -> Path:
     return cache_dir
 
 
+def get_build_cache_dir() -> Path:
+    return Path.home() / ".starui" / "cache" / "builds"
+
+
+def binary_fingerprint(binary: Path) -> str:
+    """Identity of a Tailwind binary: resolved path, size and mtime change with every upgrade."""
+    stat = binary.stat()
+    return f"{binary.resolve()}:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+_BINARY_DIGESTS_FILE = "binaries.json"
+_BINARY_DIGESTS_MAX_ENTRIES = 8
+_binary_digests: dict[str, str] = {}
+
+
+def binary_digest(binary: Path) -> str:
+    """sha256 of a Tailwind binary, so the same release downloaded afresh (e.g. in CI) keeps its build cache.
+
+    Hashing the binary costs a few hundred milliseconds, so digests are memoized by
+    binary_fingerprint() in memory and in the build cache directory.
+    """
+    stamp = binary_fingerprint(binary)
+    if digest := _binary_digests.get(stamp):
+        return digest
+    memo_path = get_build_cache_dir() / _BINARY_DIGESTS_FILE
+    try:
+        memo = json.loads(memo_path.read_text())
+    except (OSError, ValueError):
+        memo = {}
+    if not isinstance(memo, dict):
+        memo = {}
+    if not isinstance(digest := memo.get(stamp), str):
+        with binary.open("rb") as f:
+            digest = hashlib.file_digest(f, "sha256").hexdigest()
+        memo = {k: v for k, v in list(memo.items())[-(_BINARY_DIGESTS_MAX_ENTRIES - 1) :] if k != stamp}
+        memo[stamp] = digest
+        try:
+            memo_path.parent.mkdir(parents=True, exist_ok=True)
+            _write_atomic(memo_path, json.dumps(memo, indent=2).encode())
+        except OSError:
+            pass
+    _binary_digests[stamp] = digest
+    return digest
+
+
+# Never affect the generated CSS (Tailwind skips binaries and lock files too)
+_SOURCE_SKIP_DIRS = {".git", ".venv", "venv", "__pycache__", "node_modules", ".starui", ".pytest_cache", ".ruff_cache"}
+_SOURCE_SKIP_SUFFIXES = {
+    ".png", ".jpg", ".jpeg", ".gif", ".webp", ".avif", ".ico", ".woff", ".woff2", ".ttf", ".otf", ".eot",
+    ".mp3", ".mp4", ".webm", ".wav", ".pdf", ".zip", ".gz", ".br", ".tar", ".pyc", ".lock", ".db", ".sqlite",
+    ".tmp",
+}  # fmt: skip
+# Temporary Tailwind input files written next to input.css while a build runs
+_TEMP_INPUT_PREFIX = ".starui-input-"
+_SOURCE_DIRECTIVE_RE = re.compile(r"""@source\s+(?!not\b)(?:inline\()?["']([^"']+)["']""")
+_BUILD_CACHE_MAX_ENTRIES = 32
+
+
+def _walk_sources(root: Path) -> list[Path]:
+    files: list[Path] = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in _SOURCE_SKIP_DIRS]
+        files.extend(Path(dirpath) / name for name in filenames)
+    return files
+
+
+def _git_sources(root: Path) -> list[Path] | None:
+    """Tracked and untracked-but-not-ignored files, the same set Tailwind's scanner honors."""
+    try:
+        result = subprocess.run(
+            ["git", "ls-files", "-co", "--exclude-standard", "-z"],
+            capture_output=True,
+            cwd=root,
+            timeout=30,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if result.returncode != 0:
+        return None
+    return [root / name for name in result.stdout.decode("utf-8", "surrogateescape").split("\0") if name]
+
+
+def source_files(root: Path, css_input: str = "", css_dir: Path | None = None) -> list[Path]:
+    """Files Tailwind may read for a build: the project tree plus any ``@source`` paths in the input."""
+    files = _git_sources(root)
+    if files is None:
+        files = _walk_sources(root)
+    for pattern in _SOURCE_DIRECTIVE_RE.findall(css_input):
+        static = re.split(r"[*{]", pattern, maxsplit=1)[0]
+        extra = ((css_dir or root) / static).resolve()
+        if extra.is_file():
+            files.append(extra)
+        elif extra.is_dir() and not extra.is_relative_to(root.resolve()):
+            files.extend(_walk_sources(extra))
+    return files
+
+
+def critical_dir(output: Path) -> Path:
+    """Directory of per-route critical stylesheets for ``output``: ``static/css/critical/starui/``.
+
+    Keyed by the output's stem so targets that share a directory keep separate files.
+    """
+    return output.parent / CRITICAL_DIR / output.stem
+
+
+def generated_file_filter(outputs: Collection[Path]) -> Callable[[Path], bool]:
+    """Predicate for files ``star build`` writes for these outputs, which must not count as sources.
+
+    Covers each output stylesheet, its fingerprinted copies, the ``assets.json`` beside
+    it, the ``critical/`` directory and temporary Tailwind inputs.
+    """
+    names: dict[Path, list[re.Pattern[str]]] = {}
+    for output in outputs:
+        output = output.resolve()
+        names.setdefault(output.parent, []).append(
+            re.compile(rf"{re.escape(output.stem)}(\.[0-9a-f]{{{FINGERPRINT_LENGTH}}})?{re.escape(output.suffix)}")
+        )
+    critical_dirs = {parent / CRITICAL_DIR for parent in names}
+
+    def is_generated(path: Path) -> bool:
+        path = path.resolve()
+        # Also critical/*.css from builds before critical CSS was split per output
+        if path.name.startswith(_TEMP_INPUT_PREFIX) or critical_dirs & {path.parent, path.parent.parent}:
+            return True
+        patterns = names.get(path.parent)
+        return patterns is not None and (path.name == ASSET_MANIFEST or any(p.fullmatch(path.name) for p in patterns))
+
+    return is_generated
+
+
+def sources_digest(root: Path, files: list[Path], exclude: Collection[Path] = ()) -> str:
+    """Content hash over every source file except the build ``outputs`` in ``exclude`` and their artifacts.
+
+    Mtimes are ignored and paths are taken relative to ``root``, so fresh checkouts and
+    containers with a different working directory still produce the same digest.
+    """
+    root = root.resolve()
+    is_generated = generated_file_filter(exclude)
+    entries: dict[str, str] = {}
+    for path in files:
+        if path.suffix.lower() in _SOURCE_SKIP_SUFFIXES or _SOURCE_SKIP_DIRS & set(path.parts):
+            continue
+        resolved = path.resolve()
+        if is_generated(resolved):
+            continue
+        name = resolved.relative_to(root).as_posix() if resolved.is_relative_to(root) else str(resolved)
+        try:
+            with resolved.open("rb") as f:
+                entries[name] = hashlib.file_digest(f, "sha256").hexdigest()
+        except OSError:
+            continue
+    digest = hashlib.sha256()
+    for name in sorted(entries):
+        digest.update(f"{name}\0{entries[name]}\n".encode())
+    return digest.hexdigest()
+
+
+def collect_component_styles(component_dir: Path) -> str:
+    """Static CSS passed to component_style() in installed components, deduplicated in file order."""
+    if not component_dir.is_dir():
+        return ""
+
+    blocks: dict[str, None] = {}
+    for path in sorted(component_dir.rglob("*.py")):
+        try:
+            tree = ast.parse(path.read_text())
+        except (SyntaxError, UnicodeDecodeError):
+            continue
+
+        constants = {
+            target.id: node.value.value
+            for node in tree.body
+            if isinstance(node, ast.Assign)
+            and isinstance(node.value, ast.Constant)
+            and isinstance(node.value.value, str)
+            for target in node.targets
+            if isinstance(target, ast.Name)
+        }
+        for node in ast.walk(tree):
+            if not (
+                isinstance(node, ast.Call)
+                and isinstance(node.func, ast.Name)
+                and node.func.id == "component_style"
+                and len(node.args) == 1
+            ):
+                continue
+            arg = node.args[0]
+            if isinstance(arg, ast.Name):
+                css = constants.get(arg.id)
+            elif isinstance(arg, ast.Constant) and isinstance(arg.value, str):
+                css = arg.value
+            else:
+                css = None
+            if css and css.strip():
+                blocks.setdefault(css.strip(), None)
+
+    return "\n".join(blocks)
+
+
+@contextmanager
+def _file_lock(path: Path) -> Iterator[None]:
+    """Exclusive inter-process lock held for the duration of the block."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a+b") as f:
+        if sys.platform == "win32":
+            import msvcrt
+
+            while True:
+                try:
+                    f.seek(0)
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue  # LK_LOCK gives up after ~10s; keep waiting like flock does
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
 class TailwindBinaryManager:
     DEFAULT_VERSION = "latest"
     FALLBACK_VERSION = "v4.1.0"
     GITHUB_RELEASES_URL = "https://github.com/tailwindlabs/tailwindcss/releases/download"
     GITHUB_API_URL = "https://api.github.com/repos/tailwindlabs/tailwindcss/releases/latest"
 
-    def __init__(self, version: str | None = None):
+    def __init__(self, version: str | None = None, *, allow_unverified: bool | None = None):
         self.version = version or self.DEFAULT_VERSION
+        if allow_unverified is None:
+            allow_unverified = os.environ.get(ALLOW_UNVERIFIED_ENV) == "1"
+        self.allow_unverified = allow_unverified
 
     def _get_latest_version(self) -> str:
         try:
@@ -79,32 +355,89 @@ class TailwindBinaryManager:
             # Fallback when offline — will attempt download and fail clearly
             return self.FALLBACK_VERSION
 
-    def _get_download_url(self) -> str:
+    def _release_tag(self) -> str:
+        return self._get_latest_version() if self.version == "latest" else f"v{self.version}"
+
+    def _get_download_url(self, tag: str | None = None) -> str:
         platform_name, arch = get_platform_info()
         binary_name = get_binary_name(platform_name, arch)
-
-        if self.version == "latest":
-            version = self._get_latest_version()
-            return f"{self.GITHUB_RELEASES_URL}/{version}/{binary_name}"
-        return f"{self.GITHUB_RELEASES_URL}/v{self.version}/{binary_name}"
+        return f"{self.GITHUB_RELEASES_URL}/{tag or self._release_tag()}/{binary_name}"
 
     def _get_binary_path(self) -> Path:
         cache_dir = get_cache_dir(self.version)
         platform_name, arch = get_platform_info()
         return cache_dir / get_binary_name(platform_name, arch)
 
-    def _download_binary(self, url: str, binary_path: Path) -> None:
+    def _expected_checksum(self, tag: str, binary_name: str) -> str | None:
+        if pinned := TAILWIND_CHECKSUMS.get(tag, {}).get(binary_name):
+            return pinned
         try:
-            response = requests.get(url, timeout=60)
+            response = requests.get(f"{self.GITHUB_RELEASES_URL}/{tag}/sha256sums.txt", timeout=10)
             response.raise_for_status()
+        except requests.RequestException:
+            return None
+        for line in response.text.splitlines():
+            parts = line.split()
+            # "<sha256>  ./dist/tailwindcss-linux-x64" or "<sha256> *tailwindcss-linux-x64"
+            if len(parts) == 2 and parts[1].lstrip("*").rsplit("/", 1)[-1] == binary_name:
+                return parts[0].lower()
+        return None
+
+    def _download_binary(self, url: str, binary_path: Path, checksum: str | None = None, *, tag: str) -> None:
+        """Stream ``url`` into ``<binary>.<tag>.part``, verify it and rename it into place.
+
+        A ``.part`` left behind by an interrupted download of the same release is resumed
+        with a Range request, but only when a checksum can vouch for the joined bytes;
+        partials of other releases are discarded. Without a checksum the download is
+        refused unless ``allow_unverified`` is set. Callers must hold the binary's lock.
+        """
+        part = binary_path.with_name(f"{binary_path.name}.{tag}.part")
+        binary_path.parent.mkdir(parents=True, exist_ok=True)
+        for stale in binary_path.parent.glob(f"{binary_path.name}.*.part"):
+            if stale != part:
+                stale.unlink(missing_ok=True)
+        if checksum is None:
+            if not self.allow_unverified:
+                raise BinaryError(
+                    f"No checksum available for {binary_path.name} from {url}; "
+                    f"set {ALLOW_UNVERIFIED_ENV}=1 to install it without verification"
+                )
+            part.unlink(missing_ok=True)
 
-            binary_path.parent.mkdir(parents=True, exist_ok=True)
-            binary_path.write_bytes(response.content)
-            binary_path.chmod(binary_path.stat().st_mode | 0o755)
+        digest = hashlib.sha256()
+        offset = part.stat().st_size if part.exists() else 0
+        if offset:
+            with part.open("rb") as f:
+                while chunk := f.read(DOWNLOAD_CHUNK_SIZE):
+                    digest.update(chunk)
 
+        try:
+            headers = {"Range": f"bytes={offset}-"} if offset else {}
+            with requests.get(url, stream=True, timeout=60, headers=headers) as response:
+                # 416: the partial file already holds every byte; verification below decides
+                if not (offset and response.status_code == 416):
+                    response.raise_for_status()
+                    if offset and response.status_code != 206:
+                        offset, digest = 0, hashlib.sha256()  # server ignored the range: start over
+                    with part.open("ab" if offset else "wb") as f:
+                        for chunk in response.iter_content(DOWNLOAD_CHUNK_SIZE):
+                            f.write(chunk)
+                            digest.update(chunk)
         except requests.RequestException as e:
+            # The partial file is kept so the next attempt resumes instead of starting over
             raise NetworkError(f"Failed to download: {e}") from e
 
+        if checksum is None:
+            logger.warning("No checksum available for %s; installed without verification", binary_path.name)
+        elif digest.hexdigest() != checksum:
+            part.unlink(missing_ok=True)
+            raise BinaryError(
+                f"Checksum mismatch for {binary_path.name}: expected {checksum}, got {digest.hexdigest()}"
+            )
+
+        part.chmod(part.stat().st_mode | 0o755)
+        os.replace(part, binary_path)
+
     def get_binary(self) -> Path:
         if system_binary := shutil.which("tailwindcss"):
             return Path(system_binary)
@@ -113,42 +446,136 @@ class TailwindBinaryManager:
         if binary_path.exists():
             return binary_path
 
-        self._download_binary(self._get_download_url(), binary_path)
+        with _file_lock(binary_path.with_name(f"{binary_path.name}.lock")):
+            # Another process may have finished the download while we waited for the lock
+            if binary_path.exists():
+                return binary_path
+            tag = self._release_tag()
+            self._download_binary(
+                self._get_download_url(tag), binary_path, self._expected_checksum(tag, binary_path.name), tag=tag
+            )
         return binary_path
 
 
 class CSSBuilder:
-    def __init__(self, config: ProjectConfig):
+    def __init__(self, config: ProjectConfig, *, cache: bool = True, outputs: Collection[Path] = ()):
+        """``outputs`` lists other stylesheets built in the same project, e.g. sibling targets;
+        they and their artifacts are never treated as sources.
+        """
         self.config = config
+        self.cache = cache
         self.binary_manager = TailwindBinaryManager()
-
-    def build(self, mode: BuildMode = BuildMode.DEVELOPMENT) -> BuildResult:
-        start_time = time.time()
-        input_file = None
-        use_temp = False
-
+        self.outputs = {
+            config.css_output_absolute,
+            *(target.css_output_absolute for target in config.targets.values()),
+            *outputs,
+        }
+
+    def _cache_key(self, binary_path: Path, css_input: str, css_dir: Path, mode: BuildMode) -> str | None:
+        """Content address of a build, or None when the inputs can't be fingerprinted."""
         try:
-            binary_path = self.binary_manager.get_binary()
-
-            project_input_css = self.config.css_dir_absolute / "input.css"
+            binary = binary_digest(binary_path)
+            files = source_files(self.config.project_root, css_input, css_dir)
+            sources = sources_digest(self.config.project_root, files, exclude=self.outputs)
+        except OSError:
+            return None
+        parts = [binary, mode.value, hashlib.sha256(css_input.encode()).hexdigest(), sources]
+        return hashlib.sha256("\0".join(parts).encode()).hexdigest()[:32]
+
+    def _restore(self, key: str, start_time: float) -> BuildResult | None:
+        cached = get_build_cache_dir() / f"{key}.css"
+        output = self.config.css_output_absolute
+        try:
+            output.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(cached, output)
+            os.utime(cached)  # recently used entries survive pruning
+        except OSError:
+            return None
+        return BuildResult(
+            success=True,
+            css_path=output,
+            build_time=time.time() - start_time,
+            css_size_bytes=output.stat().st_size,
+            cache_hit=True,
+        )
+
+    def _store(self, key: str) -> None:
+        cache_dir = get_build_cache_dir()
+        # Targets with identical inputs share a key and may store concurrently
+        tmp = cache_dir / f"{key}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(self.config.css_output_absolute, tmp)
+            os.replace(tmp, cache_dir / f"{key}.css")
+            entries = sorted(cache_dir.glob("*.css"), key=lambda p: p.stat().st_mtime, reverse=True)
+            for stale in entries[_BUILD_CACHE_MAX_ENTRIES:]:
+                stale.unlink(missing_ok=True)
+        except OSError:
+            tmp.unlink(missing_ok=True)
+
+    def _input(self) -> tuple[str, Path, Path | None]:
+        """Tailwind input CSS, the directory its relative paths resolve from, and its file if used unmodified."""
+        project_input_css = self.config.css_dir_absolute / "input.css"
+        component_css = collect_component_styles(self.config.component_dir_absolute) if self.config.hoist_styles else ""
 
-            if project_input_css.exists():
+        input_file = None
+        if project_input_css.exists():
+            # Same directory as input.css so its relative @import/@source paths still resolve
+            css_dir = project_input_css.parent
+            css_input = project_input_css.read_text()
+            if not component_css:
                 input_file = project_input_css
-            else:
-                css_dir = self.config.css_output_absolute.parent
-                css_dir.mkdir(parents=True, exist_ok=True)
-
-                with tempfile.NamedTemporaryFile(mode="w", suffix=".css", dir=css_dir, delete=False) as temp_file:
-                    temp_file.write(generate_css_input(self.config))
-                    input_file = Path(temp_file.name)
-                    use_temp = True
+        else:
+            css_dir = self.config.css_output_absolute.parent
+            css_input = generate_css_input(self.config)
+        if component_css:
+            # Left unlayered, matching the cascade of the inline <style> it replaces
+            css_input += f"\n\n/* StarUI component styles */\n{component_css}\n"
+        if self.config.tree_shake:
+            shaken = shake_theme(css_input, self._source_texts(css_input, css_dir, project_input_css))
+            if shaken != css_input:
+                css_input, input_file = shaken, None
+        return css_input, css_dir, input_file
+
+    def _source_texts(self, css_input: str, css_dir: Path, input_css: Path) -> Iterator[str]:
+        """Project sources Tailwind scans, minus our own input and previous outputs."""
+        is_generated = generated_file_filter(self.outputs)
+        for path in source_files(self.config.project_root, css_input, css_dir):
+            if path.suffix.lower() in _SOURCE_SKIP_SUFFIXES or _SOURCE_SKIP_DIRS & set(path.parts):
+                continue
+            if path == input_css or is_generated(path):
+                continue
+            try:
+                yield path.read_text(errors="ignore")
+            except OSError:
+                continue
+
+    def _run(
+        self,
+        binary_path: Path,
+        css_input: str,
+        css_dir: Path,
+        input_file: Path | None,
+        output: Path,
+        mode: BuildMode,
+    ) -> str | None:
+        """Run Tailwind once; returns its error output on failure."""
+        use_temp = input_file is None
+        if use_temp:
+            css_dir.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                mode="w", prefix=_TEMP_INPUT_PREFIX, suffix=".css", dir=css_dir, delete=False
+            ) as temp_file:
+                temp_file.write(css_input)
+                input_file = Path(temp_file.name)
 
+        try:
             cmd = [
                 str(binary_path),
                 "-i",
                 str(input_file),
                 "-o",
-                str(self.config.css_output_absolute),
+                str(output),
             ]
 
             if mode == BuildMode.PRODUCTION:
@@ -161,28 +588,282 @@ class CSSBuilder:
                 timeout=60,
                 cwd=self.config.project_root,
             )
+        finally:
+            if use_temp:
+                input_file.unlink(missing_ok=True)
 
-            if result.returncode != 0:
-                return BuildResult(
-                    success=False,
-                    error_message=result.stderr or "Unknown error",
-                )
+        return None if result.returncode == 0 else result.stderr or "Unknown error"
 
-            build_time = time.time() - start_time
-            css_size = None
-            if self.config.css_output_absolute.exists():
-                css_size = self.config.css_output_absolute.stat().st_size
+    def build(self, mode: BuildMode = BuildMode.DEVELOPMENT) -> BuildResult:
+        start_time = time.time()
+        phases: dict[str, float] = {}
+
+        try:
+            with _timed(phases, "binary"):
+                binary_path = self.binary_manager.get_binary()
+            with _timed(phases, "input"):
+                css_input, css_dir, input_file = self._input()
+
+            with _timed(phases, "cache"):
+                key = self._cache_key(binary_path, css_input, css_dir, mode) if self.cache else None
+                restored = self._restore(key, start_time) if key else None
+            if restored:
+                restored.phases = phases
+                return restored
+
+            output = self.config.css_output_absolute
+            with _timed(phases, "tailwind"):
+                message = self._run(binary_path, css_input, css_dir, input_file, output, mode)
+            if message is not None:
+                return BuildResult(success=False, error_message=message, phases=phases)
+
+            with _timed(phases, "stat"):
+                css_size = output.stat().st_size if output.exists() else None
+            if css_size is not None and key:
+                with _timed(phases, "cache"):
+                    self._store(key)
 
             return BuildResult(
                 success=True,
-                css_path=self.config.css_output_absolute,
-                build_time=build_time,
+                css_path=output,
+                build_time=time.time() - start_time,
                 css_size_bytes=css_size,
+                phases=phases,
+            )
+
+        except Exception as e:
+            return BuildResult(success=False, error_message=str(e), phases=phases)
+
+    def build_critical(
+        self, classes: Collection[str], output: Path, mode: BuildMode = BuildMode.PRODUCTION
+    ) -> BuildResult:
+        """Build a stylesheet with the theme and base layers but only the utilities in ``classes``."""
+        start_time = time.time()
+
+        try:
+            binary_path = self.binary_manager.get_binary()
+            css_input, css_dir, _ = self._input()
+            output.parent.mkdir(parents=True, exist_ok=True)
+
+            critical = critical_input(css_input, classes)
+            if (message := self._run(binary_path, critical, css_dir, None, output, mode)) is not None:
+                return BuildResult(success=False, error_message=message)
+
+            return BuildResult(
+                success=True,
+                css_path=output,
+                build_time=time.time() - start_time,
+                css_size_bytes=output.stat().st_size if output.exists() else None,
             )
 
         except Exception as e:
             return BuildResult(success=False, error_message=str(e))
 
-        finally:
-            if use_temp and input_file:
-                input_file.unlink(missing_ok=True)
+
+def build_targets(
+    targets: dict[str, ProjectConfig],
+    mode: BuildMode = BuildMode.DEVELOPMENT,
+    *,
+    cache: bool = True,
+    jobs: int | None = None,
+    outputs: Collection[Path] = (),
+) -> dict[str, BuildResult]:
+    """Build several targets concurrently, stopping at the first failure.
+
+    Each target is a Tailwind subprocess, so threads are enough to overlap them and
+    wall-clock time follows the slowest target. Once one fails, targets that have not
+    started are cancelled and left out of the result; running ones are allowed to finish.
+    Every target's output, plus any in ``outputs``, is excluded from every target's
+    sources, since siblings rewrite theirs while the others hash the tree.
+    """
+    if not targets:
+        return {}
+    # Mostly waiting on subprocesses, so the default oversubscribes like ThreadPoolExecutor's own
+    workers = max(1, min(jobs or (os.cpu_count() or 1) + 4, len(targets)))
+    # Resolve (and, if needed, download) the binary once rather than racing on the lock
+    binary = TailwindBinaryManager().get_binary()
+    if cache:
+        binary_digest(binary)  # hash once up front instead of once per thread
+    outputs = [*outputs, *(config.css_output_absolute for config in targets.values())]
+
+    results: dict[str, BuildResult] = {}
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="starui-build") as pool:
+        futures = {
+            pool.submit(CSSBuilder(config, cache=cache, outputs=outputs).build, mode): name
+            for name, config in targets.items()
+        }
+        for future in as_completed(futures):
+            results[futures[future]] = result = future.result()
+            if not result.success:
+                for other in futures:
+                    other.cancel()
+                break
+
+    # Targets already running when the failure landed have finished by now
+    for future, name in futures.items():
+        if name not in results and future.done() and not future.cancelled():
+            results[name] = future.result()
+    return {name: results[name] for name in targets if name in results}
+
+
+def build_report(results: dict[str, BuildResult], mode: BuildMode, root: Path) -> dict:
+    """Metrics for ``--report json``.
+
+    The shape is fixed by BUILD_REPORT_SCHEMA: every target lists every phase (null
+    when it didn't run) and sizes in bytes, so reports from two commits diff cleanly.
+    """
+    targets = {}
+    for name, result in results.items():
+        sizes: dict[str, int | None] = {"raw": result.css_size_bytes, "gzip": None, "brotli": None}
+        output = None
+        if result.css_path is not None:
+            output = (
+                result.css_path.relative_to(root).as_posix()
+                if result.css_path.is_relative_to(root)
+                else str(result.css_path)
+            )
+            if result.success and result.css_path.exists():
+                compressed = _precompressed(result.css_path.read_bytes())
+                sizes["gzip"] = len(compressed[".gz"])
+                sizes["brotli"] = len(compressed[".br"]) if ".br" in compressed else None
+        targets[name] = {
+            "success": result.success,
+            "cache_hit": result.cache_hit,
+            "output": output,
+            "error": result.error_message,
+            "time": {
+                "total": None if result.build_time is None else round(result.build_time, 3),
+                **{phase: round(result.phases[phase], 3) if phase in result.phases else None for phase in BUILD_PHASES},
+            },
+            "size": sizes,
+        }
+    return {"schema": BUILD_REPORT_SCHEMA, "mode": mode.value, "targets": targets}
+
+
+_THEME_INLINE_RE = re.compile(r"@theme\s+inline\s*\{[^}]*\}")
+_THEME_COLOR_RE = re.compile(r"--color-([\w-]+)\s*:\s*var\(\s*--([\w-]+)\s*\)")
+_VAR_REF_RE = re.compile(r"var\(\s*--([\w-]+)")
+_APPLY_RE = re.compile(r"@apply\s+([^;]+);")
+
+
+def unused_theme_variables(css_input: str, sources: Iterable[str]) -> set[str]:
+    """Custom properties that back ``@theme inline`` colors no source uses.
+
+    A ``--color-chart-1: var(--chart-1)`` mapping keeps ``--chart-1`` alive when any
+    source mentions a ``*-chart-1`` class or ``var(--chart-1)``. Properties that no
+    color mapping points to (``--radius``, fonts) are never candidates.
+    """
+    mappings: dict[str, str] = {}
+    for block in _THEME_INLINE_RE.findall(css_input):
+        mappings.update(_THEME_COLOR_RE.findall(block))
+    if not mappings:
+        return set()
+
+    # Longest first so bg-sidebar-primary doesn't count as a use of "sidebar"
+    names = sorted(mappings, key=len, reverse=True)
+    token_re = re.compile(rf"-({'|'.join(map(re.escape, names))})(?![\w-])")
+
+    own = _THEME_INLINE_RE.sub("", css_input)
+    used = set(token_re.findall(" ".join(_APPLY_RE.findall(own))))
+    referenced = set(_VAR_REF_RE.findall(own))
+    for text in sources:
+        used.update(token_re.findall(text))
+        referenced.update(_VAR_REF_RE.findall(text))
+
+    kept = referenced | {mappings[name] for name in used}
+    return {var for var in mappings.values() if var not in kept}
+
+
+def shake_theme(css_input: str, sources: Iterable[str]) -> str:
+    """Drop unused theme color variables and their ``--color-*`` mappings from build input."""
+    unused = unused_theme_variables(css_input, sources)
+    if not unused:
+        return css_input
+
+    names = "|".join(map(re.escape, sorted(unused)))
+    # Whole-line declarations first so no blank lines are left behind, then inline ones
+    line = re.compile(rf"^[ \t]*--(?:color-)?(?:{names})\s*:[^;{{}}]*;[ \t]*\n", re.MULTILINE)
+    inline = re.compile(rf"(?<![\w-])--(?:color-)?(?:{names})\s*:[^;{{}}]*;[ \t]*")
+    return inline.sub("", line.sub("", css_input))
+
+
+_TAILWIND_IMPORT_RE = re.compile(r"""@import\s+(["'])tailwindcss\1(?:\s+source\([^)]*\))?""")
+_SOURCE_RULE_RE = re.compile(r"""^[ \t]*@source\s+(?!not\b)[^;]*;[ \t]*\n?""", re.MULTILINE)
+
+
+def critical_input(css_input: str, classes: Collection[str]) -> str:
+    """Rewrite build input so Tailwind skips source detection and generates only ``classes``.
+
+    Theme variables, ``@layer base`` and unlayered component styles are kept;
+    ``@source`` paths are dropped in favor of a single ``@source inline(...)``.
+    """
+    css = _TAILWIND_IMPORT_RE.sub('@import "tailwindcss" source(none)', css_input, count=1)
+    css = _SOURCE_RULE_RE.sub("", css)
+    # inline() brace-expands its argument, and quotes would end it
+    candidates = " ".join(sorted(c for c in classes if not any(ch in c for ch in '"\\{}')))
+    return f'{css}\n@source inline("{candidates}");\n'
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+_brotli_warned = False
+
+
+def _precompressed(data: bytes, *, warn: bool = False) -> dict[str, bytes]:
+    """Gzip and, when the optional ``brotli`` package is installed, brotli variants of ``data``.
+
+    With ``warn``, a missing ``brotli`` is reported once per process, since the
+    fingerprinted stylesheet then ships without its ``.br`` sibling.
+    """
+    global _brotli_warned
+    variants = {".gz": gzip.compress(data, compresslevel=9, mtime=0)}
+    try:
+        import brotli
+    except ImportError:
+        if warn and not _brotli_warned:
+            _brotli_warned = True
+            logger.warning("brotli is not installed; skipping .br output (pip install 'starui[compress]')")
+        else:
+            logger.debug("brotli not installed; skipping .br output")
+    else:
+        variants[".br"] = brotli.compress(data, quality=11)
+    return variants
+
+
+def fingerprint_css(css_path: Path) -> Path:
+    """Copy a built stylesheet to a content-hashed name with ``.gz``/``.br`` siblings.
+
+    ``static/css/starui.css`` becomes ``static/css/starui.<hash>.css`` and is
+    recorded in ``static/css/assets.json`` as ``{"starui.css": "starui.<hash>.css"}``.
+    Older fingerprints of the same stylesheet are removed. ``.br`` needs the
+    optional ``brotli`` package (``starui[compress]``); without it a warning is logged.
+    """
+    data = css_path.read_bytes()
+    digest = hashlib.sha256(data).hexdigest()[:FINGERPRINT_LENGTH]
+    hashed = css_path.with_name(f"{css_path.stem}.{digest}{css_path.suffix}")
+
+    _write_atomic(hashed, data)
+    for suffix, compressed in _precompressed(data, warn=True).items():
+        _write_atomic(hashed.with_name(hashed.name + suffix), compressed)
+
+    stale = re.compile(
+        rf"{re.escape(css_path.stem)}\.[0-9a-f]{{{FINGERPRINT_LENGTH}}}{re.escape(css_path.suffix)}(\.gz|\.br)?"
+    )
+    for path in css_path.parent.iterdir():
+        if stale.fullmatch(path.name) and not path.name.startswith(hashed.name):
+            path.unlink(missing_ok=True)
+
+    manifest_path = css_path.with_name(ASSET_MANIFEST)
+    try:
+        manifest = json.loads(manifest_path.read_text())
+    except (OSError, ValueError):
+        manifest = {}
+    if not isinstance(manifest, dict):
+        manifest = {}
+    manifest[css_path.name] = hashed.name
+    _write_atomic(manifest_path, (json.dumps(manifest, indent=2, sort_keys=True) + "\n").encode())
+    return hashed
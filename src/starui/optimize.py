@@ -0,0 +1,189 @@
+"""Build-time folding of static cn()/cva() calls in installed components."""
+
+import ast
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from .utils import cn, cva
+
+_MAX_PASSES = 8
+
+
+def _quote(value: str) -> str:
+    return f'"{value}"' if '"' not in value and "\\" not in value and "\n" not in value else repr(value)
+
+
+def _imported_cn_names(tree: ast.Module) -> set[str]:
+    """Local names bound to cn imported from a utils module or starui."""
+    names: set[str] = set()
+    for node in tree.body:
+        if isinstance(node, ast.ImportFrom) and node.module and node.module.split(".")[-1] in ("utils", "starui"):
+            names.update(alias.asname or alias.name for alias in node.names if alias.name == "cn")
+    return names
+
+
+def _literal(node: ast.expr) -> Any:
+    try:
+        return ast.literal_eval(node)
+    except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+        raise ValueError from None
+
+
+def _variant_functions(tree: ast.Module) -> dict[str, Callable[..., str]]:
+    """Module-level ``name = cva(...)`` assignments whose arguments are all literals."""
+    functions: dict[str, Callable[..., str]] = {}
+    for node in tree.body:
+        if not (
+            isinstance(node, ast.Assign)
+            and len(node.targets) == 1
+            and isinstance(node.targets[0], ast.Name)
+            and isinstance(node.value, ast.Call)
+            and isinstance(node.value.func, ast.Name)
+            and node.value.func.id == "cva"
+        ):
+            continue
+        call = node.value
+        try:
+            args = [_literal(a) for a in call.args]
+            kwargs = {kw.arg: _literal(kw.value) for kw in call.keywords if kw.arg and kw.arg != "precompile"}
+        except ValueError:
+            continue
+        if any(kw.arg is None for kw in call.keywords):
+            continue
+        functions[node.targets[0].id] = cva(*args, **kwargs)
+    return functions
+
+
+def _fold(call: ast.Call, cn_names: set[str], variants: dict[str, Callable[..., str]]) -> str | None:
+    if not isinstance(call.func, ast.Name):
+        return None
+
+    if call.func.id in cn_names:
+        if call.keywords or not all(
+            isinstance(a, ast.Constant) and (a.value is None or isinstance(a.value, str | bool)) for a in call.args
+        ):
+            return None
+        return cn(*(a.value for a in call.args if isinstance(a, ast.Constant)))
+
+    if (fn := variants.get(call.func.id)) is not None:
+        # Only non-empty string props: registry copies of cva differ on falsy values
+        if call.args or not all(
+            kw.arg and isinstance(kw.value, ast.Constant) and isinstance(kw.value.value, str) and kw.value.value
+            for kw in call.keywords
+        ):
+            return None
+        return fn(**{kw.arg: kw.value.value for kw in call.keywords if kw.arg and isinstance(kw.value, ast.Constant)})
+
+    return None
+
+
+def _fold_pass(src: str) -> tuple[str, int]:
+    tree = ast.parse(src)
+    cn_names = _imported_cn_names(tree)
+    variants = _variant_functions(tree)
+    if not cn_names and not variants:
+        return src, 0
+
+    data = src.encode("utf-8")
+    line_starts = [0]
+    for line in data.splitlines(keepends=True):
+        line_starts.append(line_starts[-1] + len(line))
+
+    spans: list[tuple[int, int, str]] = []
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call) or node.end_lineno is None:
+            continue
+        folded = _fold(node, cn_names, variants)
+        if folded is None:
+            continue
+        start = line_starts[node.lineno - 1] + node.col_offset
+        end = line_starts[node.end_lineno - 1] + (node.end_col_offset or 0)
+        spans.append((start, end, folded))
+
+    # Outer spans sort first; anything nested inside an already-folded span is skipped
+    spans.sort(key=lambda s: (s[0], -s[1]))
+    parts: list[bytes] = []
+    last_end = 0
+    count = 0
+    for start, end, folded in spans:
+        if start < last_end:
+            continue
+        parts.append(data[last_end:start])
+        parts.append(_quote(folded).encode("utf-8"))
+        last_end = end
+        count += 1
+    parts.append(data[last_end:])
+    return b"".join(parts).decode("utf-8"), count
+
+
+def _exported_names(tree: ast.Module) -> set[str]:
+    names: set[str] = set()
+    for node in tree.body:
+        if (
+            isinstance(node, ast.Assign)
+            and any(isinstance(t, ast.Name) and t.id == "__all__" for t in node.targets)
+            and isinstance(node.value, ast.List | ast.Tuple)
+        ):
+            names.update(e.value for e in node.value.elts if isinstance(e, ast.Constant) and isinstance(e.value, str))
+    return names
+
+
+def _drop_unused_cn_import(src: str) -> str:
+    """Remove cn from its import once folding has replaced every call to it."""
+    tree = ast.parse(src)
+    cn_names = _imported_cn_names(tree)
+    used = {node.id for node in ast.walk(tree) if isinstance(node, ast.Name)} | _exported_names(tree)
+    if not (unused := cn_names - used):
+        return src
+
+    lines = src.splitlines(keepends=True)
+    for node in reversed(tree.body):
+        if not isinstance(node, ast.ImportFrom) or not any(
+            alias.name == "cn" and (alias.asname or alias.name) in unused for alias in node.names
+        ):
+            continue
+        kept = [alias for alias in node.names if not (alias.name == "cn" and (alias.asname or alias.name) in unused)]
+        start, end = node.lineno - 1, node.end_lineno or node.lineno
+        # Anything sharing the import's lines (``import x; from .utils import cn``) is left alone
+        if lines[start][: node.col_offset].strip() or lines[end - 1][node.end_col_offset or 0 :].strip():
+            continue
+        indent = lines[start][: node.col_offset]
+        if not kept:
+            replacement = []
+        else:
+            source = "." * node.level + (node.module or "")
+            names = [f"{a.name} as {a.asname}" if a.asname else a.name for a in kept]
+            if end - start > 1:
+                body = "".join(f"{indent}    {name},\n" for name in names)
+                replacement = [f"{indent}from {source} import (\n{body}{indent})\n"]
+            else:
+                replacement = [f"{indent}from {source} import {', '.join(names)}\n"]
+        lines[start:end] = replacement
+    return "".join(lines)
+
+
+def optimize_source(src: str) -> tuple[str, int]:
+    """Fold literal-only cn()/cva() calls into merged string constants. Returns (source, folded count).
+
+    A ``cn`` import left without callers is removed so the result passes linters (F401).
+    """
+    total = 0
+    for _ in range(_MAX_PASSES):
+        src, count = _fold_pass(src)
+        if not count:
+            break
+        total += count
+    if total:
+        src = _drop_unused_cn_import(src)
+    ast.parse(src)  # never hand back a broken module
+    return src, total
+
+
+def optimize_file(path: Path, *, check: bool = False) -> int:
+    """Optimize a file in place. Returns the number of folded calls."""
+    src = path.read_text()
+    optimized, count = optimize_source(src)
+    if count and not check:
+        path.write_text(optimized)
+    return count
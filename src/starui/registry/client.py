@@ -1,10 +1,18 @@
 import json
 import logging
+import os
+import shutil
+import tarfile
+import tempfile
 import time
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
 from pathlib import Path
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from .checksum import compute_checksum
 from .manifest import SECTIONS, ItemKind
@@ -12,15 +20,31 @@ from .manifest import SECTIONS, ItemKind
 logger = logging.getLogger(__name__)
 
 GITHUB_RAW_BASE = "https://raw.githubusercontent.com/banditburai/starUI"
+GITHUB_ARCHIVE_BASE = "https://codeload.github.com/banditburai/starUI/tar.gz"
 INDEX_TTL_SECONDS = 3600
+FETCH_WORKERS = 8
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+@cache
+def get_session() -> requests.Session:
+    """Process-wide session so registry fetches reuse keep-alive connections."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=2, pool_maxsize=FETCH_WORKERS)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
 
 
 class RegistryClient:
-    def __init__(self, version: str = "main") -> None:
+    def __init__(self, version: str = "main", snapshot: bool | None = None) -> None:
         self.version = version
         self.cache_dir = Path.home() / ".starui" / "cache" / "registry" / version
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # One archive download instead of a request per file; tags can't change under us
+        self.snapshot = self._is_immutable if snapshot is None else snapshot
         self._index: dict[str, Any] | None = None
+        self._sources: dict[tuple[ItemKind, str], str] = {}
 
     @property
     def _is_immutable(self) -> bool:
@@ -31,7 +55,7 @@ class RegistryClient:
         return f"{GITHUB_RAW_BASE}/{self.version}/registry"
 
     def _fetch_url(self, url: str) -> str:
-        resp = requests.get(url, timeout=30)
+        resp = get_session().get(url, timeout=30)
         resp.raise_for_status()
         return resp.text
 
@@ -63,6 +87,12 @@ class RegistryClient:
                 except (json.JSONDecodeError, OSError):
                     pass
 
+        if self.snapshot:
+            try:
+                return self._set_index(self._download_snapshot())
+            except (requests.RequestException, tarfile.TarError, OSError, ValueError) as e:
+                logger.warning("Registry snapshot unavailable, fetching files individually: %s", e)
+
         url = f"{self._base_url}/index.json"
         try:
             text = self._fetch_url(url)
@@ -80,6 +110,66 @@ class RegistryClient:
                 f"Cannot fetch registry index from {url}. Check your network connection or try again later."
             ) from e
 
+    def _download_snapshot(self) -> dict[str, Any]:
+        """Fetch this version's repository archive and unpack the registry into the cache.
+
+        Sources are staged first and moved into place one file at a time with index.json
+        last, so a reader never sees an index pointing at files that aren't there yet.
+        Files whose checksum doesn't match the index are skipped and fetched on demand.
+        """
+        staging = Path(tempfile.mkdtemp(prefix=".snapshot-", dir=self.cache_dir))
+        try:
+            archive = staging / "registry.tar.gz"
+            resp = get_session().get(f"{GITHUB_ARCHIVE_BASE}/{self.version}", stream=True, timeout=60)
+            try:
+                resp.raise_for_status()
+                with archive.open("wb") as f:
+                    for chunk in resp.iter_content(DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
+            finally:
+                resp.close()
+
+            with tarfile.open(archive, "r:gz") as tar:
+                # Members live under a single top-level "<repo>-<ref>/" directory
+                members = {m.name.partition("/")[2]: m for m in tar.getmembers() if m.isfile()}
+                if "registry/index.json" not in members:
+                    raise ValueError(f"no registry/index.json in the {self.version} archive")
+                index_text = self._read_member(tar, members["registry/index.json"]).decode("utf-8")
+                index = json.loads(index_text)
+
+                staged: list[tuple[Path, Path]] = []
+                for kind, section in SECTIONS.items():
+                    for name, entry in index.get(section, {}).items():
+                        member = members.get(f"registry/{entry.get('file')}")
+                        if member is None:
+                            continue
+                        data = self._read_member(tar, member)
+                        if compute_checksum(data) != entry.get("checksum"):
+                            logger.warning("Checksum mismatch for %s '%s' in registry archive", kind, name)
+                            continue
+                        cache_name = entry.get("install_name", name) if kind == "block" else name
+                        tmp = staging / section / f"{cache_name}.py"
+                        tmp.parent.mkdir(parents=True, exist_ok=True)
+                        tmp.write_bytes(data)
+                        staged.append((tmp, self.cache_dir / section / f"{cache_name}.py"))
+
+            for tmp, target in staged:
+                target.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(tmp, target)
+            (staging / "index.json").write_text(index_text)
+            os.replace(staging / "index.json", self.cache_dir / "index.json")
+            (self.cache_dir / "index.meta.json").write_text(json.dumps({"fetched_at": time.time(), "snapshot": True}))
+            return index
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+    @staticmethod
+    def _read_member(tar: tarfile.TarFile, member: tarfile.TarInfo) -> bytes:
+        f = tar.extractfile(member)
+        if f is None:
+            raise ValueError(f"Cannot read {member.name} from registry archive")
+        return f.read()
+
     def _fetch_source(self, entry: dict[str, Any], cache_subdir: str, cache_name: str, label: str) -> str:
         cached_file = self.cache_dir / cache_subdir / f"{cache_name}.py"
 
@@ -113,9 +203,38 @@ class RegistryClient:
         return sorted(n for n in names if n != "utils") if kind == "component" else sorted(names)
 
     def get_source(self, name: str, kind: ItemKind = "component") -> str:
+        if (source := self._sources.get((kind, name))) is not None:
+            return source
         entry = self._get_entry(name, kind)
         cache_name = entry.get("install_name", name) if kind == "block" else name
-        return self._fetch_source(entry, SECTIONS[kind], cache_name, f"{kind} '{name}'")
+        source = self._sources[kind, name] = self._fetch_source(entry, SECTIONS[kind], cache_name, f"{kind} '{name}'")
+        return source
+
+    def prefetch(self, items: Iterable[tuple[str, ItemKind]]) -> None:
+        """Load the sources of ``items`` and their dependency closures concurrently.
+
+        Later get_source() calls for any of them are answered from memory, so
+        installing several items costs one round of parallel requests, not one per file.
+        ``utils`` is always included, since every installed component imports it.
+        """
+        wanted: dict[tuple[ItemKind, str], None] = {}
+        for name, kind in items:
+            wanted |= dict.fromkeys(("component", dep) for dep in self.resolve_dependencies(name, kind))
+            wanted[kind, name] = None
+        if wanted and "utils" in self._get_index()[SECTIONS["component"]]:
+            wanted["component", "utils"] = None
+        missing = [key for key in wanted if key not in self._sources]
+        if len(missing) < 2:
+            for kind, name in missing:
+                self.get_source(name, kind)
+            return
+
+        with ThreadPoolExecutor(
+            max_workers=min(FETCH_WORKERS, len(missing)), thread_name_prefix="starui-fetch"
+        ) as pool:
+            futures = [pool.submit(self.get_source, name, kind) for kind, name in missing]
+            for future in futures:
+                future.result()
 
     def get_metadata(self, name: str, kind: ItemKind = "component") -> dict[str, Any]:
         return self._get_entry(name, kind)
@@ -143,6 +262,7 @@ class RegistryClient:
 
     def get_with_dependencies(self, name: str, kind: ItemKind = "component") -> tuple[dict[str, str], str]:
         """For components, deps excludes self. For blocks, deps are component dependencies."""
+        self.prefetch([(name, kind)])
         deps = {n: self.get_source(n) for n in self.resolve_dependencies(name, kind) if n != name}
         return deps, self.get_source(name, kind)
 
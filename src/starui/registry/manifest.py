@@ -64,6 +64,13 @@ class Manifest:
             "file": file_path,
         }
 
+    def record_optimized(self, name: str, checksum: str, folded: int, kind: ItemKind = "component") -> None:
+        """Mark an installed item as rewritten by `star optimize`. In-memory only — call save() to persist."""
+        record = self._load()[SECTIONS[kind]].get(name)
+        if record is not None:
+            previous = record.get("optimized", {}).get("folded", 0)
+            record["optimized"] = {"checksum": checksum, "folded": previous + folded}
+
     def get_installed(self, kind: ItemKind = "component") -> dict[str, dict[str, str]]:
         return self._load()[SECTIONS[kind]]
 
@@ -76,11 +83,15 @@ class Manifest:
                 return candidate
         return component_dir / f"{name}.py"
 
-    def _is_modified(self, record: dict[str, str] | None, name: str, component_dir: Path) -> bool:
+    def _is_modified(self, record: dict[str, Any] | None, name: str, component_dir: Path) -> bool:
         if not record:
             return False
         local_file = self.resolve_path(record, name, component_dir)
-        return not local_file.exists() or compute_checksum(local_file) != record.get("checksum", "")
+        if not local_file.exists():
+            return True
+        # An optimized file is pristine as long as it still matches what `star optimize` wrote
+        accepted = {record.get("checksum", ""), record.get("optimized", {}).get("checksum", "")}
+        return compute_checksum(local_file) not in accepted - {""}
 
     def is_modified(self, name: str, component_dir: Path, kind: ItemKind = "component") -> bool:
         return self._is_modified(self.get_installed(kind).get(name), name, component_dir)
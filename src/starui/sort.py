@@ -1,21 +1,70 @@
 """Tailwind class sorting engine."""
 
+import hashlib
+import json
+import os
 import re
 import subprocess
 import tempfile
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from functools import partial
 from pathlib import Path
+from typing import NamedTuple
 
-from .css import TailwindBinaryManager
+from . import __version__
+from .css import TailwindBinaryManager, binary_fingerprint
 from .templates import TAILWIND_CSS_TEMPLATE
 
-_STRING_RE = re.compile(r'"[^"\n\\]*(?:\\.[^"\n\\]*)*"|\'[^\'\n\\]*(?:\\.[^\'\n\\]*)*\'')
+# Next comment, triple-quote opening, complete single-line literal, or unterminated quote.
+# Every alternative starts with a literal character, so re skips ahead without trying each position.
+_LEX_RE = re.compile(
+    r"#[^\n]*|'''|\"\"\""
+    r"|\"[^\"\n\\]*+(?:\\.[^\"\n\\]*+)*+\"|'[^'\n\\]*+(?:\\.[^'\n\\]*+)*+'"
+    r"|\"|'",
+    re.S,
+)
+# Literal bodies after the opening quote, up to and including the closing quote
+_BODY_RE = {
+    '"': re.compile(r'[^"\n\\]*+(?:\\.[^"\n\\]*+)*+"', re.S),
+    "'": re.compile(r"[^'\n\\]*+(?:\\.[^'\n\\]*+)*+'", re.S),
+    '"""': re.compile(r'[^"\\]*+(?:(?:\\.|"(?!""))[^"\\]*+)*+"""', re.S),
+    "'''": re.compile(r"[^'\\]*+(?:(?:\\.|'(?!''))[^'\\]*+)*+'''", re.S),
+}
+# Characters that matter inside an f/t-string; everything else is skipped in C
+_INTERPOLATED_STOP_RE = re.compile(r"[{}\\'\"\n]")
+_PREFIX_CHARS = frozenset("rRbBuUfFtT")
+_INTERPOLATING = frozenset("fFtT")
 _SELECTOR_RE = re.compile(r"\.((?:[^{}\s:,>+~\[\]\\]|\\.)+)")
 
+SORT_CACHE_FILE = ".starui/sort-cache.json"
+
 THRESHOLD = 0.6
+# Below this many files, process start-up costs more than it saves
+_PARALLEL_MIN_FILES = 32
+
+
+class _Scan(NamedTuple):
+    """One file read and tokenized once; kept for the rewrite phase."""
+
+    path: Path
+    src: str
+    spans: list[tuple[int, int]]
+    tokens: set[str]
+    digest: str
+
+
+class _Result(NamedTuple):
+    changed: bool
+    digest: str | None  # hash of the file's sorted content; None if it still needs sorting
 
 
 def tokenize(s: str) -> list[str]:
     """Bracket-aware whitespace splitter for Tailwind class strings."""
+    if "[" not in s and "(" not in s:
+        return s.split()
+
     tokens: list[str] = []
     i, n = 0, len(s)
     while i < n:
@@ -35,23 +84,125 @@ def tokenize(s: str) -> list[str]:
     return tokens
 
 
-def _is_fstring(src: str, pos: int) -> bool:
-    i = pos - 1
-    while i >= 0 and src[i] in "fFrRbBuU":
-        if src[i] in "fF":
-            return True
-        i -= 1
-    return False
+def _prefix(src: str, quote_start: int) -> str:
+    """String prefix right before an opening quote; empty when the letters end an identifier."""
+    start = quote_start
+    while start > quote_start - 2 and start > 0 and src[start - 1] in _PREFIX_CHARS:
+        start -= 1
+    if start > 0 and (src[start - 1].isalnum() or src[start - 1] == "_"):
+        return ""
+    return src[start:quote_start]
+
+
+def _interpolated_end(src: str, i: int, quote: str) -> int:
+    """End of an f/t-string body starting at ``i``, stepping over nested literals in replacement fields."""
+    n = len(src)
+    depth = 0
+    stop = _INTERPOLATED_STOP_RE.search
+    while m := stop(src, i):
+        i = m.start()
+        c = src[i]
+        if c == "\\":
+            i += 2
+            continue
+        if depth == 0:
+            if src.startswith(quote, i):
+                return i + len(quote)
+            if c == "\n" and len(quote) == 1:
+                return i
+            if c in "'\"":
+                i += 1
+                continue
+            if c == "{":
+                if src.startswith("{{", i):
+                    i += 2
+                    continue
+                depth = 1
+        elif c == "{":
+            depth += 1
+        elif c == "}":
+            depth -= 1
+        elif c in "'\"":
+            # Python 3.12 allows any quote inside a replacement field
+            nested = c * 3 if src.startswith(c * 3, i) else c
+            i = _literal_end(src, i + len(nested), nested, _prefix(src, i))
+            continue
+        i += 1
+    return n
+
+
+def _literal_end(src: str, body: int, quote: str, prefix: str) -> int:
+    if not _INTERPOLATING.isdisjoint(prefix):
+        return _interpolated_end(src, body, quote)
+    if m := _BODY_RE[quote].match(src, body):
+        return m.end()
+    # Unterminated: a single-quoted literal stops at the line end, a triple-quoted one at EOF
+    end = src.find("\n", body) if len(quote) == 1 else -1
+    return len(src) if end < 0 else end
+
+
+def _string_literals(src: str) -> Iterator[tuple[int, int, int, bool]]:
+    """Single forward pass over Python source yielding every string literal outside comments.
+
+    Yields ``(start, end, quote_len, interpolated)`` where ``src[start:end]`` runs from the
+    opening to the closing quote (prefix excluded) and ``interpolated`` marks f/t-strings.
+    """
+    pos = 0
+    search = _LEX_RE.search
+    while m := search(src, pos):
+        start, end = m.span()
+        c = src[start]
+        if c == "#":
+            pos = end
+            continue
+
+        prefix = _prefix(src, start) if start and src[start - 1] in _PREFIX_CHARS else ""
+        interpolated = not _INTERPOLATING.isdisjoint(prefix)
+        if end - start == 3 and src[start + 1] == c == src[start + 2]:
+            quote_len = 3
+            pos = _literal_end(src, end, c * 3, prefix)
+        else:
+            quote_len = 1
+            if end - start == 1 or interpolated:
+                # Unterminated, or an f-string whose replacement fields may hold nested quotes
+                pos = _literal_end(src, start + 1, c, prefix)
+            else:
+                pos = end
+        yield start, pos, quote_len, interpolated
+
+
+def _digest(src: str) -> str:
+    return hashlib.sha256(src.encode()).hexdigest()
+
+
+def _scan_text(path: Path, src: str, digest: str = "") -> _Scan:
+    spans: list[tuple[int, int]] = []
+    tokens: set[str] = set()
+    for start, end, quote_len, interpolated in _string_literals(src):
+        if interpolated:
+            continue
+        content = src[start + quote_len : end - quote_len]
+        # Multi-line triple-quoted blocks are prose or embedded code, never a class list
+        if quote_len == 3 and "\n" in content:
+            continue
+        spans.append((start, end))
+        tokens.update(tokenize(content))
+    return _Scan(path, src, spans, tokens, digest)
+
+
+def _scan(path: Path, known_digest: str | None = None) -> _Scan:
+    src = path.read_text()
+    digest = _digest(src)
+    if digest == known_digest:
+        # Same content as at its last clean sort: nothing to tokenize or ship back
+        return _Scan(path, "", [], set(), digest)
+    return _scan_text(path, src, digest)
 
 
 def _extract_tokens(files: list[Path]) -> set[str]:
     tokens: set[str] = set()
     for path in files:
-        src = path.read_text()
-        for m in _STRING_RE.finditer(src):
-            if not _is_fstring(src, m.start()):
-                for tok in tokenize(m.group()[1:-1]):
-                    tokens.add(tok)
+        tokens |= _scan(path).tokens
     return tokens
 
 
@@ -109,9 +260,54 @@ def _build_sort_index(tokens: set[str], binary: Path) -> dict[str, int]:
         return index
 
 
+def _index_cache_path(binary: Path) -> Path:
+    """Cache file for one Tailwind binary + CSS template combination."""
+    key = hashlib.sha256(f"{binary_fingerprint(binary)}\0{TAILWIND_CSS_TEMPLATE}".encode()).hexdigest()[:16]
+    return Path.home() / ".starui" / "cache" / "sort" / f"{key}.json"
+
+
+def _read_index_cache(path: Path) -> tuple[dict[str, int], set[str]]:
+    try:
+        data = json.loads(path.read_text())
+        return dict(data["index"]), set(data["misses"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return {}, set()
+
+
+def _write_json(path: Path, data: object) -> None:
+    # Best effort: write-then-rename so concurrent runs (e.g. pre-commit) never read a torn file
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(json.dumps(data, separators=(",", ":")))
+        os.replace(tmp, path)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+
+
+def load_sort_index(tokens: set[str], binary: Path) -> dict[str, int]:
+    """Sort index covering ``tokens``, reusing the on-disk cache in ~/.starui/cache/sort.
+
+    When nothing is new, no subprocess runs at all. Otherwise the new tokens are built
+    together with every cached utility so the merged order stays globally consistent;
+    only tokens already known not to be utilities are left out.
+    """
+    path = _index_cache_path(binary)
+    index, misses = _read_index_cache(path)
+    new = tokens - index.keys() - misses
+    if not new:
+        return index
+
+    index = _build_sort_index(new | index.keys(), binary)
+    misses = (misses | new) - index.keys()
+    _write_json(path, {"index": index, "misses": sorted(misses)})
+    return index
+
+
 def _sort_string(raw: str, index: dict[str, int]) -> str:
-    quote = raw[0]
-    content = raw[1:-1]
+    q = 3 if len(raw) >= 6 and raw[:3] in ('"""', "'''") else 1
+    quote = raw[:q]
+    content = raw[q:-q]
     stripped = content.strip()
     if not stripped:
         return raw
@@ -133,37 +329,142 @@ def _sort_string(raw: str, index: dict[str, int]) -> str:
     return quote + leading + " ".join(sorted_known + unknown) + trailing + quote
 
 
-def sort_file(path: Path, index: dict[str, int], *, check: bool = False) -> bool:
-    """Sort class strings in a file. Returns True if changes were made/needed."""
-    src = path.read_text()
+def _rewrite(scan: _Scan, index: dict[str, int]) -> str | None:
+    """Sorted source, or None when every class string is already in order."""
+    src = scan.src
     parts: list[str] = []
     last_end = 0
-    changed = False
 
-    for m in _STRING_RE.finditer(src):
-        if _is_fstring(src, m.start()):
-            continue
-
-        original = m.group()
+    for start, end in scan.spans:
+        original = src[start:end]
         sorted_str = _sort_string(original, index)
-
         if sorted_str != original:
-            changed = True
+            parts.append(src[last_end:start])
+            parts.append(sorted_str)
+            last_end = end
 
-        parts.append(src[last_end : m.start()])
-        parts.append(sorted_str)
-        last_end = m.end()
+    if not parts:
+        return None
+    parts.append(src[last_end:])
+    return "".join(parts)
 
-    if changed and not check:
-        parts.append(src[last_end:])
-        path.write_text("".join(parts))
 
-    return changed
+def _apply(scan: _Scan, index: dict[str, int], check: bool) -> _Result:
+    # A file with no indexed token has nothing to reorder
+    if scan.tokens.isdisjoint(index):
+        return _Result(False, scan.digest)
+    sorted_src = _rewrite(scan, index)
+    if sorted_src is None:
+        return _Result(False, scan.digest)
+    if check:
+        return _Result(True, None)
+    scan.path.write_text(sorted_src)
+    return _Result(True, _digest(sorted_src))
 
 
-def sort_files(files: list[Path], *, check: bool = False) -> dict[Path, bool]:
-    """Sort Tailwind classes in all given files. Returns {path: changed}."""
+def sort_file(path: Path, index: dict[str, int], *, check: bool = False) -> bool:
+    """Sort class strings in a file. Returns True if changes were made/needed."""
+    return _apply(_scan(path), index, check).changed
+
+
+def _map[R](pool: ProcessPoolExecutor | None, fn: Callable[..., R], jobs: int, *iterables: Sequence) -> list[R]:
+    if pool is None:
+        return list(map(fn, *iterables))
+    # A few chunks per worker keeps IPC overhead low while still balancing uneven files
+    return list(pool.map(fn, *iterables, chunksize=max(1, len(iterables[0]) // (jobs * 4))))
+
+
+class _FileCache:
+    """Size, mtime and content hash of each file at its last clean sort.
+
+    Entries are only trusted when written under the same index fingerprint (Tailwind
+    binary, CSS template and StarUI version), since any of those can change the order.
+    """
+
+    def __init__(self, path: Path, fingerprint: str) -> None:
+        self.path = path
+        self.fingerprint = fingerprint
+        self.files: dict[str, list] = {}
+        self._dirty = False
+        try:
+            data = json.loads(path.read_text())
+            if data["fingerprint"] == fingerprint:
+                self.files = dict(data["files"])
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+    def lookup(self, path: Path) -> tuple[bool, str | None]:
+        """(unchanged since the last clean sort by size and mtime, content hash at that sort)."""
+        entry = self.files.get(str(path.resolve()))
+        if not entry:
+            return False, None
+        try:
+            stat = path.stat()
+        except OSError:
+            return False, None
+        size, mtime_ns, digest = entry
+        return (stat.st_size == size and stat.st_mtime_ns == mtime_ns), digest
+
+    def record(self, path: Path, digest: str) -> None:
+        stat = path.stat()
+        self.files[str(path.resolve())] = [stat.st_size, stat.st_mtime_ns, digest]
+        self._dirty = True
+
+    def save(self) -> None:
+        if self._dirty:
+            _write_json(self.path, {"fingerprint": self.fingerprint, "files": self.files})
+
+
+def sort_files(
+    files: list[Path], *, check: bool = False, jobs: int | None = None, cache_path: Path | None = None
+) -> dict[Path, bool]:
+    """Sort Tailwind classes in all given files. Returns {path: changed} in input order.
+
+    Each file is read and tokenized once; the scan is reused for the rewrite. Both phases
+    run across ``jobs`` worker processes (default: CPU count) for larger file sets. With
+    ``cache_path``, files unchanged since their last clean sort are skipped without being
+    read, and touched-but-identical files are skipped after hashing.
+    """
+    jobs = max(1, jobs or os.cpu_count() or 1)
     binary = TailwindBinaryManager().get_binary()
-    tokens = _extract_tokens(files)
-    index = _build_sort_index(tokens, binary)
-    return {path: sort_file(path, index, check=check) for path in files}
+    cache = _FileCache(cache_path, f"{_index_cache_path(binary).stem}:{__version__}") if cache_path else None
+
+    results = dict.fromkeys(files, False)
+    pending: list[Path] = []
+    known: list[str | None] = []
+    for path in files:
+        fresh, digest = cache.lookup(path) if cache else (False, None)
+        if not fresh:
+            pending.append(path)
+            known.append(digest)
+
+    parallel = jobs > 1 and len(pending) >= _PARALLEL_MIN_FILES
+    with ProcessPoolExecutor(max_workers=jobs) if parallel else nullcontext() as pool:
+        scans = _map(pool, _scan, jobs, pending, known)
+        tokens = set().union(*(s.tokens for s in scans))
+        index = load_sort_index(tokens, binary) if tokens else {}
+        applied = _map(pool, partial(_apply, index=index, check=check), jobs, scans)
+
+    for scan, result in zip(scans, applied, strict=True):
+        results[scan.path] = result.changed
+        if cache and result.digest:
+            cache.record(scan.path, result.digest)
+    if cache:
+        cache.save()
+    return results
+
+
+def changed_since(ref: str, cwd: Path | None = None) -> list[Path]:
+    """Files added or modified since the merge base of ``ref`` and HEAD, plus untracked files."""
+
+    def git(*args: str) -> str:
+        result = subprocess.run(["git", *args], capture_output=True, text=True, cwd=cwd)
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.strip() or f"git {args[0]} failed")
+        return result.stdout
+
+    top = Path(git("rev-parse", "--show-toplevel").strip())
+    base = git("merge-base", ref, "HEAD").strip()
+    names = git("diff", "--name-only", "--diff-filter=d", "-z", base).split("\0")
+    names += git("ls-files", "--others", "--exclude-standard", "--full-name", "-z").split("\0")
+    return sorted({top / name for name in names if name})
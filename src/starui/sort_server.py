@@ -0,0 +1,173 @@
+"""Long-running sort daemon for editor format-on-save integrations.
+
+Speaks newline-delimited JSON-RPC 2.0 over stdin/stdout or a Unix socket:
+
+    {"jsonrpc": "2.0", "id": 1, "method": "sort", "params": {"source": "...", "path": "app.py"}}
+    {"jsonrpc": "2.0", "id": 1, "result": {"source": "...", "changed": true}}
+
+Other methods: ``ping`` and ``shutdown``.
+"""
+
+import json
+import socketserver
+import threading
+from pathlib import Path
+from typing import IO, Any
+
+from .css import BinaryError, TailwindBinaryManager
+from .sort import _index_cache_path, _read_index_cache, _rewrite, _scan_text, load_sort_index
+
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+
+POLL_INTERVAL = 2.0
+
+
+class SortServer:
+    """Keeps the sort index in memory and answers sort requests against it.
+
+    Buffers whose tokens have all been seen are sorted without touching disk or
+    Tailwind. A background thread re-resolves the Tailwind binary and swaps in a
+    rebuilt index when it changes (upgrade, re-download, different binary on PATH).
+    """
+
+    def __init__(self, poll_interval: float = POLL_INTERVAL) -> None:
+        self.poll_interval = poll_interval
+        self.stopped = threading.Event()
+        self._lock = threading.Lock()
+        self._binary = TailwindBinaryManager().get_binary()
+        self._key = _index_cache_path(self._binary)
+        self._index, misses = _read_index_cache(self._key)
+        self._seen = self._index.keys() | misses
+        self._watcher: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self.poll_interval > 0 and self._watcher is None:
+            self._watcher = threading.Thread(target=self._watch, name="starui-sort-watch", daemon=True)
+            self._watcher.start()
+
+    def stop(self) -> None:
+        self.stopped.set()
+
+    def sort(self, source: str, path: str | None = None) -> tuple[str, bool]:
+        """Sorted buffer and whether it differs from ``source``."""
+        if path and not path.endswith((".py", ".pyi")):
+            return source, False
+
+        scan = _scan_text(Path(path or "<buffer>"), source)
+        index = self._index
+        if not scan.tokens <= self._seen:
+            with self._lock:
+                index = self._index = load_sort_index(scan.tokens | self._index.keys(), self._binary)
+                self._seen |= scan.tokens
+
+        if scan.tokens.isdisjoint(index):
+            return source, False
+        sorted_src = _rewrite(scan, index)
+        return (source, False) if sorted_src is None else (sorted_src, True)
+
+    def _watch(self) -> None:
+        while not self.stopped.wait(self.poll_interval):
+            try:
+                binary = TailwindBinaryManager().get_binary()
+                key = _index_cache_path(binary)
+            except (OSError, BinaryError):
+                continue
+            if key == self._key:
+                continue
+
+            # Build outside the lock; requests keep using the old index until the swap
+            tokens = set(self._seen)
+            try:
+                index = load_sort_index(tokens, binary)
+            except (OSError, RuntimeError):
+                continue
+            with self._lock:
+                self._binary, self._key, self._index = binary, key, index
+                # Tokens sort() added during the build aren't in the new index; forget them so they're indexed again
+                self._seen = tokens
+
+    def handle(self, message: Any) -> dict[str, Any] | None:
+        """Dispatch one JSON-RPC request. Returns None for notifications."""
+        if not isinstance(message, dict) or not isinstance(message.get("method"), str):
+            return _error(None, INVALID_REQUEST, "Invalid request")
+
+        msg_id = message.get("id")
+        params = message.get("params") or {}
+        method = message["method"]
+        try:
+            if method == "sort":
+                source, changed = self.sort(params["source"], params.get("path"))
+                result: Any = {"source": source, "changed": changed}
+            elif method == "ping":
+                result = "pong"
+            elif method == "shutdown":
+                self.stop()
+                result = None
+            else:
+                return _error(msg_id, METHOD_NOT_FOUND, f"Unknown method: {method}")
+        except (KeyError, TypeError, AttributeError) as e:
+            return _error(msg_id, INVALID_PARAMS, f"Invalid params: {e}")
+        except Exception as e:
+            return _error(msg_id, INTERNAL_ERROR, str(e))
+
+        if msg_id is None:
+            return None
+        return {"jsonrpc": "2.0", "id": msg_id, "result": result}
+
+    def handle_line(self, line: str) -> str | None:
+        try:
+            message = json.loads(line)
+        except ValueError:
+            response = _error(None, PARSE_ERROR, "Parse error")
+        else:
+            response = self.handle(message)
+        return None if response is None else json.dumps(response, separators=(",", ":"))
+
+
+def _error(msg_id: Any, code: int, message: str) -> dict[str, Any]:
+    return {"jsonrpc": "2.0", "id": msg_id, "error": {"code": code, "message": message}}
+
+
+def serve_stdio(server: SortServer, stdin: IO[str], stdout: IO[str]) -> None:
+    """Answer one request per line until EOF or ``shutdown``."""
+    server.start()
+    for line in stdin:
+        if not line.strip():
+            continue
+        if (response := server.handle_line(line)) is not None:
+            stdout.write(response + "\n")
+            stdout.flush()
+        if server.stopped.is_set():
+            break
+    server.stop()
+
+
+def serve_socket(server: SortServer, socket_path: Path) -> None:
+    """Serve the same protocol on a Unix socket; each connection may send many requests."""
+    if not hasattr(socketserver, "ThreadingUnixStreamServer"):
+        raise OSError("Unix sockets are not supported on this platform")
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self) -> None:
+            for raw in self.rfile:
+                line = raw.decode("utf-8", errors="replace")
+                if line.strip() and (response := server.handle_line(line)) is not None:
+                    self.wfile.write(response.encode() + b"\n")
+                    self.wfile.flush()
+                if server.stopped.is_set():
+                    threading.Thread(target=unix_server.shutdown, daemon=True).start()
+                    return
+
+    socket_path.unlink(missing_ok=True)
+    server.start()
+    with socketserver.ThreadingUnixStreamServer(str(socket_path), Handler) as unix_server:
+        unix_server.daemon_threads = True
+        try:
+            unix_server.serve_forever()
+        finally:
+            server.stop()
+            socket_path.unlink(missing_ok=True)
@@ -1,4 +1,10 @@
-from collections.abc import Callable
+import os
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from itertools import count, product
+from math import prod
 from typing import Any
 from uuid import uuid4
 
@@ -23,6 +29,29 @@ DEFAULT_THEME = "light"
 ALT_THEME = "dark"
 
 
+CN_CACHE_SIZE = 4096
+
+
+def _merge(classes: tuple[str, ...]) -> str:
+    return merge(*classes)
+
+
+_cached_merge = lru_cache(maxsize=CN_CACHE_SIZE)(_merge)
+
+
+def configure_cn_cache(maxsize: int = CN_CACHE_SIZE) -> None:
+    """Resize the cn() merge cache, dropping cached entries. ``maxsize=0`` disables caching."""
+    global _cached_merge
+    if maxsize < 0:
+        raise ValueError("maxsize must be >= 0")
+    _cached_merge = lru_cache(maxsize=maxsize)(_merge)
+
+
+def cn_cache_info():
+    """Hit/miss counters and current size of the cn() merge cache."""
+    return _cached_merge.cache_info()
+
+
 def cn(*classes: Any) -> str:
     """Merge Tailwind classes intelligently, resolving conflicts."""
     processed: list[str] = []
@@ -42,10 +71,21 @@ def cn(*classes: Any) -> str:
         else:
             processed.append(str(cls))
 
-    return merge(*processed) if processed else ""
+    # Conflict resolution only depends on the normalized strings, so memoize on those
+    return _cached_merge(tuple(processed)) if processed else ""
+
+
+MAX_PRECOMPILED_VARIANTS = 4096
 
 
-def cva(base: str = "", config: dict[str, Any] | None = None) -> Callable[..., str]:
+def cva(base: str = "", config: dict[str, Any] | None = None, *, precompile: bool = False) -> Callable[..., str]:
+    """Build a variant class resolver.
+
+    With ``precompile=True`` every combination of variant values (compound variants
+    included) is merged up front, so calls within the declared variants are a single
+    dict lookup. Anything else — unknown props, values outside the variant map —
+    falls back to resolving on the fly. Extra classes go through ``cls``.
+    """
     if config is None:
         config = {}
 
@@ -53,9 +93,8 @@ def cva(base: str = "", config: dict[str, Any] | None = None) -> Callable[..., s
     compound_variants = config.get("compoundVariants", [])
     default_variants = config.get("defaultVariants", {})
 
-    def variant_function(**props: Any) -> str:
+    def resolve(final_props: dict[str, Any]) -> str:
         classes = [base] if base else []
-        final_props = {**default_variants, **props}
 
         for variant_key, variant_values in variants.items():
             if (val := final_props.get(variant_key)) is not None and val in variant_values:
@@ -69,13 +108,190 @@ def cva(base: str = "", config: dict[str, Any] | None = None) -> Callable[..., s
 
         return cn(*classes)
 
-    return variant_function
+    if not precompile:
+
+        def variant_function(cls: Any = None, **props: Any) -> str:
+            resolved = resolve({**default_variants, **props})
+            return cn(resolved, cls) if cls else resolved
+
+        return variant_function
+
+    keys = tuple(variants)
+    if prod(len(variants[k]) for k in keys) > MAX_PRECOMPILED_VARIANTS:
+        raise ValueError(f"cva: more than {MAX_PRECOMPILED_VARIANTS} variant combinations to precompile")
+
+    table = {
+        combo: resolve({**default_variants, **dict(zip(keys, combo, strict=True))})
+        for combo in product(*(variants[k] for k in keys))
+    }
+    variant_keys = frozenset(keys)
+
+    def precompiled_function(cls: Any = None, **props: Any) -> str:
+        resolved = None
+        if variant_keys.issuperset(props):
+            resolved = table.get(tuple(props.get(k, default_variants.get(k)) for k in keys))
+        if resolved is None:
+            resolved = resolve({**default_variants, **props})
+        return cn(resolved, cls) if cls else resolved
+
+    return precompiled_function
+
+
+_BASE36 = "0123456789abcdefghijklmnopqrstuvwxyz"
+_id_counter: ContextVar[tuple[str, Iterator[int]] | None] = ContextVar("starui_id_counter", default=None)
+
+
+def _base36(n: int) -> str:
+    digits = ""
+    while True:
+        n, r = divmod(n, 36)
+        digits = _BASE36[r] + digits
+        if not n:
+            return digits
+
+
+@contextmanager
+def deterministic_ids(namespace: str = "") -> Iterator[None]:
+    """Scope in which gen_id() yields short sequential IDs, so identical renders produce identical HTML.
+
+    A ``namespace`` is prepended to every ID (``select_<namespace>_0``) so fragments
+    patched into a page rendered in another scope don't reuse the page's IDs.
+    """
+    token = _id_counter.set((namespace, count()))
+    try:
+        yield
+    finally:
+        _id_counter.reset(token)
+
+
+def id_scope() -> ContextVar[tuple[str, Iterator[int]] | None]:
+    """The context variable behind deterministic_ids(), for vendored copies of these utilities to share."""
+    return _id_counter
+
+
+class DeterministicIdMiddleware:
+    """ASGI middleware that gives each HTTP request its own deterministic_ids() scope.
+
+    Datastar requests (SSE patches, fragments) get a random per-request namespace:
+    their IDs land in a page that already holds ``select_0`` and friends.
+    """
+
+    def __init__(self, app: Any) -> None:
+        self.app = app
+
+    async def __call__(self, scope: dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        is_datastar = (b"datastar-request", b"true") in scope.get("headers", [])
+        with deterministic_ids(uuid4().hex[:6] if is_datastar else ""):
+            await self.app(scope, receive, send)
 
 
 def gen_id(prefix: str) -> str:
+    """Unique element ID: sequential base-36 inside deterministic_ids(), random otherwise."""
+    if (scope := _id_counter.get()) is not None:
+        namespace, counter = scope
+        n = _base36(next(counter))
+        return f"{prefix}_{namespace}_{n}" if namespace else f"{prefix}_{n}"
     return f"{prefix}_{uuid4().hex[:8]}"
 
 
+class StyleCollector:
+    """Static component CSS registered during a render, deduplicated in first-seen order."""
+
+    def __init__(self, inline_first: bool = False) -> None:
+        self._css: dict[str, None] = {}
+        self.inline_first = inline_first
+
+    def add(self, css: str) -> bool:
+        """Register ``css``; False if it was already collected."""
+        css = css.strip()
+        if css in self._css:
+            return False
+        self._css[css] = None
+        return True
+
+    def __len__(self) -> int:
+        return len(self._css)
+
+    @property
+    def css(self) -> str:
+        return "\n".join(self._css)
+
+    def style(self) -> FT | None:
+        from starhtml import Style  # deferred: starhtml is heavy and the CLI imports this module
+
+        return Style(self.css) if self._css else None
+
+
+_style_collector: ContextVar["StyleCollector | None"] = ContextVar("starui_style_collector", default=None)
+HOIST_STYLES_ENV = "STARUI_HOIST_STYLES"
+# Mutable so the vendored component utils can share it through style_settings()
+_style_settings = {"hoisted": os.environ.get(HOIST_STYLES_ENV) == "1"}
+
+
+@contextmanager
+def collect_styles(inline_first: bool = False) -> Iterator[StyleCollector]:
+    """Scope in which component_style() registers CSS with a collector instead of emitting it inline.
+
+    With ``inline_first=True`` the first use of each stylesheet still renders inline and
+    only repeats are dropped, so nothing needs to be injected into the response afterwards.
+    """
+    collector = StyleCollector(inline_first)
+    token = _style_collector.set(collector)
+    try:
+        yield collector
+    finally:
+        _style_collector.reset(token)
+
+
+def style_scope() -> ContextVar["StyleCollector | None"]:
+    """The context variable behind collect_styles(), for vendored copies of these utilities to share."""
+    return _style_collector
+
+
+def style_settings() -> dict[str, bool]:
+    """Mutable runtime style settings (``hoisted``), shared with vendored copies of these utilities."""
+    return _style_settings
+
+
+def hoist_component_styles(enabled: bool = True) -> None:
+    """Stop emitting component CSS at runtime because `star build --hoist-styles` bundled it into the stylesheet."""
+    _style_settings["hoisted"] = enabled
+
+
+def component_style(css: str) -> FT | None:
+    """Inline <style> for static component CSS, or defer it to the active collect_styles() scope."""
+    if _style_settings["hoisted"]:
+        return None
+    if (collector := _style_collector.get()) is not None:
+        is_new = collector.add(css)
+        if not (is_new and collector.inline_first):
+            return None
+    from starhtml import Style
+
+    return Style(css)
+
+
+class StyleCollectorMiddleware:
+    """ASGI middleware that emits each static component stylesheet once per response.
+
+    The first component to use a stylesheet renders it inline and later instances skip it.
+    The body is never rewritten, so compressed, streamed and non-HTML responses keep their CSS.
+    """
+
+    def __init__(self, app: Any) -> None:
+        self.app = app
+
+    async def __call__(self, scope: dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        with collect_styles(inline_first=True):
+            await self.app(scope, receive, send)
+
+
 def _flatten(*items: Any) -> list:
     result: list = []
     for item in items:
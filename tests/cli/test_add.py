@@ -152,6 +152,18 @@ class TestAddNewComponent:
         assert "utils" in success_text
         assert "dialog" in success_text
 
+    def test_runtime_dependency_prints_setup_hint(self, project):
+        result = _run_add(
+            project,
+            ["calendar"],
+            {"utils": "# u", "runtime": "# r", "button": "# b", "calendar": "# c"},
+        )
+        assert any("register_runtime(app)" in msg for msg in result.infos)
+
+    def test_no_runtime_hint_without_runtime_dependency(self, project):
+        result = _run_add(project, ["badge"], {"utils": "# u", "badge": "# b"})
+        assert not any("register_runtime" in msg for msg in result.infos)
+
 
 class TestSkipExistingDeps:
     def test_skips_existing_deps(self, project):
@@ -1,3 +1,4 @@
+import json
 from io import StringIO
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -8,7 +9,7 @@ from rich.console import Console
 
 from starui.cli.build import build_command, format_size
 from starui.config import ProjectConfig
-from starui.css import BuildMode, BuildResult
+from starui.css import BUILD_REPORT_FILE, BuildMode, BuildResult
 
 
 class TestFormatSize:
@@ -31,7 +32,9 @@ def _make_config(tmp_path) -> ProjectConfig:
     )
 
 
-def _capture_build_output(config, result, *, output=None, minify=True, verbose=False) -> str:
+def _capture_build_output(
+    config, result, *, output=None, minify=True, hoist_styles=None, cache=True, fingerprint=None, verbose=False
+) -> str:
     """Run build_command capturing all console output to a string."""
     mock_builder = MagicMock()
     mock_builder.build.return_value = result
@@ -47,7 +50,22 @@ def _capture_build_output(config, result, *, output=None, minify=True, verbose=F
         patch("starui.cli.build.error", lambda msg: real_console.print(f"ERR: {msg}")),
         patch("starui.cli.build.info", lambda msg: real_console.print(f"INFO: {msg}")),
     ):
-        build_command(output=output, minify=minify, verbose=verbose)
+        build_command(
+            output=output,
+            minify=minify,
+            hoist_styles=hoist_styles,
+            cache=cache,
+            fingerprint=fingerprint,
+            tree_shake=None,
+            critical=False,
+            app_file=None,
+            routes=None,
+            targets=None,
+            jobs=None,
+            report=None,
+            report_file=BUILD_REPORT_FILE,
+            verbose=verbose,
+        )
 
     return buf.getvalue()
 
@@ -110,7 +128,22 @@ class TestBuildCommand:
             patch("starui.cli.build.error"),
             patch("starui.cli.build.info"),
         ):
-            build_command(output=None, minify=False, verbose=False)
+            build_command(
+                output=None,
+                minify=False,
+                hoist_styles=None,
+                cache=True,
+                fingerprint=None,
+                tree_shake=None,
+                critical=False,
+                app_file=None,
+                routes=None,
+                targets=None,
+                jobs=None,
+                report=None,
+                report_file=BUILD_REPORT_FILE,
+                verbose=False,
+            )
 
         assert mock_builder.build.call_args.kwargs["mode"] == BuildMode.DEVELOPMENT
 
@@ -129,7 +162,22 @@ class TestBuildCommand:
             patch("starui.cli.build.error"),
             patch("starui.cli.build.info"),
         ):
-            build_command(output=None, minify=True, verbose=False)
+            build_command(
+                output=None,
+                minify=True,
+                hoist_styles=None,
+                cache=True,
+                fingerprint=None,
+                tree_shake=None,
+                critical=False,
+                app_file=None,
+                routes=None,
+                targets=None,
+                jobs=None,
+                report=None,
+                report_file=BUILD_REPORT_FILE,
+                verbose=False,
+            )
 
         assert mock_builder.build.call_args.kwargs["mode"] == BuildMode.PRODUCTION
 
@@ -148,7 +196,22 @@ class TestBuildCommand:
             patch("starui.cli.build.info"),
         ):
             MockCSSBuilder.return_value = mock_builder
-            build_command(output="dist/styles", minify=True, verbose=False)
+            build_command(
+                output="dist/styles",
+                minify=True,
+                hoist_styles=None,
+                cache=True,
+                fingerprint=None,
+                tree_shake=None,
+                critical=False,
+                app_file=None,
+                routes=None,
+                targets=None,
+                jobs=None,
+                report=None,
+                report_file=BUILD_REPORT_FILE,
+                verbose=False,
+            )
 
         assert config.css_output.suffix == ".css"
 
@@ -170,4 +233,283 @@ class TestBuildCommand:
             patch("starui.cli.build.error"),
             pytest.raises(Exit),
         ):
-            build_command(output=None, minify=True, verbose=False)
+            build_command(
+                output=None,
+                minify=True,
+                hoist_styles=None,
+                cache=True,
+                fingerprint=None,
+                tree_shake=None,
+                critical=False,
+                app_file=None,
+                routes=None,
+                targets=None,
+                jobs=None,
+                report=None,
+                report_file=BUILD_REPORT_FILE,
+                verbose=False,
+            )
+
+    def test_hoist_styles_flag_overrides_config(self, tmp_path):
+        config = _make_config(tmp_path)
+        result = BuildResult(success=True)
+
+        output = _capture_build_output(config, result, hoist_styles=True)
+
+        assert config.hoist_styles is True
+        assert "hoist_component_styles()" in output
+
+    def test_hoist_styles_defaults_to_config(self, tmp_path):
+        config = _make_config(tmp_path)
+        config.hoist_styles = True
+
+        _capture_build_output(config, BuildResult(success=True))
+
+        assert config.hoist_styles is True
+
+    def test_fingerprint_flag_writes_hashed_copy(self, tmp_path):
+        config = _make_config(tmp_path)
+
+        def build(mode):
+            config.css_output_absolute.write_text("body{}")
+            return BuildResult(success=True, css_path=config.css_output_absolute)
+
+        mock_builder = MagicMock()
+        mock_builder.build.side_effect = build
+        with (
+            patch("starui.cli.build.get_project_config", return_value=config),
+            patch("starui.cli.build.CSSBuilder", return_value=mock_builder),
+            patch("starui.cli.build.console"),
+            patch("starui.cli.build.success"),
+        ):
+            build_command(
+                output=None,
+                minify=True,
+                hoist_styles=None,
+                cache=True,
+                fingerprint=True,
+                critical=False,
+                app_file=None,
+                routes=None,
+                targets=None,
+                jobs=None,
+                report=None,
+                report_file=BUILD_REPORT_FILE,
+                verbose=False,
+            )
+
+        assert "starui.css" in (tmp_path / "static" / "css" / "assets.json").read_text()
+
+    def test_critical_builds_each_route(self, tmp_path):
+        config = _make_config(tmp_path)
+        config.critical_routes = ("/", "/about")
+        mock_builder = MagicMock()
+        mock_builder.build.return_value = BuildResult(success=True)
+        mock_builder.build_critical.side_effect = lambda classes, output, mode: BuildResult(
+            success=True, css_path=output, css_size_bytes=10
+        )
+        pages = {"/": '<p class="flex">', "/about": '<p class="grid">'}
+
+        with (
+            patch("starui.cli.build.get_project_config", return_value=config),
+            patch("starui.cli.build.CSSBuilder", return_value=mock_builder),
+            patch("starui.cli.build.load_app") as load_app,
+            patch("starui.cli.build.render_routes", return_value=pages) as render,
+            patch("starui.cli.build.console"),
+            patch("starui.cli.build.success"),
+        ):
+            build_command(
+                output=None,
+                minify=True,
+                hoist_styles=None,
+                cache=True,
+                fingerprint=None,
+                tree_shake=None,
+                critical=True,
+                app_file=None,
+                routes=None,
+                targets=None,
+                jobs=None,
+                report=None,
+                report_file=BUILD_REPORT_FILE,
+                verbose=False,
+            )
+
+        load_app.assert_called_once_with(tmp_path / "app.py")
+        assert render.call_args.args[1] == ("/", "/about")
+        outputs = [c.args[1] for c in mock_builder.build_critical.call_args_list]
+        assert outputs == [
+            tmp_path / "static/css/critical/starui/index.css",
+            tmp_path / "static/css/critical/starui/about.css",
+        ]
+
+    def test_report_json_writes_metrics(self, tmp_path):
+        config = _make_config(tmp_path)
+        config.css_output_absolute.parent.mkdir(parents=True, exist_ok=True)
+        report_file = tmp_path / ".starui" / "build-report.json"
+
+        def build(mode):
+            config.css_output_absolute.write_text("body{}")
+            return BuildResult(
+                success=True,
+                css_path=config.css_output_absolute,
+                build_time=0.2,
+                css_size_bytes=6,
+                phases={"binary": 0.01, "tailwind": 0.15},
+            )
+
+        mock_builder = MagicMock()
+        mock_builder.build.side_effect = build
+        with (
+            patch("starui.cli.build.get_project_config", return_value=config),
+            patch("starui.cli.build.CSSBuilder", return_value=mock_builder),
+            patch("starui.cli.build.console"),
+            patch("starui.cli.build.success"),
+            patch("starui.cli.build.info"),
+        ):
+            build_command(
+                output=None,
+                minify=True,
+                hoist_styles=None,
+                cache=True,
+                fingerprint=None,
+                tree_shake=None,
+                critical=False,
+                app_file=None,
+                routes=None,
+                targets=None,
+                jobs=None,
+                report="json",
+                report_file=str(report_file),
+                verbose=False,
+            )
+
+        target = json.loads(report_file.read_text())["targets"]["default"]
+        assert target["output"] == "static/css/starui.css"
+        assert target["time"]["tailwind"] == 0.15
+        assert target["time"]["input"] is None
+        assert target["size"]["raw"] == 6
+
+
+class TestBuildTargets:
+    def _config(self, tmp_path):
+        config = _make_config(tmp_path)
+        config.targets = {
+            name: ProjectConfig(
+                project_root=tmp_path, css_output=Path(f"{name}/{name}.css"), component_dir=Path("components/ui")
+            )
+            for name in ("admin", "site")
+        }
+        return config
+
+    def _run(self, config, results, **options):
+        buf = StringIO()
+        real_console = Console(file=buf, width=300, no_color=True)
+        kwargs = {
+            "output": None,
+            "minify": True,
+            "hoist_styles": None,
+            "cache": True,
+            "fingerprint": None,
+            "tree_shake": None,
+            "critical": False,
+            "app_file": None,
+            "routes": None,
+            "targets": None,
+            "jobs": None,
+            "report": None,
+            "report_file": BUILD_REPORT_FILE,
+            "verbose": False,
+        } | options
+        with (
+            patch("starui.cli.build.get_project_config", return_value=config),
+            patch("starui.cli.build.build_targets", return_value=results) as build,
+            patch("starui.cli.build.console", real_console),
+            patch("starui.cli.build.success", lambda msg: real_console.print(f"OK: {msg}")),
+            patch("starui.cli.build.error", lambda msg: real_console.print(f"ERR: {msg}")),
+        ):
+            try:
+                build_command(**kwargs)
+            finally:
+                self.output = buf.getvalue()
+        return build
+
+    def test_reports_each_target(self, tmp_path):
+        config = self._config(tmp_path)
+        results = {
+            "admin": BuildResult(
+                success=True, css_path=tmp_path / "admin/admin.css", build_time=0.4, css_size_bytes=2048
+            ),
+            "site": BuildResult(success=True, css_path=tmp_path / "site/site.css", build_time=1.2, css_size_bytes=512),
+        }
+
+        build = self._run(config, results, jobs=2)
+
+        assert list(build.call_args.args[0]) == ["admin", "site"]
+        assert build.call_args.kwargs["jobs"] == 2
+        assert "2.0 KB" in self.output and "1.2s" in self.output
+        assert "Built 2 target(s)" in self.output
+
+    def test_selects_targets(self, tmp_path):
+        config = self._config(tmp_path)
+
+        build = self._run(config, {"site": BuildResult(success=True)}, targets=["site"])
+
+        assert list(build.call_args.args[0]) == ["site"]
+
+    def test_unknown_target_exits(self, tmp_path):
+        with pytest.raises(Exit):
+            self._run(self._config(tmp_path), {}, targets=["blog"])
+        assert "Unknown target(s): blog" in self.output
+
+    def test_report_written_on_failure(self, tmp_path):
+        config = self._config(tmp_path)
+        report_file = tmp_path / "report.json"
+
+        with pytest.raises(Exit):
+            self._run(
+                config,
+                {"admin": BuildResult(success=False, error_message="bad @apply")},
+                report="json",
+                report_file=str(report_file),
+            )
+
+        assert json.loads(report_file.read_text())["targets"]["admin"]["success"] is False
+
+    def test_critical_css_is_kept_per_target_in_a_shared_directory(self, tmp_path):
+        config = _make_config(tmp_path)
+        config.targets = {
+            name: ProjectConfig(
+                project_root=tmp_path, css_output=Path(f"static/css/{name}.css"), component_dir=Path("components/ui")
+            )
+            for name in ("site", "admin")
+        }
+
+        def builder(target, **kwargs):
+            def build_critical(classes, output, mode):
+                output.parent.mkdir(parents=True, exist_ok=True)
+                output.write_text(f"/* {target.css_output.stem} */")
+                return BuildResult(success=True, css_path=output)
+
+            return MagicMock(build_critical=build_critical)
+
+        results = {name: BuildResult(success=True) for name in config.targets}
+        with (
+            patch("starui.cli.build.CSSBuilder", side_effect=builder),
+            patch("starui.cli.build.load_app"),
+            patch("starui.cli.build.render_routes", return_value={"/": '<p class="flex">'}),
+        ):
+            self._run(config, results, critical=True)
+
+        critical = tmp_path / "static" / "css" / "critical"
+        assert (critical / "site" / "index.css").read_text() == "/* site */"
+        assert (critical / "admin" / "index.css").read_text() == "/* admin */"
+
+    def test_failure_reports_skipped_targets(self, tmp_path):
+        config = self._config(tmp_path)
+
+        with pytest.raises(Exit):
+            self._run(config, {"admin": BuildResult(success=False, error_message="bad @apply")})
+
+        assert "Build failed for admin: bad @apply" in self.output
+        assert "skipped" in self.output
@@ -0,0 +1,274 @@
+"""Tests for the optimize CLI command and the underlying folding library."""
+
+import ast
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+import typer
+from typer.testing import CliRunner
+
+from starui.cli.diff import diff_command
+from starui.cli.optimize import optimize_command
+from starui.optimize import optimize_file, optimize_source
+from starui.registry.checksum import compute_checksum
+from starui.registry.manifest import Manifest
+
+BUTTON_SOURCE = """\
+from .utils import cn, cva
+
+button_variants = cva(
+    base="inline-flex",
+    config={
+        "variants": {"size": {"sm": "h-8 px-3", "lg": "h-10 px-6"}},
+        "defaultVariants": {"size": "sm"},
+    },
+)
+
+WRAPPER = cn(
+    "px-2",
+    "px-4",
+)
+
+
+def Button(*children, size="sm", cls=""):
+    return cn(button_variants(size=size), cls)
+
+
+def Large(cls=""):
+    return cn(button_variants(size="lg"), cls)
+"""
+
+REGISTRY_COMPONENTS = Path(__file__).parents[2] / "registry" / "components"
+
+# ---------------------------------------------------------------------------
+# Library: optimize_source()
+# ---------------------------------------------------------------------------
+
+
+class TestOptimizeSource:
+    def test_folds_literal_cn_call(self):
+        src = 'from .utils import cn\nx = cn("p-2", None, "p-4")\n'
+        assert optimize_source(src) == ('x = "p-4"\n', 1)
+
+    def test_folds_multiline_call(self):
+        out, count = optimize_source(BUTTON_SOURCE)
+        assert 'WRAPPER = "px-4"\n' in out
+        assert count == 2
+
+    def test_folds_literal_cva_call(self):
+        out, _ = optimize_source(BUTTON_SOURCE)
+        assert 'return cn("inline-flex h-10 px-6", cls)' in out
+
+    def test_leaves_dynamic_calls(self):
+        out, _ = optimize_source(BUTTON_SOURCE)
+        assert "cn(button_variants(size=size), cls)" in out
+
+    def test_cva_definition_untouched(self):
+        out, _ = optimize_source(BUTTON_SOURCE)
+        assert 'base="inline-flex"' in out
+
+    def test_nested_calls_fold_to_fixpoint(self):
+        src = 'from .utils import cn\nx = cn("flex", cn("p-2", "p-4"))\n'
+        assert optimize_source(src) == ('x = "flex p-4"\n', 2)
+
+    def test_ignores_cn_not_from_utils(self):
+        src = 'from mylib import cn\nx = cn("p-2", "p-4")\n'
+        assert optimize_source(src) == (src, 0)
+
+    def test_ignores_fstring_arguments(self):
+        src = 'from .utils import cn\nx = cn(f"p-{n}", "flex")\n'
+        assert optimize_source(src) == (src, 0)
+
+    def test_ignores_empty_cva_props(self):
+        src = BUTTON_SOURCE + 'y = button_variants(size="")\n'
+        out, _ = optimize_source(src)
+        assert 'y = button_variants(size="")' in out
+
+    def test_quotes_values_containing_quotes(self):
+        src = """from .utils import cn\nx = cn('[&_[data-x="1"]]:flex')\n"""
+        out, _ = optimize_source(src)
+        assert out == """x = '[&_[data-x="1"]]:flex'\n"""
+
+    def test_non_ascii_offsets(self):
+        src = 'from .utils import cn\nlabel = "→"; x = cn("p-2", "p-4")\n'
+        assert optimize_source(src)[0] == 'label = "→"; x = "p-4"\n'
+
+    def test_keeps_cn_import_while_calls_remain(self):
+        out, _ = optimize_source(BUTTON_SOURCE)
+        assert out.startswith("from .utils import cn, cva\n")
+
+    def test_drops_cn_from_shared_import(self):
+        src = 'from .utils import cn, gen_id\nx = cn("p-2", "p-4")\ny = gen_id("x")\n'
+        assert optimize_source(src)[0] == 'from .utils import gen_id\nx = "p-4"\ny = gen_id("x")\n'
+
+    def test_drops_cn_from_parenthesized_import(self):
+        src = 'from .utils import (\n    cn,\n    cva,\n    gen_id,\n)\nx = cn("p-2", "p-4")\n'
+        out, _ = optimize_source(src)
+        assert out == 'from .utils import (\n    cva,\n    gen_id,\n)\nx = "p-4"\n'
+
+    def test_keeps_cn_listed_in_all(self):
+        src = 'from .utils import cn\n__all__ = ["cn"]\nx = cn("p-2", "p-4")\n'
+        assert optimize_source(src)[0].startswith("from .utils import cn\n")
+
+    def test_static_component_has_no_unused_cn_import(self):
+        src = 'from .utils import cn, cva\n\nBASE = cn("p-2", "p-4")\n\n\ndef Card(cls=""):\n    return Div(cls=cn("flex", "grid"))\n'
+        out, count = optimize_source(src)
+
+        assert count == 2
+        assert out.startswith("from .utils import cva\n")
+
+    def test_registry_components_keep_no_unused_cn_import(self):
+        unused = []
+        for path in sorted(REGISTRY_COMPONENTS.glob("*.py")):
+            tree = ast.parse(optimize_source(path.read_text())[0])
+            imported = {a.asname or a.name for n in tree.body if isinstance(n, ast.ImportFrom) for a in n.names}
+            if "cn" in imported and "cn" not in {n.id for n in ast.walk(tree) if isinstance(n, ast.Name)}:
+                unused.append(path.name)
+
+        assert unused == []
+
+    def test_idempotent(self):
+        once, _ = optimize_source(BUTTON_SOURCE)
+        assert optimize_source(once) == (once, 0)
+
+
+class TestOptimizeFile:
+    def test_rewrites_in_place(self, tmp_path):
+        f = tmp_path / "button.py"
+        f.write_text(BUTTON_SOURCE)
+        assert optimize_file(f) == 2
+        assert 'WRAPPER = "px-4"' in f.read_text()
+
+    def test_check_mode_leaves_file(self, tmp_path):
+        f = tmp_path / "button.py"
+        f.write_text(BUTTON_SOURCE)
+        assert optimize_file(f, check=True) == 2
+        assert f.read_text() == BUTTON_SOURCE
+
+
+# ---------------------------------------------------------------------------
+# CLI: optimize_command + manifest integration
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def cli():
+    app = typer.Typer()
+    app.command("optimize")(optimize_command)
+    app.command("diff")(diff_command)
+    return CliRunner(), app
+
+
+@pytest.fixture
+def installed(tmp_path):
+    comp_dir = tmp_path / "components" / "ui"
+    comp_dir.mkdir(parents=True)
+    comp_file = comp_dir / "button.py"
+    comp_file.write_text(BUTTON_SOURCE)
+
+    manifest = Manifest(tmp_path)
+    manifest.record_install(
+        "button",
+        version="main",
+        checksum=compute_checksum(BUTTON_SOURCE),
+        file_path=str(comp_file.relative_to(tmp_path)),
+    )
+    manifest.save()
+
+    config = MagicMock()
+    config.project_root = tmp_path
+    config.component_dir_absolute = comp_dir
+    return tmp_path, comp_file, config
+
+
+class TestOptimizeCommand:
+    def test_rewrites_and_records_in_manifest(self, cli, installed):
+        runner, app = cli
+        root, comp_file, config = installed
+
+        with patch("starui.cli.optimize.get_project_config", return_value=config):
+            result = runner.invoke(app, ["optimize"])
+
+        assert result.exit_code == 0
+        assert "Folded 2 call(s) in 1 file(s)" in result.output
+        manifest = Manifest(root)
+        record = manifest.get_installed()["button"]
+        assert record["checksum"] == compute_checksum(BUTTON_SOURCE)
+        assert record["optimized"] == {"checksum": compute_checksum(comp_file), "folded": 2}
+        assert not manifest.is_modified("button", config.component_dir_absolute)
+
+    def test_check_mode_does_not_write(self, cli, installed):
+        runner, app = cli
+        root, comp_file, config = installed
+
+        with patch("starui.cli.optimize.get_project_config", return_value=config):
+            result = runner.invoke(app, ["optimize", "--check"])
+
+        assert result.exit_code == 0
+        assert "would fold 2 call(s)" in result.output
+        assert comp_file.read_text() == BUTTON_SOURCE
+        assert "optimized" not in Manifest(root).get_installed()["button"]
+
+    def test_locally_modified_file_not_recorded(self, cli, installed):
+        runner, app = cli
+        root, comp_file, config = installed
+        comp_file.write_text(BUTTON_SOURCE + "\n# local edit\n")
+
+        with patch("starui.cli.optimize.get_project_config", return_value=config):
+            result = runner.invoke(app, ["optimize"])
+
+        assert result.exit_code == 0
+        manifest = Manifest(root)
+        assert "optimized" not in manifest.get_installed()["button"]
+        assert manifest.is_modified("button", config.component_dir_absolute)
+
+    def test_edit_after_optimize_is_modified(self, cli, installed):
+        runner, app = cli
+        root, comp_file, config = installed
+
+        with patch("starui.cli.optimize.get_project_config", return_value=config):
+            runner.invoke(app, ["optimize"])
+        comp_file.write_text(comp_file.read_text() + "\n# local edit\n")
+
+        assert Manifest(root).is_modified("button", config.component_dir_absolute)
+
+    def test_nothing_to_fold(self, cli, tmp_path):
+        runner, app = cli
+        (tmp_path / "plain.py").write_text("x = 1\n")
+        config = MagicMock()
+        config.project_root = tmp_path
+        config.component_dir_absolute = tmp_path
+
+        with patch("starui.cli.optimize.get_project_config", return_value=config):
+            result = runner.invoke(app, ["optimize"])
+
+        assert result.exit_code == 0
+        assert "Nothing to fold" in result.output
+
+    def test_no_files_exits_1(self, cli, tmp_path):
+        runner, app = cli
+        config = MagicMock()
+        config.project_root = tmp_path
+        config.component_dir_absolute = tmp_path / "missing"
+
+        with patch("starui.cli.optimize.get_project_config", return_value=config):
+            result = runner.invoke(app, ["optimize"])
+
+        assert result.exit_code == 1
+
+    @patch("starui.cli.diff.RegistryClient")
+    def test_diff_clean_after_optimize(self, mock_client_cls, cli, installed):
+        runner, app = cli
+        _, _, config = installed
+        mock_client_cls.return_value.get_source.return_value = BUTTON_SOURCE
+
+        with (
+            patch("starui.cli.optimize.get_project_config", return_value=config),
+            patch("starui.cli.diff.get_project_config", return_value=config),
+        ):
+            runner.invoke(app, ["optimize"])
+            result = runner.invoke(app, ["diff", "button"])
+
+        assert result.exit_code == 0
+        assert "no differences" in result.output
@@ -1,7 +1,10 @@
 """Tests for the sort CLI command and the underlying sort library."""
 
+import os
+import subprocess
 from contextlib import nullcontext
 from io import StringIO
+from pathlib import Path
 from unittest.mock import patch
 
 import pytest
@@ -9,7 +12,17 @@ from click.exceptions import Exit
 from rich.console import Console
 
 from starui.cli.sort import sort_command
-from starui.sort import _extract_tokens, _is_fstring, _sort_string, sort_file, tokenize
+from starui.sort import (
+    _extract_tokens,
+    _index_cache_path,
+    _sort_string,
+    _string_literals,
+    changed_since,
+    load_sort_index,
+    sort_file,
+    sort_files,
+    tokenize,
+)
 
 # ---------------------------------------------------------------------------
 # Library: tokenize()
@@ -52,55 +65,54 @@ class TestTokenize:
 
 
 # ---------------------------------------------------------------------------
-# Library: _is_fstring()
+# Library: _string_literals()
 # ---------------------------------------------------------------------------
 
 
-class TestIsFString:
+def _literals(src):
+    return [(src[start:end], interpolated) for start, end, _, interpolated in _string_literals(src)]
+
+
+class TestStringLiterals:
     def test_plain_string(self):
-        src = 'x = "hello"'
-        pos = src.index('"')
-        assert _is_fstring(src, pos) is False
-
-    def test_fstring_lowercase(self):
-        src = 'x = f"hello"'
-        pos = src.index('"')
-        assert _is_fstring(src, pos) is True
-
-    def test_fstring_uppercase(self):
-        src = 'x = F"hello"'
-        pos = src.index('"')
-        assert _is_fstring(src, pos) is True
-
-    def test_rf_string(self):
-        src = 'x = rf"hello"'
-        pos = src.index('"')
-        assert _is_fstring(src, pos) is True
-
-    def test_fr_string(self):
-        src = 'x = fr"hello"'
-        pos = src.index('"')
-        assert _is_fstring(src, pos) is True
-
-    def test_raw_string_is_not_fstring(self):
-        src = 'x = r"hello"'
-        pos = src.index('"')
-        assert _is_fstring(src, pos) is False
-
-    def test_byte_string_is_not_fstring(self):
-        src = 'x = b"hello"'
-        pos = src.index('"')
-        assert _is_fstring(src, pos) is False
-
-    def test_at_start_of_string(self):
-        src = '"hello"'
-        assert _is_fstring(src, 0) is False
-
-    def test_fb_string(self):
-        # fb isn't valid Python but the function just checks for f/F in prefix
-        src = 'x = fb"hello"'
-        pos = src.index('"')
-        assert _is_fstring(src, pos) is True
+        assert _literals('x = "hello"') == [('"hello"', False)]
+
+    @pytest.mark.parametrize("prefix", ["f", "F", "rf", "fr", "Rf", "t"])
+    def test_interpolated_prefixes(self, prefix):
+        assert _literals(f'x = {prefix}"hello"') == [('"hello"', True)]
+
+    @pytest.mark.parametrize("prefix", ["r", "b", "u", "rb", "Br"])
+    def test_non_interpolated_prefixes(self, prefix):
+        assert _literals(f'x = {prefix}"hello"') == [('"hello"', False)]
+
+    def test_identifier_ending_in_f_is_not_a_prefix(self):
+        assert _literals('elif"x"') == [('"x"', False)]
+
+    def test_at_start_of_source(self):
+        assert _literals('"hello"') == [('"hello"', False)]
+
+    def test_escaped_quotes(self):
+        assert _literals(r'x = "a \"b\" c"') == [(r'"a \"b\" c"', False)]
+
+    def test_comments_are_skipped(self):
+        assert _literals('# don\'t "flex p-4"\nx = "gap-2"') == [('"gap-2"', False)]
+
+    def test_hash_inside_string_is_not_a_comment(self):
+        assert _literals('x = "#fff"; y = "p-4"') == [('"#fff"', False), ('"p-4"', False)]
+
+    def test_triple_quoted_is_one_literal(self):
+        src = 'x = """a "b" c"""\ny = "d"'
+        assert _literals(src) == [('"""a "b" c"""', False), ('"d"', False)]
+
+    def test_implicit_concatenation(self):
+        assert _literals('x = ("flex " "p-4")') == [('"flex "', False), ('"p-4"', False)]
+
+    def test_fstring_with_nested_quotes(self):
+        src = 'x = f"{d["k"]} {y!r:>{w}} {{lit}}"; z = "p-4"'
+        assert _literals(src) == [(src[5 : src.index(";")], True), ('"p-4"', False)]
+
+    def test_unterminated_string_stops_at_line_end(self):
+        assert _literals('x = "oops\ny = "p-4"') == [('"oops', False), ('"p-4"', False)]
 
 
 # ---------------------------------------------------------------------------
@@ -180,6 +192,21 @@ class TestSortString:
 
 
 class TestSortFile:
+    def test_ignores_comments_and_multiline_blocks(self, tmp_path):
+        f = tmp_path / "test.py"
+        original = '# "mt-2 flex p-4"\nDOC = """\nmt-2 flex\np-4\n"""\nDOC2 = """\nmt-2 flex p-4\n"""\n'
+        f.write_text(original)
+
+        assert sort_file(f, {"flex": 0, "p-4": 1, "mt-2": 2}) is False
+        assert f.read_text() == original
+
+    def test_sorts_single_line_triple_quoted(self, tmp_path):
+        f = tmp_path / "test.py"
+        f.write_text('cls = """mt-2 flex p-4"""\n')
+
+        assert sort_file(f, {"flex": 0, "p-4": 1, "mt-2": 2}) is True
+        assert f.read_text() == 'cls = """flex p-4 mt-2"""\n'
+
     def test_sorts_strings_in_file(self, tmp_path):
         f = tmp_path / "test.py"
         f.write_text('cls = "mt-2 flex p-4"\n')
@@ -319,6 +346,244 @@ class TestExtractTokens:
         assert tokens == {"flex"}
 
 
+# ---------------------------------------------------------------------------
+# Library: load_sort_index()
+# ---------------------------------------------------------------------------
+
+
+def _fake_build(tokens, binary):
+    utilities = sorted(t for t in tokens if not t.startswith("word"))
+    return {t: i for i, t in enumerate(utilities)}
+
+
+class TestLoadSortIndex:
+    @pytest.fixture
+    def binary(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("pathlib.Path.home", lambda: tmp_path)
+        path = tmp_path / "tailwindcss"
+        path.write_bytes(b"v4")
+        return path
+
+    def test_cold_cache_builds_and_persists(self, binary):
+        with patch("starui.sort._build_sort_index", side_effect=_fake_build) as build:
+            index = load_sort_index({"flex", "p-4", "word"}, binary)
+
+        build.assert_called_once()
+        assert index == {"flex": 0, "p-4": 1}
+        assert _index_cache_path(binary).exists()
+
+    def test_warm_cache_skips_tailwind(self, binary):
+        with patch("starui.sort._build_sort_index", side_effect=_fake_build):
+            load_sort_index({"flex", "p-4", "word"}, binary)
+        with patch("starui.sort._build_sort_index") as build:
+            index = load_sort_index({"flex", "word"}, binary)
+
+        build.assert_not_called()
+        assert index == {"flex": 0, "p-4": 1}
+
+    def test_new_tokens_rebuild_with_known_utilities_only(self, binary):
+        with patch("starui.sort._build_sort_index", side_effect=_fake_build):
+            load_sort_index({"flex", "word"}, binary)
+        with patch("starui.sort._build_sort_index", side_effect=_fake_build) as build:
+            index = load_sort_index({"flex", "word", "gap-2"}, binary)
+
+        assert build.call_args.args[0] == {"flex", "gap-2"}
+        assert index == {"flex": 0, "gap-2": 1}
+
+    def test_changed_binary_uses_fresh_cache(self, binary):
+        before = _index_cache_path(binary)
+        binary.write_bytes(b"v4.1")
+        assert _index_cache_path(binary) != before
+
+    def test_corrupt_cache_is_rebuilt(self, binary):
+        path = _index_cache_path(binary)
+        path.parent.mkdir(parents=True)
+        path.write_text("{not json")
+
+        with patch("starui.sort._build_sort_index", side_effect=_fake_build) as build:
+            assert load_sort_index({"flex"}, binary) == {"flex": 0}
+        build.assert_called_once()
+
+
+# ---------------------------------------------------------------------------
+# Library: sort_files()
+# ---------------------------------------------------------------------------
+
+
+class TestSortFiles:
+    INDEX = {"flex": 0, "p-4": 1, "mt-2": 2}
+
+    def _run(self, files, **kwargs):
+        with (
+            patch("starui.sort.TailwindBinaryManager"),
+            patch("starui.sort.load_sort_index", return_value=self.INDEX) as load,
+        ):
+            return sort_files(files, **kwargs), load
+
+    def _make_files(self, tmp_path, count):
+        files = []
+        for i in range(count):
+            f = tmp_path / f"m{i:03}.py"
+            f.write_text('a = "mt-2 flex p-4"\n' if i % 2 else 'a = "flex p-4"\n')
+            files.append(f)
+        return files
+
+    def test_reads_each_file_once(self, tmp_path):
+        files = self._make_files(tmp_path, 3)
+
+        with patch("pathlib.Path.read_text", autospec=True, side_effect=lambda p: 'a = "mt-2 flex"\n') as read:
+            self._run(files, check=True, jobs=1)
+
+        assert read.call_count == len(files)
+
+    def test_collects_tokens_across_files(self, tmp_path):
+        files = self._make_files(tmp_path, 2)
+
+        _, load = self._run(files, check=True, jobs=1)
+
+        assert load.call_args.args[0] == {"flex", "p-4", "mt-2"}
+
+    def test_parallel_matches_serial_in_input_order(self, tmp_path):
+        files = self._make_files(tmp_path, 40)
+
+        serial, _ = self._run(files, check=True, jobs=1)
+        parallel, _ = self._run(list(reversed(files)), check=True, jobs=2)
+
+        assert list(parallel) == list(reversed(files))
+        assert parallel == serial
+        assert sum(serial.values()) == 20
+
+    def test_parallel_rewrites_files(self, tmp_path):
+        files = self._make_files(tmp_path, 40)
+
+        self._run(files, jobs=2)
+
+        assert {f.read_text() for f in files} == {'a = "flex p-4 mt-2"\n', 'a = "flex p-4"\n'}
+
+
+class TestSortFilesCache:
+    INDEX = {"flex": 0, "p-4": 1, "mt-2": 2}
+
+    @pytest.fixture
+    def run(self, tmp_path):
+        cache_path = tmp_path / ".starui" / "sort-cache.json"
+
+        def run(files, *, check=False, binary_key="tw"):
+            with (
+                patch("starui.sort.TailwindBinaryManager"),
+                patch("starui.sort._index_cache_path", return_value=Path(f"{binary_key}.json")),
+                patch("starui.sort.load_sort_index", return_value=self.INDEX) as load,
+            ):
+                return sort_files(files, check=check, jobs=1, cache_path=cache_path), load
+
+        return run
+
+    @pytest.fixture
+    def files(self, tmp_path):
+        a, b = tmp_path / "a.py", tmp_path / "b.py"
+        a.write_text('x = "mt-2 flex"\n')
+        b.write_text('y = "flex p-4"\n')
+        return [a, b]
+
+    @staticmethod
+    def _reads():
+        read, real = [], Path.read_text
+
+        def spy(path, *args, **kwargs):
+            read.append(path)
+            return real(path, *args, **kwargs)
+
+        return read, patch("pathlib.Path.read_text", autospec=True, side_effect=spy)
+
+    def test_unchanged_files_are_not_read(self, run, files):
+        run(files)
+
+        read, spy = self._reads()
+        with spy:
+            results, load = run(files)
+
+        assert not set(read) & set(files)
+        load.assert_not_called()
+        assert results == dict.fromkeys(files, False)
+
+    def test_rewritten_files_are_recorded_clean(self, run, files):
+        first, _ = run(files)
+        second, _ = run(files)
+
+        assert first == {files[0]: True, files[1]: False}
+        assert second == dict.fromkeys(files, False)
+
+    def test_touched_identical_file_skips_tokenizing(self, run, files):
+        run(files)
+        stat = files[1].stat()
+        os.utime(files[1], ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        with patch("starui.sort.tokenize") as tok:
+            results, load = run(files)
+
+        tok.assert_not_called()
+        load.assert_not_called()
+        assert results[files[1]] is False
+
+    def test_modified_file_is_resorted(self, run, files):
+        run(files)
+        files[1].write_text('y = "p-4 flex mt-2"\n')
+
+        results, _ = run(files)
+
+        assert results == {files[0]: False, files[1]: True}
+        assert files[1].read_text() == 'y = "flex p-4 mt-2"\n'
+
+    def test_check_mode_does_not_record_unsorted_files(self, run, files):
+        run(files, check=True)
+        results, _ = run(files, check=True)
+
+        assert results[files[0]] is True
+
+    def test_new_fingerprint_invalidates_entries(self, run, files):
+        run(files)
+
+        read, spy = self._reads()
+        with spy:
+            run(files, binary_key="tw-upgraded")
+
+        assert set(files) <= set(read)
+
+
+# ---------------------------------------------------------------------------
+# Library: changed_since()
+# ---------------------------------------------------------------------------
+
+
+class TestChangedSince:
+    @pytest.fixture
+    def repo(self, tmp_path):
+        def git(*args):
+            subprocess.run(["git", *args], cwd=tmp_path, check=True, capture_output=True)
+
+        git("init", "-q", "-b", "main")
+        git("config", "user.email", "dev@example.com")
+        git("config", "user.name", "dev")
+        (tmp_path / "kept.py").write_text("a = 1\n")
+        (tmp_path / "edited.py").write_text("b = 1\n")
+        (tmp_path / "removed.py").write_text("c = 1\n")
+        git("add", ".")
+        git("commit", "-q", "-m", "base")
+        git("checkout", "-q", "-b", "feature")
+        (tmp_path / "edited.py").write_text("b = 2\n")
+        (tmp_path / "removed.py").unlink()
+        git("commit", "-q", "-am", "change")
+        (tmp_path / "new.py").write_text("d = 1\n")
+        return tmp_path
+
+    def test_lists_changed_and_untracked_files(self, repo):
+        assert changed_since("main", cwd=repo) == [repo.resolve() / "edited.py", repo.resolve() / "new.py"]
+
+    def test_unknown_ref_raises(self, repo):
+        with pytest.raises(RuntimeError):
+            changed_since("no-such-branch", cwd=repo)
+
+
 # ---------------------------------------------------------------------------
 # CLI: sort_command
 # ---------------------------------------------------------------------------
@@ -328,6 +593,7 @@ def _run_sort_command(
     paths=None,
     check=False,
     verbose=False,
+    since=None,
     sort_files_return=None,
 ) -> str:
     """Run sort_command, capturing console output and returning it as a string.
@@ -349,7 +615,9 @@ def _run_sort_command(
         patch("starui.cli.sort.error", lambda msg: real_console.print(f"ERR: {msg}")),
         patch("starui.cli.sort.info", lambda msg: real_console.print(f"INFO: {msg}")),
     ):
-        sort_command(paths=paths, check=check, verbose=verbose)
+        sort_command(
+            paths=paths, check=check, jobs=None, since=since, cache=False, serve=False, socket=None, verbose=verbose
+        )
 
     return buf.getvalue()
 
@@ -515,7 +783,9 @@ class TestSortCommandOutput:
             patch("starui.cli.sort.info", lambda msg: real_console.print(f"INFO: {msg}")),
             pytest.raises(Exit),
         ):
-            sort_command(paths=[str(f)], check=True, verbose=False)
+            sort_command(
+                paths=[str(f)], check=True, jobs=None, since=None, cache=False, serve=False, socket=None, verbose=False
+            )
 
         output = buf.getvalue()
         assert "would sort" in output
@@ -535,7 +805,9 @@ class TestSortCommandOutput:
             patch("starui.cli.sort.error", lambda msg: real_console.print(f"ERR: {msg}")),
             patch("starui.cli.sort.info", lambda msg: real_console.print(f"INFO: {msg}")),
         ):
-            sort_command(paths=[str(f)], check=False, verbose=False)
+            sort_command(
+                paths=[str(f)], check=False, jobs=None, since=None, cache=False, serve=False, socket=None, verbose=False
+            )
 
         output = buf.getvalue()
         assert "sorted" in output.lower()
@@ -557,7 +829,9 @@ class TestSortCommandOutput:
             patch("starui.cli.sort.info", lambda msg: real_console.print(f"INFO: {msg}")),
             pytest.raises(Exit),
         ):
-            sort_command(paths=[str(f)], check=True, verbose=False)
+            sort_command(
+                paths=[str(f)], check=True, jobs=None, since=None, cache=False, serve=False, socket=None, verbose=False
+            )
 
         output = buf.getvalue()
         assert "1 file(s) need sorting" in output
@@ -599,7 +873,57 @@ class TestSortCommandOutput:
             patch("starui.cli.sort.info", lambda msg: real_console.print(f"INFO: {msg}")),
             pytest.raises(Exit),
         ):
-            sort_command(paths=[str(tmp_path)], check=False, verbose=False)
+            sort_command(
+                paths=[str(tmp_path)],
+                check=False,
+                jobs=None,
+                since=None,
+                cache=False,
+                serve=False,
+                socket=None,
+                verbose=False,
+            )
 
         output = buf.getvalue()
         assert "No .py files found" in output
+
+
+class TestSortCommandChangedSince:
+    def test_limits_files_to_changed_paths_under_target(self, tmp_path):
+        (tmp_path / "pkg").mkdir()
+        inside = tmp_path / "pkg" / "a.py"
+        outside = tmp_path / "b.py"
+        for f in (inside, outside, tmp_path / "notes.md"):
+            f.write_text("")
+
+        with (
+            patch("starui.cli.sort.changed_since", return_value=[inside, outside, tmp_path / "notes.md"]),
+            patch("starui.cli.sort.sort_files", return_value={}) as sort,
+            patch("starui.cli.sort.status_context", return_value=nullcontext()),
+            patch("starui.cli.sort.success"),
+        ):
+            sort_command(
+                paths=[str(tmp_path / "pkg")],
+                check=True,
+                jobs=None,
+                since="main",
+                cache=False,
+                serve=False,
+                socket=None,
+                verbose=False,
+            )
+
+        assert sort.call_args.args[0] == [inside]
+
+    def test_nothing_changed_succeeds(self, tmp_path):
+        with patch("starui.cli.sort.changed_since", return_value=[]):
+            output = _run_sort_command(paths=[str(tmp_path)], since="main")
+
+        assert "OK: No .py files changed since main" in output
+
+    def test_git_error_exits(self, tmp_path):
+        with (
+            patch("starui.cli.sort.changed_since", side_effect=RuntimeError("not a git repository")),
+            pytest.raises(Exit),
+        ):
+            _run_sort_command(paths=[str(tmp_path)], since="main")
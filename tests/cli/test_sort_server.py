@@ -0,0 +1,155 @@
+"""Tests for the star sort --serve daemon."""
+
+import io
+import json
+import socket
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from starui.sort import load_sort_index
+from starui.sort_server import INVALID_PARAMS, METHOD_NOT_FOUND, PARSE_ERROR, SortServer, serve_socket, serve_stdio
+
+INDEX = {"flex": 0, "p-4": 1, "mt-2": 2}
+
+
+def _fake_build(tokens, binary):
+    return {t: INDEX[t] for t in tokens if t in INDEX}
+
+
+@pytest.fixture
+def binary(tmp_path, monkeypatch):
+    monkeypatch.setattr("pathlib.Path.home", lambda: tmp_path)
+    path = tmp_path / "tailwindcss"
+    path.write_bytes(b"v4")
+    with patch("starui.sort_server.TailwindBinaryManager") as manager:
+        manager.return_value.get_binary.return_value = path
+        yield path
+
+
+@pytest.fixture
+def server(binary):
+    with patch("starui.sort._build_sort_index", side_effect=_fake_build) as build:
+        srv = SortServer(poll_interval=0)
+        srv.build = build
+        yield srv
+
+
+def _request(method, params=None, msg_id=1):
+    return json.dumps({"jsonrpc": "2.0", "id": msg_id, "method": method, "params": params or {}})
+
+
+class TestSortServer:
+    def test_sorts_buffer(self, server):
+        assert server.sort('x = "mt-2 flex p-4"\n') == ('x = "flex p-4 mt-2"\n', True)
+
+    def test_sorted_buffer_is_unchanged(self, server):
+        assert server.sort('x = "flex p-4"\n') == ('x = "flex p-4"\n', False)
+
+    def test_known_tokens_skip_index_rebuild(self, server):
+        server.sort('x = "mt-2 flex"\n')
+        server.build.reset_mock()
+
+        server.sort('y = "flex mt-2 p-4"\n')
+        server.sort('z = "p-4 flex"\n')
+
+        # p-4 was new for the second buffer; the third needs nothing
+        assert server.build.call_count == 1
+
+    def test_non_python_path_is_left_alone(self, server):
+        assert server.sort('x = "mt-2 flex"\n', "notes.md") == ('x = "mt-2 flex"\n', False)
+
+    def test_binary_change_swaps_index(self, server, binary):
+        server.sort('x = "mt-2 flex"\n')
+        binary.write_bytes(b"v4.1")
+
+        with patch("starui.sort._build_sort_index", side_effect=lambda tokens, _: {"mt-2": 0, "flex": 1}):
+            server.poll_interval = 0.01
+            server.start()
+            deadline = time.monotonic() + 2
+            while server.sort('x = "flex mt-2"\n')[1] is False and time.monotonic() < deadline:
+                time.sleep(0.01)
+            server.stop()
+
+        assert server.sort('x = "flex mt-2"\n') == ('x = "mt-2 flex"\n', True)
+
+    def test_tokens_seen_during_rebuild_are_indexed(self, server, tmp_path):
+        server.sort('x = "mt-2 flex"\n')
+        upgraded = tmp_path / "bin" / "tailwindcss"
+        upgraded.parent.mkdir()
+        upgraded.write_bytes(b"v4.1")
+        real_load = load_sort_index
+
+        def load_racing_a_request(tokens, binary):
+            if threading.current_thread().name == "starui-sort-watch" and not server.stopped.is_set():
+                server.stop()
+                server.sort('y = "p-4 flex"\n')  # a request lands mid-rebuild, against the old binary
+            return real_load(tokens, binary)
+
+        with (
+            patch("starui.sort_server.TailwindBinaryManager") as manager,
+            patch("starui.sort_server.load_sort_index", side_effect=load_racing_a_request),
+        ):
+            manager.return_value.get_binary.return_value = upgraded
+            server.poll_interval = 0.01
+            server.start()
+            server._watcher.join(timeout=2)
+
+        assert server.sort('z = "p-4 mt-2 flex"\n') == ('z = "flex p-4 mt-2"\n', True)
+
+
+class TestHandle:
+    def test_sort_request(self, server):
+        response = json.loads(server.handle_line(_request("sort", {"source": '"mt-2 flex"', "path": "a.py"})))
+
+        assert response == {"jsonrpc": "2.0", "id": 1, "result": {"source": '"flex mt-2"', "changed": True}}
+
+    def test_parse_error(self, server):
+        assert json.loads(server.handle_line("{nope"))["error"]["code"] == PARSE_ERROR
+
+    def test_unknown_method(self, server):
+        assert json.loads(server.handle_line(_request("format")))["error"]["code"] == METHOD_NOT_FOUND
+
+    def test_missing_source(self, server):
+        assert json.loads(server.handle_line(_request("sort")))["error"]["code"] == INVALID_PARAMS
+
+    def test_notification_has_no_response(self, server):
+        assert server.handle_line(_request("ping", msg_id=None)) is None
+
+    def test_shutdown_stops_server(self, server):
+        server.handle_line(_request("shutdown"))
+
+        assert server.stopped.is_set()
+
+
+class TestTransports:
+    def test_stdio_answers_each_line_until_shutdown(self, server):
+        stdin = io.StringIO("\n".join([_request("ping"), _request("shutdown", msg_id=2), _request("ping", msg_id=3)]))
+        stdout = io.StringIO()
+
+        serve_stdio(server, stdin, stdout)
+
+        assert [json.loads(line)["id"] for line in stdout.getvalue().splitlines()] == [1, 2]
+
+    def test_unix_socket(self, server, tmp_path):
+        path = tmp_path / "sort.sock"
+        thread = threading.Thread(target=serve_socket, args=(server, path), daemon=True)
+        thread.start()
+        deadline = time.monotonic() + 2
+        while not path.exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(str(path))
+            reader = sock.makefile("r")
+            sock.sendall((_request("sort", {"source": '"mt-2 flex"'}) + "\n").encode())
+            first = json.loads(reader.readline())
+            sock.sendall((_request("shutdown", msg_id=2) + "\n").encode())
+            reader.readline()
+
+        thread.join(timeout=2)
+        assert first["result"]["source"] == '"flex mt-2"'
+        assert not thread.is_alive()
+        assert not path.exists()
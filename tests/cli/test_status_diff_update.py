@@ -358,6 +358,34 @@ class TestUpdateCommand:
         manifest = Manifest(root)
         assert manifest.get_installed()["button"]["checksum"] == compute_checksum(new_source)
 
+    @patch("starui.cli.update.RegistryClient")
+    @patch("starui.cli.update.get_project_config")
+    def test_installs_new_component_deps_and_warns_about_runtime(
+        self, mock_config_fn, mock_client_cls, cli, project, config
+    ):
+        runner, app = cli
+        root, comp_dir = project
+        mock_config_fn.return_value = config
+
+        new_source = "from .runtime import runtime_call\n"
+        runtime_source = "# runtime\n"
+        _install_component(root, comp_dir, "calendar", "# calendar v1\n")
+
+        mock_client = MagicMock()
+        mock_client.version = "main"
+        mock_client.get_metadata.return_value = {"checksum": compute_checksum(new_source)}
+        mock_client.get_source.side_effect = lambda name, kind="component": (
+            runtime_source if name == "runtime" else new_source
+        )
+        mock_client.resolve_dependencies.return_value = ["runtime", "calendar"]
+        mock_client_cls.return_value = mock_client
+
+        result = runner.invoke(app, ["update", "calendar"])
+        assert result.exit_code == 0
+        assert (comp_dir / "runtime.py").read_text() == runtime_source
+        assert "runtime" in Manifest(root).get_installed()
+        assert "register_runtime(app)" in result.output
+
     @patch("starui.cli.update.RegistryClient")
     @patch("starui.cli.update.get_project_config")
     def test_skips_modified_without_force(self, mock_config_fn, mock_client_cls, cli, project, config):
@@ -1,5 +1,7 @@
 from pathlib import Path
 
+import pytest
+
 from starui.config import (
     detect_component_dir,
     detect_css_output,
@@ -145,6 +147,67 @@ class TestLoadPyprojectConfig:
         assert config.css_output == Path("static/css/starui.css")
         assert config.css_dir is None
 
+    def test_reads_hoist_styles(self, tmp_path):
+        (tmp_path / "pyproject.toml").write_text("[tool.starui]\nhoist_styles = true\n")
+        config = load_pyproject_config(tmp_path)
+        assert config is not None
+        assert config.hoist_styles is True
+
+    def test_hoist_styles_defaults_to_false(self, tmp_path):
+        (tmp_path / "pyproject.toml").write_text('[tool.starui]\ncomponent_dir = "ui"\n')
+        config = load_pyproject_config(tmp_path)
+        assert config is not None
+        assert config.hoist_styles is False
+
+    def test_reads_fingerprint(self, tmp_path):
+        (tmp_path / "pyproject.toml").write_text("[tool.starui]\nfingerprint = true\n")
+        config = load_pyproject_config(tmp_path)
+        assert config is not None
+        assert config.fingerprint is True
+
+    def test_reads_tree_shake(self, tmp_path):
+        (tmp_path / "pyproject.toml").write_text("[tool.starui]\ntree_shake = true\n")
+        config = load_pyproject_config(tmp_path)
+        assert config is not None
+        assert config.tree_shake is True
+
+    def test_reads_critical_routes(self, tmp_path):
+        (tmp_path / "pyproject.toml").write_text(
+            '[tool.starui]\napp_file = "src/main.py"\ncritical_routes = ["/", "/docs"]\n'
+        )
+        config = load_pyproject_config(tmp_path)
+        assert config is not None
+        assert config.app_file_absolute == tmp_path / "src" / "main.py"
+        assert config.critical_routes == ("/", "/docs")
+
+    def test_reads_targets(self, tmp_path):
+        (tmp_path / "pyproject.toml").write_text(
+            "[tool.starui]\n"
+            'component_dir = "ui"\n'
+            'css_dir = "styles"\n'
+            "hoist_styles = true\n"
+            "[tool.starui.targets.admin]\n"
+            'css_output = "admin/static/admin.css"\n'
+            'css_dir = "admin/styles"\n'
+            "[tool.starui.targets.widget]\n"
+            'css_output = "widget/widget.css"\n'
+            "hoist_styles = false\n"
+        )
+        config = load_pyproject_config(tmp_path)
+        assert config is not None
+        admin, widget = config.targets["admin"], config.targets["widget"]
+        assert admin.css_dir_absolute == tmp_path / "admin" / "styles"
+        assert admin.component_dir == Path("ui")
+        assert admin.hoist_styles is True
+        assert widget.css_dir_absolute == tmp_path / "widget"
+        assert widget.hoist_styles is False
+        assert widget.targets == {}
+
+    def test_target_requires_css_output(self, tmp_path):
+        (tmp_path / "pyproject.toml").write_text('[tool.starui.targets.admin]\ncss_dir = "admin"\n')
+        with pytest.raises(ValueError, match="admin"):
+            load_pyproject_config(tmp_path)
+
     def test_css_dir_defaults_to_none(self, tmp_path):
         (tmp_path / "pyproject.toml").write_text('[tool.starui]\ncomponent_dir = "ui"\n')
         config = load_pyproject_config(tmp_path)
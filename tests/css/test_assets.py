@@ -0,0 +1,121 @@
+"""Tests for fingerprinted asset resolution and serving."""
+
+import gzip
+import json
+import os
+
+import pytest
+from starhtml import to_xml
+from starlette.applications import Starlette
+from starlette.testclient import TestClient
+
+from starui.assets import IMMUTABLE, CriticalStyles, asset_url, critical_css, register_assets
+
+HASHED = "starui.0123456789.css"
+
+
+@pytest.fixture
+def static(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    css_dir = tmp_path / "static" / "css"
+    css_dir.mkdir(parents=True)
+    (css_dir / "starui.css").write_text("body{}")
+    (css_dir / HASHED).write_text("body{}")
+    (css_dir / f"{HASHED}.gz").write_bytes(gzip.compress(b"body{}"))
+    (css_dir / "assets.json").write_text(json.dumps({"starui.css": HASHED}))
+    return css_dir
+
+
+@pytest.fixture
+def client(static):
+    app = Starlette()
+    register_assets(app)
+    return TestClient(app)
+
+
+class TestAssetUrl:
+    def test_resolves_fingerprinted_name(self, static):
+        assert asset_url("/static/css/starui.css") == f"/static/css/{HASHED}"
+
+    def test_unknown_asset_is_unchanged(self, static):
+        assert asset_url("/static/css/other.css") == "/static/css/other.css"
+
+    def test_missing_manifest_is_unchanged(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        assert asset_url("/static/css/starui.css") == "/static/css/starui.css"
+
+    def test_explicit_manifest(self, static):
+        assert asset_url("/assets/starui.css", manifest=static / "assets.json") == f"/assets/{HASHED}"
+
+    def test_picks_up_rebuilt_manifest(self, static):
+        asset_url("/static/css/starui.css")
+        manifest = static / "assets.json"
+        manifest.write_text(json.dumps({"starui.css": "starui.abcdefabcd.css"}))
+        stat = manifest.stat()
+        os.utime(manifest, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert asset_url("/static/css/starui.css") == "/static/css/starui.abcdefabcd.css"
+
+
+class TestRegisterAssets:
+    def test_serves_gzip_variant(self, client):
+        response = client.get(f"/static/css/{HASHED}", headers={"Accept-Encoding": "gzip"})
+
+        assert response.text == "body{}"
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["cache-control"] == IMMUTABLE
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.headers["content-type"].startswith("text/css")
+
+    def test_falls_back_to_identity(self, client):
+        response = client.get(f"/static/css/{HASHED}", headers={"Accept-Encoding": "gzip;q=0"})
+
+        assert "content-encoding" not in response.headers
+        assert response.text == "body{}"
+
+    def test_unfingerprinted_file_is_not_immutable(self, client):
+        response = client.get("/static/css/starui.css")
+
+        assert response.status_code == 200
+        assert "immutable" not in response.headers.get("cache-control", "")
+
+    def test_missing_file(self, client):
+        assert client.get("/static/css/nope.css").status_code == 404
+
+    def test_registers_once(self, static):
+        app = Starlette()
+        register_assets(app)
+        register_assets(app)
+
+        assert len(app.router.routes) == 1
+
+
+class TestCriticalStyles:
+    def test_inlines_route_css_and_defers_full_sheet(self, static):
+        (static / "critical" / "starui").mkdir(parents=True)
+        (static / "critical" / "starui" / "docs-button.css").write_text(".flex{display:flex}")
+
+        html = "".join(to_xml(tag) for tag in CriticalStyles("/docs/button"))
+
+        assert "<style>.flex{display:flex}</style>" in html
+        assert f'rel="preload" href="/static/css/{HASHED}"' in html
+        assert 'as="style"' in html
+        assert "<noscript>" in html
+
+    def test_without_critical_css_links_stylesheet(self, static):
+        (tag,) = CriticalStyles("/")
+
+        assert to_xml(tag).strip() == f'<link rel="stylesheet" href="/static/css/{HASHED}">'
+
+    def test_reads_the_target_named_by_href(self, static):
+        for target in ("starui", "admin"):
+            (static / "critical" / target).mkdir(parents=True)
+            (static / "critical" / target / "index.css").write_text(f".{target}{{}}")
+
+        html = "".join(to_xml(tag) for tag in CriticalStyles("/", href="/static/css/admin.css"))
+
+        assert "<style>.admin{}</style>" in html
+        assert critical_css("/", target="starui") == ".starui{}"
+
+    def test_critical_css_missing_route(self, static):
+        assert critical_css("/nope") == ""
@@ -0,0 +1,110 @@
+"""Tests for per-route critical CSS extraction."""
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from starui.critical import (
+    CriticalCSSError,
+    build_critical_css,
+    load_app,
+    page_classes,
+    render_routes,
+    route_slug,
+)
+from starui.css import BuildMode, BuildResult
+
+APP = """\
+from starhtml import *
+from widgets import banner
+
+app, rt = star_app()
+
+@rt("/")
+def home():
+    return Div(banner(), cls="flex p-4")
+
+@rt("/docs/button")
+def button():
+    return Button("Go", cls="px-[calc(1rem+2px)] hover:bg-primary", data_class_hidden="$closed")
+"""
+
+
+@pytest.fixture
+def app_file(tmp_path, monkeypatch):
+    # star_app() writes its session key to the working directory
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "widgets.py").write_text('from starhtml import P\n\ndef banner():\n    return P("hi", cls="text-sm")\n')
+    path = tmp_path / "app.py"
+    path.write_text(APP)
+    return path
+
+
+class TestPageClasses:
+    def test_collects_class_tokens(self):
+        html = '<div class="flex  p-4"><span class="grid-cols-[1fr_auto] p-4">x</span></div>'
+
+        assert page_classes(html) == {"flex", "p-4", "grid-cols-[1fr_auto]"}
+
+    def test_includes_datastar_toggled_classes(self):
+        assert page_classes('<div data-class:hidden="$open"></div>') == {"hidden"}
+
+    def test_ignores_text_and_scripts(self):
+        assert page_classes('<script>el.class = "flex"</script><p>class="p-4"</p>') == set()
+
+
+class TestRouteSlug:
+    @pytest.mark.parametrize(
+        ("route", "slug"),
+        [("/", "index"), ("/docs/button", "docs-button"), ("/docs/", "docs"), ("/search?q=a", "search")],
+    )
+    def test_slug(self, route, slug):
+        assert route_slug(route) == slug
+
+
+class TestRenderRoutes:
+    def test_renders_app_routes(self, app_file):
+        pages = render_routes(load_app(app_file), ["/", "/docs/button"])
+
+        assert {"flex", "p-4", "text-sm"} <= page_classes(pages["/"])
+        assert {"px-[calc(1rem+2px)]", "hover:bg-primary"} <= page_classes(pages["/docs/button"])
+
+    def test_missing_route_fails(self, app_file):
+        with pytest.raises(CriticalCSSError, match="404"):
+            render_routes(load_app(app_file), ["/nope"])
+
+    def test_missing_app_file(self, tmp_path):
+        with pytest.raises(CriticalCSSError, match="not found"):
+            load_app(tmp_path / "missing.py")
+
+    def test_module_without_app(self, tmp_path):
+        path = tmp_path / "lib.py"
+        path.write_text("x = 1\n")
+
+        with pytest.raises(CriticalCSSError, match="no 'app'"):
+            load_app(path)
+
+
+class TestBuildCriticalCSS:
+    def test_one_stylesheet_per_route(self, tmp_path):
+        builder = MagicMock()
+        builder.build_critical.side_effect = lambda classes, output, mode: BuildResult(success=True, css_path=output)
+        (tmp_path / "old-route.css").write_text("")
+
+        results = build_critical_css(
+            builder, {"/": '<p class="flex">', "/about": '<p class="grid">'}, tmp_path, BuildMode.PRODUCTION
+        )
+
+        assert results["/"].css_path == tmp_path / "index.css"
+        assert results["/about"].css_path == tmp_path / "about.css"
+        assert builder.build_critical.call_args_list[0].args[0] == {"flex"}
+        assert not (tmp_path / "old-route.css").exists()
+
+    def test_failures_are_reported_per_route(self, tmp_path):
+        builder = MagicMock()
+        builder.build_critical.return_value = BuildResult(success=False, error_message="boom")
+
+        results = build_critical_css(builder, {"/": "<p>"}, Path(tmp_path))
+
+        assert results["/"].error_message == "boom"
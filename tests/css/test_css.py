@@ -1,9 +1,34 @@
+import gzip
+import hashlib
+import json
+import threading
+import time
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
+import requests
 
-from starui.css import BinaryError, BuildResult, get_binary_name, get_cache_dir, get_platform_info
+from starui.config import ProjectConfig
+from starui.css import (
+    BinaryError,
+    BuildMode,
+    BuildResult,
+    CSSBuilder,
+    NetworkError,
+    TailwindBinaryManager,
+    build_report,
+    build_targets,
+    collect_component_styles,
+    critical_input,
+    fingerprint_css,
+    get_binary_name,
+    get_cache_dir,
+    get_platform_info,
+    shake_theme,
+    sources_digest,
+    unused_theme_variables,
+)
 
 
 class TestGetPlatformInfo:
@@ -101,3 +126,694 @@ class TestBuildResult:
         assert result.css_path == Path("static/css/starui.css")
         assert result.build_time == 1.23
         assert result.css_size_bytes == 4096
+
+
+class TestCollectComponentStyles:
+    def test_constants_and_literals(self, tmp_path):
+        (tmp_path / "dialog.py").write_text(
+            '_DIALOG_STYLES = """\n.dlg{a:b}\n"""\n\ndef Dialog():\n    return component_style(_DIALOG_STYLES)\n'
+        )
+        (tmp_path / "sheet.py").write_text('def Sheet():\n    return component_style(".sheet{c:d}")\n')
+        assert collect_component_styles(tmp_path) == ".dlg{a:b}\n.sheet{c:d}"
+
+    def test_deduplicates_shared_css(self, tmp_path):
+        for name in ("select", "combobox"):
+            (tmp_path / f"{name}.py").write_text('_POPOVER_ANIMATE = ".pop{}"\nx = component_style(_POPOVER_ANIMATE)\n')
+        assert collect_component_styles(tmp_path) == ".pop{}"
+
+    def test_ignores_unreferenced_and_dynamic(self, tmp_path):
+        (tmp_path / "theme.py").write_text('_UNUSED_STYLES = ".u{}"\nx = component_style(f".t{{{y}}}")\n')
+        assert collect_component_styles(tmp_path) == ""
+
+    def test_skips_unparsable_files(self, tmp_path):
+        (tmp_path / "broken.py").write_text("def (:\n")
+        assert collect_component_styles(tmp_path) == ""
+
+    def test_missing_dir(self, tmp_path):
+        assert collect_component_styles(tmp_path / "nope") == ""
+
+
+class TestCSSBuilderHoistStyles:
+    def _build(self, tmp_path, *, hoist_styles, input_css=None):
+        comp_dir = tmp_path / "components" / "ui"
+        comp_dir.mkdir(parents=True)
+        (comp_dir / "dialog.py").write_text('_S = ".dlg{a:b}"\nx = component_style(_S)\n')
+        css_dir = tmp_path / "static" / "css"
+        css_dir.mkdir(parents=True)
+        if input_css is not None:
+            (css_dir / "input.css").write_text(input_css)
+
+        config = ProjectConfig(
+            project_root=tmp_path,
+            css_output=Path("static/css/starui.css"),
+            component_dir=Path("components/ui"),
+            hoist_styles=hoist_styles,
+        )
+        seen = {}
+
+        def fake_run(cmd, **kwargs):
+            input_path = Path(cmd[cmd.index("-i") + 1])
+            seen["input"] = input_path
+            seen["content"] = input_path.read_text()
+            return MagicMock(returncode=0, stderr="")
+
+        builder = CSSBuilder(config)
+        with (
+            patch.object(builder.binary_manager, "get_binary", return_value=Path("/bin/tailwindcss")),
+            patch("starui.css.subprocess.run", side_effect=fake_run),
+        ):
+            assert builder.build().success
+        return seen, css_dir
+
+    def test_appends_component_css_to_generated_input(self, tmp_path):
+        seen, _ = self._build(tmp_path, hoist_styles=True)
+        assert seen["content"].startswith('@import "tailwindcss"')
+        assert seen["content"].rstrip().endswith(".dlg{a:b}")
+        assert not seen["input"].exists()
+
+    def test_appends_to_project_input_in_same_dir(self, tmp_path):
+        seen, css_dir = self._build(tmp_path, hoist_styles=True, input_css='@import "tailwindcss";\n')
+        assert seen["input"].parent == css_dir
+        assert seen["input"].name != "input.css"
+        assert ".dlg{a:b}" in seen["content"]
+        assert (css_dir / "input.css").read_text() == '@import "tailwindcss";\n'
+
+    def test_disabled_uses_project_input_directly(self, tmp_path):
+        seen, css_dir = self._build(tmp_path, hoist_styles=False, input_css='@import "tailwindcss";\n')
+        assert seen["input"] == css_dir / "input.css"
+        assert ".dlg" not in seen["content"]
+
+
+class TestCriticalInput:
+    def test_disables_source_detection(self):
+        css = critical_input('@import "tailwindcss";\n@source "../app";\n@theme { --x: 1; }\n', {"flex", "p-4"})
+
+        assert css.startswith('@import "tailwindcss" source(none);')
+        assert '@source "../app"' not in css
+        assert "@theme { --x: 1; }" in css
+        assert css.rstrip().endswith('@source inline("flex p-4");')
+
+    def test_replaces_existing_import_source(self):
+        css = critical_input("@import 'tailwindcss' source('../src');\n", {"flex"})
+
+        assert css.startswith('@import "tailwindcss" source(none);')
+
+    def test_keeps_source_not(self):
+        assert '@source not "../legacy";' in critical_input('@source not "../legacy";\n', set())
+
+    def test_drops_unsafe_candidates(self):
+        css = critical_input("", {"flex", 'content-["x"]', "grid-{a,b}"})
+
+        assert css.rstrip().endswith('@source inline("flex");')
+
+    def test_build_critical_runs_with_rewritten_input(self, tmp_path):
+        config = ProjectConfig(
+            project_root=tmp_path,
+            css_output=Path("static/css/starui.css"),
+            component_dir=Path("components/ui"),
+        )
+        seen = {}
+
+        def fake_run(cmd, **kwargs):
+            seen["content"] = Path(cmd[cmd.index("-i") + 1]).read_text()
+            seen["minify"] = "--minify" in cmd
+            Path(cmd[cmd.index("-o") + 1]).write_text(".flex{display:flex}")
+            return MagicMock(returncode=0, stderr="")
+
+        builder = CSSBuilder(config)
+        output = tmp_path / "static" / "css" / "critical" / "index.css"
+        with (
+            patch.object(builder.binary_manager, "get_binary", return_value=Path("/bin/tailwindcss")),
+            patch("starui.css.subprocess.run", side_effect=fake_run),
+        ):
+            result = builder.build_critical({"flex"}, output)
+
+        assert result.success
+        assert result.css_size_bytes == len(".flex{display:flex}")
+        assert "source(none)" in seen["content"]
+        assert seen["minify"]
+
+
+class TestBuildTargets:
+    def _targets(self, tmp_path, *names):
+        return {
+            name: ProjectConfig(
+                project_root=tmp_path, css_output=Path(f"{name}/out.css"), component_dir=Path("components/ui")
+            )
+            for name in names
+        }
+
+    def test_targets_build_concurrently(self, tmp_path):
+        # Deadlocks (and times out) unless all three builds are in flight at once
+        barrier = threading.Barrier(3, timeout=5)
+
+        def build(self, mode):
+            barrier.wait()
+            return BuildResult(success=True, css_path=self.config.css_output_absolute)
+
+        with (
+            patch("starui.css.TailwindBinaryManager"),
+            patch("starui.css.binary_digest"),
+            patch.object(CSSBuilder, "build", build),
+        ):
+            results = build_targets(self._targets(tmp_path, "admin", "site", "widget"), jobs=3)
+
+        assert list(results) == ["admin", "site", "widget"]
+        assert results["site"].css_path == tmp_path / "site" / "out.css"
+
+    def test_first_failure_cancels_pending_targets(self, tmp_path):
+        built = []
+
+        def build(self, mode):
+            built.append(self.config.css_output.parent.name)
+            return BuildResult(success=False, error_message="syntax error")
+
+        with (
+            patch("starui.css.TailwindBinaryManager"),
+            patch("starui.css.binary_digest"),
+            patch.object(CSSBuilder, "build", build),
+        ):
+            results = build_targets(self._targets(tmp_path, "admin", "site", "widget"), jobs=1)
+
+        assert built == ["admin"]
+        assert results == {"admin": BuildResult(success=False, error_message="syntax error")}
+
+    def test_passes_mode_and_cache(self, tmp_path):
+        seen = []
+
+        def build(self, mode):
+            seen.append((mode, self.cache))
+            return BuildResult(success=True)
+
+        with (
+            patch("starui.css.TailwindBinaryManager"),
+            patch("starui.css.binary_digest"),
+            patch.object(CSSBuilder, "build", build),
+        ):
+            build_targets(self._targets(tmp_path, "admin"), BuildMode.PRODUCTION, cache=False)
+
+        assert seen == [(BuildMode.PRODUCTION, False)]
+
+
+class TestBuildReport:
+    def test_stable_schema(self, tmp_path):
+        css = tmp_path / "static" / "starui.css"
+        css.parent.mkdir()
+        css.write_text(".flex{display:flex}" * 50)
+        result = BuildResult(
+            success=True,
+            css_path=css,
+            build_time=1.23456,
+            css_size_bytes=css.stat().st_size,
+            phases={"binary": 0.0101, "input": 0.002, "cache": 0.1, "tailwind": 1.1, "stat": 0.0001},
+        )
+
+        report = build_report({"default": result}, BuildMode.PRODUCTION, tmp_path)
+
+        target = report["targets"]["default"]
+        assert report["schema"] == 1 and report["mode"] == "production"
+        assert target["output"] == "static/starui.css"
+        assert target["time"] == {
+            "total": 1.235,
+            "binary": 0.01,
+            "input": 0.002,
+            "cache": 0.1,
+            "tailwind": 1.1,
+            "stat": 0.0,
+        }
+        assert target["size"]["raw"] == 950
+        assert target["size"]["gzip"] == len(gzip.compress(css.read_bytes(), compresslevel=9, mtime=0))
+
+    def test_phases_that_did_not_run_are_null(self, tmp_path):
+        result = BuildResult(success=False, error_message="boom", phases={"binary": 0.5})
+
+        target = build_report({"default": result}, BuildMode.DEVELOPMENT, tmp_path)["targets"]["default"]
+
+        assert target["time"]["tailwind"] is None
+        assert target["size"] == {"raw": None, "gzip": None, "brotli": None}
+        assert target["error"] == "boom"
+
+    def test_brotli_size_is_null_without_brotli(self, tmp_path):
+        css = tmp_path / "starui.css"
+        css.write_text("a{}")
+
+        with patch.dict("sys.modules", {"brotli": None}):
+            report = build_report({"default": BuildResult(success=True, css_path=css)}, BuildMode.PRODUCTION, tmp_path)
+
+        assert report["targets"]["default"]["size"]["brotli"] is None
+
+
+class TestShakeTheme:
+    CSS = """:root {
+  --primary: red;
+  --chart-1: blue;
+  --sidebar: white;
+  --sidebar-primary: black;
+  --radius: 1rem;
+}
+[data-theme="blue"] { --primary: navy; --chart-1: teal; }
+@theme inline {
+  --color-primary: var(--primary);
+  --color-chart-1: var(--chart-1);
+  --color-sidebar: var(--sidebar);
+  --color-sidebar-primary: var(--sidebar-primary);
+  --radius: var(--radius);
+}
+@layer base {
+  body { @apply bg-sidebar-primary; }
+}
+"""
+
+    def test_unused_colors(self):
+        assert unused_theme_variables(self.CSS, ['Div(cls="text-primary")']) == {"chart-1", "sidebar"}
+
+    def test_var_reference_keeps_variable(self):
+        assert "chart-1" not in unused_theme_variables(self.CSS, ["style='fill: var(--chart-1)'"])
+
+    def test_longer_token_is_not_a_use_of_its_prefix(self):
+        # bg-sidebar-primary (from @apply) must not keep --sidebar alive
+        assert "sidebar" in unused_theme_variables(self.CSS, [])
+
+    def test_removes_declarations_and_mappings(self):
+        css = shake_theme(self.CSS, ['Div(cls="text-primary")'])
+
+        assert "--chart-1" not in css
+        assert "--sidebar:" not in css and "--color-sidebar:" not in css
+        assert "--sidebar-primary: black;" in css
+        assert "--radius: 1rem;" in css
+        assert '[data-theme="blue"] { --primary: navy; }' in css
+        assert "\n\n  --" not in css
+
+    def test_without_theme_inline_is_unchanged(self):
+        assert shake_theme(":root { --x: 1; }", []) == ":root { --x: 1; }"
+
+    def test_builder_shakes_generated_input(self, tmp_path):
+        (tmp_path / "app.py").write_text('Div(cls="bg-primary text-primary-foreground")\n')
+        css_dir = tmp_path / "static" / "css"
+        css_dir.mkdir(parents=True)
+        # A stale build referencing everything must not keep variables alive
+        (css_dir / "starui.css").write_text(".bg-chart-1{background:var(--chart-1)}")
+        config = ProjectConfig(
+            project_root=tmp_path,
+            css_output=Path("static/css/starui.css"),
+            component_dir=Path("components/ui"),
+            tree_shake=True,
+        )
+
+        with patch("starui.css._git_sources", return_value=None):
+            css_input, _, input_file = CSSBuilder(config)._input()
+
+        assert "--primary-foreground:" in css_input
+        assert "--chart-1" not in css_input
+        assert "--sidebar" not in css_input
+        assert input_file is None
+
+
+class TestSourcesDigest:
+    def _tree(self, root, content="a"):
+        (root / "app").mkdir(parents=True)
+        (root / "app" / "main.py").write_text(content)
+        (root / "logo.png").write_bytes(b"\x89PNG")
+        return [root / "app" / "main.py", root / "logo.png"]
+
+    def test_same_content_in_different_roots_matches(self, tmp_path):
+        a, b = tmp_path / "a", tmp_path / "b"
+        assert sources_digest(a, self._tree(a)) == sources_digest(b, self._tree(b))
+
+    def test_content_change_differs(self, tmp_path):
+        a, b = tmp_path / "a", tmp_path / "b"
+        assert sources_digest(a, self._tree(a)) != sources_digest(b, self._tree(b, content="b"))
+
+    def test_binary_assets_and_excluded_files_are_ignored(self, tmp_path):
+        files = self._tree(tmp_path)
+        before = sources_digest(tmp_path, files, exclude={files[0]})
+        (tmp_path / "logo.png").write_bytes(b"changed")
+        files[0].write_text("changed")
+
+        assert sources_digest(tmp_path, files, exclude={files[0]}) == before
+
+
+class TestCSSBuilderCache:
+    @pytest.fixture
+    def project(self, tmp_path, monkeypatch):
+        home = tmp_path / "home"
+        monkeypatch.setattr("pathlib.Path.home", lambda: home)
+        root = tmp_path / "project"
+        (root / "static" / "css").mkdir(parents=True)
+        (root / "app.py").write_text('Div(cls="flex p-4")\n')
+        binary = tmp_path / "tailwindcss"
+        binary.write_bytes(b"tw")
+        config = ProjectConfig(project_root=root, css_output=Path("static/css/starui.css"), component_dir=Path("ui"))
+        return config, binary
+
+    def _build(self, project, *, mode=BuildMode.DEVELOPMENT, cache=True):
+        config, binary = project
+        runs = []
+
+        def fake_run(cmd, **kwargs):
+            if cmd[0] == "git":
+                return MagicMock(returncode=128, stdout=b"")
+            runs.append(cmd)
+            Path(cmd[cmd.index("-o") + 1]).write_text(f".flex{{display:flex}}/*{len(runs)}*/")
+            return MagicMock(returncode=0, stderr="")
+
+        builder = CSSBuilder(config, cache=cache)
+        with (
+            patch.object(builder.binary_manager, "get_binary", return_value=binary),
+            patch("starui.css.subprocess.run", side_effect=fake_run),
+        ):
+            result = builder.build(mode)
+        assert result.success
+        return result, runs
+
+    def test_second_build_restores_from_cache(self, project):
+        first, runs = self._build(project)
+        assert not first.cache_hit and len(runs) == 1
+        output = first.css_path.read_text()
+        first.css_path.unlink()
+
+        second, runs = self._build(project)
+
+        assert second.cache_hit
+        assert runs == []
+        assert second.css_path.read_text() == output
+        assert second.css_size_bytes == len(output)
+
+    def test_records_phase_timings(self, project):
+        result, _ = self._build(project)
+
+        assert set(result.phases) == {"binary", "input", "cache", "tailwind", "stat"}
+        assert all(t >= 0 for t in result.phases.values())
+
+    def test_cache_hit_skips_tailwind_phase(self, project):
+        self._build(project)
+        result, _ = self._build(project)
+
+        assert set(result.phases) == {"binary", "input", "cache"}
+
+    def test_existing_output_does_not_change_key(self, project):
+        self._build(project)
+        result, _ = self._build(project)
+        assert result.cache_hit
+
+    def test_generated_artifacts_do_not_change_key(self, project):
+        first, _ = self._build(project)
+        fingerprint_css(first.css_path)
+        critical = first.css_path.parent / "critical" / "starui"
+        critical.mkdir(parents=True)
+        (critical / "index.css").write_text(".flex{display:flex}")
+        (first.css_path.parent / "starui.css.123.tmp").write_text("partial")
+
+        assert self._build(project)[0].cache_hit
+
+    def test_sibling_target_output_does_not_change_key(self, project):
+        config, _ = project
+        config.targets["admin"] = ProjectConfig(
+            project_root=config.project_root, css_output=Path("static/admin.css"), component_dir=Path("ui")
+        )
+        self._build(project)
+        (config.project_root / "static" / "admin.css").write_text(".grid{display:grid}")
+
+        assert self._build(project)[0].cache_hit
+
+    def test_identical_binary_elsewhere_hits(self, project, tmp_path):
+        config, binary = project
+        self._build(project)
+        fresh = tmp_path / "download" / "tailwindcss"
+        fresh.parent.mkdir()
+        fresh.write_bytes(binary.read_bytes())
+
+        assert self._build((config, fresh))[0].cache_hit
+
+    def test_binary_change_misses(self, project):
+        _, binary = project
+        self._build(project)
+        binary.write_bytes(b"tw v2")
+
+        assert not self._build(project)[0].cache_hit
+
+    def test_source_change_misses(self, project):
+        config, _ = project
+        self._build(project)
+        (config.project_root / "app.py").write_text('Div(cls="grid")\n')
+
+        result, runs = self._build(project)
+
+        assert not result.cache_hit and len(runs) == 1
+
+    def test_input_css_change_misses(self, project):
+        config, _ = project
+        self._build(project)
+        (config.css_dir_absolute / "input.css").write_text('@import "tailwindcss";\n')
+
+        assert not self._build(project)[0].cache_hit
+
+    def test_mode_is_part_of_key(self, project):
+        self._build(project)
+        assert not self._build(project, mode=BuildMode.PRODUCTION)[0].cache_hit
+
+    def test_disabled_always_runs_tailwind(self, project):
+        self._build(project, cache=False)
+        result, runs = self._build(project, cache=False)
+        assert not result.cache_hit and len(runs) == 1
+
+
+class _FakeResponse:
+    def __init__(self, body=b"", status=200, fail_after=None):
+        self.body, self.status_code, self.fail_after = body, status, fail_after
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(str(self.status_code))
+
+    def iter_content(self, chunk_size):
+        for i in range(0, len(self.body), 4):
+            if self.fail_after is not None and i >= self.fail_after:
+                raise requests.ConnectionError("connection reset")
+            yield self.body[i : i + 4]
+
+
+def _part(target, tag="v4.1.0"):
+    return target.with_name(f"{target.name}.{tag}.part")
+
+
+class TestBinaryDownload:
+    BODY = b"tailwind-binary-bytes"
+    SHA = hashlib.sha256(BODY).hexdigest()
+
+    @pytest.fixture
+    def target(self, tmp_path):
+        return tmp_path / "tailwindcss-linux-x64"
+
+    def test_streams_verifies_and_installs(self, target):
+        with patch("starui.css.requests.get", return_value=_FakeResponse(self.BODY)) as get:
+            TailwindBinaryManager()._download_binary("https://x/bin", target, self.SHA, tag="v4.1.0")
+
+        assert get.call_args.kwargs["stream"] is True
+        assert target.read_bytes() == self.BODY
+        assert target.stat().st_mode & 0o111
+        assert not _part(target).exists()
+
+    def test_checksum_mismatch_discards_download(self, target):
+        with (
+            patch("starui.css.requests.get", return_value=_FakeResponse(b"tampered")),
+            pytest.raises(BinaryError, match="Checksum mismatch"),
+        ):
+            TailwindBinaryManager()._download_binary("https://x/bin", target, self.SHA, tag="v4.1.0")
+
+        assert not target.exists()
+        assert not _part(target).exists()
+
+    def test_interrupted_download_resumes_with_range(self, target):
+        manager = TailwindBinaryManager()
+        with (
+            patch("starui.css.requests.get", return_value=_FakeResponse(self.BODY, fail_after=8)),
+            pytest.raises(NetworkError),
+        ):
+            manager._download_binary("https://x/bin", target, self.SHA, tag="v4.1.0")
+        assert _part(target).read_bytes() == self.BODY[:8]
+
+        with patch("starui.css.requests.get", return_value=_FakeResponse(self.BODY[8:], status=206)) as get:
+            manager._download_binary("https://x/bin", target, self.SHA, tag="v4.1.0")
+
+        assert get.call_args.kwargs["headers"] == {"Range": "bytes=8-"}
+        assert target.read_bytes() == self.BODY
+
+    def test_ignored_range_restarts(self, target):
+        _part(target).write_bytes(b"stale")
+
+        with patch("starui.css.requests.get", return_value=_FakeResponse(self.BODY, status=200)):
+            TailwindBinaryManager()._download_binary("https://x/bin", target, self.SHA, tag="v4.1.0")
+
+        assert target.read_bytes() == self.BODY
+
+    def test_complete_partial_is_verified_and_installed(self, target):
+        _part(target).write_bytes(self.BODY)
+
+        with patch("starui.css.requests.get", return_value=_FakeResponse(status=416)):
+            TailwindBinaryManager()._download_binary("https://x/bin", target, self.SHA, tag="v4.1.0")
+
+        assert target.read_bytes() == self.BODY
+
+    def test_partial_of_another_release_is_not_resumed(self, target):
+        _part(target, "v4.0.0").write_bytes(self.BODY[:8])
+
+        with patch("starui.css.requests.get", return_value=_FakeResponse(self.BODY)) as get:
+            TailwindBinaryManager()._download_binary("https://x/bin", target, self.SHA, tag="v4.1.0")
+
+        assert get.call_args.kwargs["headers"] == {}
+        assert target.read_bytes() == self.BODY
+        assert not _part(target, "v4.0.0").exists()
+
+    def test_refuses_download_without_checksum(self, target, monkeypatch):
+        monkeypatch.delenv("STARUI_ALLOW_UNVERIFIED_TAILWIND", raising=False)
+
+        with (
+            patch("starui.css.requests.get") as get,
+            pytest.raises(BinaryError, match="STARUI_ALLOW_UNVERIFIED_TAILWIND"),
+        ):
+            TailwindBinaryManager()._download_binary("https://x/bin", target, None, tag="v4.1.0")
+
+        get.assert_not_called()
+        assert not target.exists()
+
+    def test_env_opts_into_unverified_download(self, target, monkeypatch):
+        monkeypatch.setenv("STARUI_ALLOW_UNVERIFIED_TAILWIND", "1")
+
+        with patch("starui.css.requests.get", return_value=_FakeResponse(self.BODY)):
+            TailwindBinaryManager()._download_binary("https://x/bin", target, None, tag="v4.1.0")
+
+        assert target.read_bytes() == self.BODY
+
+    def test_partial_is_not_resumed_without_checksum(self, target):
+        _part(target).write_bytes(b"corrupt")
+
+        with patch("starui.css.requests.get", return_value=_FakeResponse(self.BODY)) as get:
+            manager = TailwindBinaryManager(allow_unverified=True)
+            manager._download_binary("https://x/bin", target, None, tag="v4.1.0")
+
+        assert get.call_args.kwargs["headers"] == {}
+        assert target.read_bytes() == self.BODY
+
+    def test_concurrent_get_binary_downloads_once(self, target):
+        calls = []
+
+        def slow_download(url, path, checksum, *, tag):
+            calls.append(url)
+            time.sleep(0.1)
+            path.write_bytes(self.BODY)
+
+        manager = TailwindBinaryManager(version="4.1.0")
+        with (
+            patch("starui.css.shutil.which", return_value=None),
+            patch.object(TailwindBinaryManager, "_get_binary_path", return_value=target),
+            patch.object(TailwindBinaryManager, "_expected_checksum", return_value=self.SHA),
+            patch.object(TailwindBinaryManager, "_download_binary", side_effect=slow_download),
+        ):
+            threads = [threading.Thread(target=manager.get_binary) for _ in range(4)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+        assert len(calls) == 1
+        assert target.read_bytes() == self.BODY
+
+
+class TestExpectedChecksum:
+    SUMS = "abc123  ./dist/tailwindcss-linux-x64\ndef456  ./dist/tailwindcss-macos-arm64\n"
+
+    def test_reads_release_sums_file(self):
+        response = MagicMock(text=self.SUMS)
+        with patch("starui.css.requests.get", return_value=response) as get:
+            checksum = TailwindBinaryManager()._expected_checksum("v4.1.0", "tailwindcss-macos-arm64")
+
+        assert checksum == "def456"
+        assert get.call_args.args[0].endswith("/v4.1.0/sha256sums.txt")
+
+    def test_pinned_checksum_wins(self):
+        with (
+            patch.dict("starui.css.TAILWIND_CHECKSUMS", {"v4.1.0": {"tailwindcss-linux-x64": "pinned"}}),
+            patch("starui.css.requests.get") as get,
+        ):
+            assert TailwindBinaryManager()._expected_checksum("v4.1.0", "tailwindcss-linux-x64") == "pinned"
+        get.assert_not_called()
+
+    def test_unavailable_sums_file(self):
+        with patch("starui.css.requests.get", side_effect=requests.ConnectionError()):
+            assert TailwindBinaryManager()._expected_checksum("v4.1.0", "tailwindcss-linux-x64") is None
+
+
+class TestFingerprintCSS:
+    def test_writes_hashed_copy_and_manifest(self, tmp_path):
+        css = tmp_path / "starui.css"
+        css.write_text("body{color:red}")
+
+        hashed = fingerprint_css(css)
+
+        digest = hashlib.sha256(b"body{color:red}").hexdigest()[:10]
+        assert hashed.name == f"starui.{digest}.css"
+        assert hashed.read_text() == "body{color:red}"
+        assert gzip.decompress(hashed.with_name(hashed.name + ".gz").read_bytes()) == b"body{color:red}"
+        assert json.loads((tmp_path / "assets.json").read_text()) == {"starui.css": hashed.name}
+
+    def test_gzip_output_is_reproducible(self, tmp_path):
+        css = tmp_path / "starui.css"
+        css.write_text("body{}")
+        first = fingerprint_css(css).with_suffix(".css.gz").read_bytes()
+
+        assert fingerprint_css(css).with_suffix(".css.gz").read_bytes() == first
+
+    def test_removes_previous_fingerprint(self, tmp_path):
+        css = tmp_path / "starui.css"
+        css.write_text("a{}")
+        old = fingerprint_css(css)
+        css.write_text("b{}")
+
+        new = fingerprint_css(css)
+
+        assert new != old
+        assert not old.exists()
+        assert not old.with_name(old.name + ".gz").exists()
+
+    def test_keeps_other_manifest_entries(self, tmp_path):
+        (tmp_path / "assets.json").write_text('{"admin.css": "admin.0123456789.css"}')
+        css = tmp_path / "starui.css"
+        css.write_text("a{}")
+
+        hashed = fingerprint_css(css)
+
+        manifest = json.loads((tmp_path / "assets.json").read_text())
+        assert manifest == {"admin.css": "admin.0123456789.css", "starui.css": hashed.name}
+
+    def test_skips_brotli_when_unavailable(self, tmp_path, caplog):
+        css = tmp_path / "starui.css"
+        css.write_text("a{}")
+
+        with (
+            patch.dict("sys.modules", {"brotli": None}),
+            patch("starui.css._brotli_warned", False),
+            caplog.at_level("WARNING", logger="starui.css"),
+        ):
+            hashed = fingerprint_css(css)
+            fingerprint_css(css)
+
+        assert not hashed.with_name(hashed.name + ".br").exists()
+        assert [r.message for r in caplog.records].count(
+            "brotli is not installed; skipping .br output (pip install 'starui[compress]')"
+        ) == 1
+
+    def test_writes_brotli_variant(self, tmp_path):
+        brotli = pytest.importorskip("brotli")
+        css = tmp_path / "starui.css"
+        css.write_text("body{color:red}")
+
+        hashed = fingerprint_css(css)
+
+        assert brotli.decompress(hashed.with_name(hashed.name + ".br").read_bytes()) == b"body{color:red}"
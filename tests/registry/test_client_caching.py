@@ -1,4 +1,7 @@
+import io
 import json
+import tarfile
+import threading
 import time
 from unittest.mock import MagicMock, patch
 
@@ -6,7 +9,7 @@ import pytest
 import requests
 
 from starui.registry.checksum import compute_checksum
-from starui.registry.client import INDEX_TTL_SECONDS, RegistryClient
+from starui.registry.client import INDEX_TTL_SECONDS, RegistryClient, get_session
 
 from .conftest import make_block_entry, make_component_entry
 
@@ -42,7 +45,7 @@ def _make_response(text, status=200):
 
 
 class TestFreshFetch:
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_fetches_index_from_github(self, mock_get, home_dir):
         mock_get.return_value = _make_response(TEST_INDEX_TEXT)
 
@@ -58,7 +61,7 @@ class TestFreshFetch:
         assert cached["components"]["button"]["name"] == "button"
         assert (cache_dir / "index.meta.json").exists()
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_fetches_component_source_and_caches(self, mock_get, home_dir):
         mock_get.side_effect = [
             _make_response(TEST_INDEX_TEXT),
@@ -73,7 +76,7 @@ class TestFreshFetch:
         assert cached_file.exists()
         assert cached_file.read_bytes().decode("utf-8") == BUTTON_SOURCE
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_list_items_returns_sorted_without_utils(self, mock_get, home_dir):
         multi_index = {
             **TEST_INDEX,
@@ -91,7 +94,7 @@ class TestFreshFetch:
         assert result == ["alert", "button", "dialog"]
         assert "utils" not in result
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_metadata_returns_component_dict(self, mock_get, home_dir):
         mock_get.return_value = _make_response(TEST_INDEX_TEXT)
 
@@ -102,7 +105,7 @@ class TestFreshFetch:
         assert meta["dependencies"] == ["utils"]
         assert meta["checksum"] == BUTTON_CHECKSUM
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_nonexistent_component_raises(self, mock_get, home_dir):
         mock_get.return_value = _make_response(TEST_INDEX_TEXT)
 
@@ -110,7 +113,7 @@ class TestFreshFetch:
         with pytest.raises(FileNotFoundError, match="not found in registry"):
             client.get_source("nonexistent")
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_nonexistent_metadata_raises(self, mock_get, home_dir):
         mock_get.return_value = _make_response(TEST_INDEX_TEXT)
 
@@ -120,7 +123,7 @@ class TestFreshFetch:
 
 
 class TestCacheTTL:
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_fresh_cache_avoids_network(self, mock_get, home_dir):
         mock_get.return_value = _make_response(TEST_INDEX_TEXT)
 
@@ -133,7 +136,7 @@ class TestCacheTTL:
         assert "button" in components
         assert mock_get.call_count == 1
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_expired_cache_refetches(self, mock_get, home_dir):
         mock_get.return_value = _make_response(TEST_INDEX_TEXT)
 
@@ -148,7 +151,7 @@ class TestCacheTTL:
         client2.list_items("component")
         assert mock_get.call_count == 2
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_expired_cache_falls_back_on_network_error(self, mock_get, home_dir):
         mock_get.return_value = _make_response(TEST_INDEX_TEXT)
         client1 = RegistryClient(version="main")
@@ -166,11 +169,11 @@ class TestCacheTTL:
 
 
 class TestImmutableVersions:
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_tagged_version_cache_never_expires(self, mock_get, home_dir):
         mock_get.return_value = _make_response(TEST_INDEX_TEXT)
 
-        client1 = RegistryClient(version="v0.3.0")
+        client1 = RegistryClient(version="v0.3.0", snapshot=False)
         client1.list_items("component")
         assert mock_get.call_count == 1
 
@@ -178,12 +181,12 @@ class TestImmutableVersions:
         if meta_path.exists():
             meta_path.unlink()
 
-        client2 = RegistryClient(version="v0.3.0")
+        client2 = RegistryClient(version="v0.3.0", snapshot=False)
         components = client2.list_items("component")
         assert "button" in components
         assert mock_get.call_count == 1
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_main_branch_is_not_immutable(self, mock_get, home_dir):
         mock_get.return_value = _make_response(TEST_INDEX_TEXT)
 
@@ -199,7 +202,7 @@ class TestImmutableVersions:
 
 
 class TestComponentSourceCaching:
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_cached_source_served_on_checksum_match(self, mock_get, home_dir):
         mock_get.return_value = _make_response(TEST_INDEX_TEXT)
 
@@ -213,7 +216,7 @@ class TestComponentSourceCaching:
         assert source == BUTTON_SOURCE
         assert mock_get.call_count == 1
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_stale_cache_refetches_source(self, mock_get, home_dir):
         mock_get.side_effect = [
             _make_response(TEST_INDEX_TEXT),
@@ -230,7 +233,7 @@ class TestComponentSourceCaching:
         assert source == BUTTON_SOURCE
         assert mock_get.call_count == 2
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_source_network_error_falls_back_to_stale_cache(self, mock_get, home_dir):
         stale_source = "# stale but usable\ndef Button(): pass\n"
         call_count = [0]
@@ -252,7 +255,7 @@ class TestComponentSourceCaching:
         source = client.get_source("button")
         assert source == stale_source
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_source_network_error_no_cache_raises(self, mock_get, home_dir):
         call_count = [0]
 
@@ -270,7 +273,7 @@ class TestComponentSourceCaching:
 
 
 class TestCorruptedCache:
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_corrupted_index_cache_refetches(self, mock_get, home_dir):
         mock_get.return_value = _make_response(TEST_INDEX_TEXT)
 
@@ -284,7 +287,7 @@ class TestCorruptedCache:
         assert "button" in components
         mock_get.assert_called_once()
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_corrupted_index_cache_plus_network_failure(self, mock_get, home_dir):
         mock_get.side_effect = requests.ConnectionError("offline")
 
@@ -297,7 +300,7 @@ class TestCorruptedCache:
         with pytest.raises(ConnectionError, match="Cannot fetch registry index"):
             client.list_items("component")
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_corrupted_meta_invalidates_cache(self, mock_get, home_dir):
         mock_get.return_value = _make_response(TEST_INDEX_TEXT)
 
@@ -310,7 +313,7 @@ class TestCorruptedCache:
         client.list_items("component")
         mock_get.assert_called_once()
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_missing_meta_invalidates_non_immutable_cache(self, mock_get, home_dir):
         mock_get.return_value = _make_response(TEST_INDEX_TEXT)
 
@@ -322,7 +325,7 @@ class TestCorruptedCache:
         client.list_items("component")
         mock_get.assert_called_once()
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_missing_meta_okay_for_immutable(self, mock_get, home_dir):
         cache_dir = home_dir / ".starui" / "cache" / "registry" / "v1.0.0"
         cache_dir.mkdir(parents=True)
@@ -335,7 +338,7 @@ class TestCorruptedCache:
 
 
 class TestNoNetworkAvailable:
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_no_cache_no_network_raises(self, mock_get, home_dir):
         mock_get.side_effect = requests.ConnectionError("offline")
 
@@ -343,7 +346,7 @@ class TestNoNetworkAvailable:
         with pytest.raises(ConnectionError, match="Check your network connection"):
             client.list_items("component")
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_constructor_creates_cache_directory(self, mock_get, home_dir):
         RegistryClient(version="v2.0.0")
         expected = home_dir / ".starui" / "cache" / "registry" / "v2.0.0"
@@ -372,7 +375,7 @@ BLOCK_INDEX_TEXT = json.dumps(BLOCK_INDEX)
 
 
 class TestBlockSourceCaching:
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_fetches_block_source_and_caches(self, mock_get, home_dir):
         mock_get.side_effect = [
             _make_response(BLOCK_INDEX_TEXT),
@@ -387,7 +390,7 @@ class TestBlockSourceCaching:
         assert cached.exists()
         assert cached.read_text() == BLOCK_SOURCE
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_cached_block_source_served_on_checksum_match(self, mock_get, home_dir):
         mock_get.return_value = _make_response(BLOCK_INDEX_TEXT)
 
@@ -402,7 +405,7 @@ class TestBlockSourceCaching:
         # Only one call: index fetch. No source fetch needed.
         assert mock_get.call_count == 1
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_list_blocks_returns_sorted_names(self, mock_get, home_dir):
         mock_get.return_value = _make_response(BLOCK_INDEX_TEXT)
 
@@ -410,7 +413,7 @@ class TestBlockSourceCaching:
         blocks = client.list_items("block")
         assert blocks == ["user_button_01"]
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_block_metadata_returns_entry(self, mock_get, home_dir):
         mock_get.return_value = _make_response(BLOCK_INDEX_TEXT)
 
@@ -423,7 +426,7 @@ class TestBlockSourceCaching:
 class TestOldIndexWithoutBlocks:
     """Indexes from older registry versions may lack a 'blocks' key."""
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_old_index_blocks_default_to_empty(self, mock_get, home_dir):
         # TEST_INDEX has no "blocks" key
         mock_get.return_value = _make_response(TEST_INDEX_TEXT)
@@ -432,7 +435,7 @@ class TestOldIndexWithoutBlocks:
         blocks = client.list_items("block")
         assert blocks == []
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_old_index_component_operations_still_work(self, mock_get, home_dir):
         mock_get.return_value = _make_response(TEST_INDEX_TEXT)
 
@@ -440,10 +443,198 @@ class TestOldIndexWithoutBlocks:
         components = client.list_items("component")
         assert "button" in components
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_old_index_block_lookup_raises_not_found(self, mock_get, home_dir):
         mock_get.return_value = _make_response(TEST_INDEX_TEXT)
 
         client = RegistryClient(version="main")
         with pytest.raises(FileNotFoundError, match="not found in registry"):
             client.lookup("some_block")
+
+
+DIALOG_INDEX = {
+    **TEST_INDEX,
+    "components": {
+        **TEST_INDEX["components"],
+        "icon": make_component_entry("icon", "def Icon(): pass\n"),
+        "dialog": make_component_entry("dialog", "def Dialog(): pass\n", deps=["button", "icon"]),
+    },
+}
+SOURCES = {
+    "utils": "def cn(): pass\n",
+    "button": BUTTON_SOURCE,
+    "icon": "def Icon(): pass\n",
+    "dialog": "def Dialog(): pass\n",
+}
+
+
+def _serve(barrier=None):
+    def get(url, **kwargs):
+        if url.endswith("index.json"):
+            return _make_response(json.dumps(DIALOG_INDEX))
+        if barrier is not None:
+            barrier.wait()
+        return _make_response(SOURCES[url.rsplit("/", 1)[1].removesuffix(".py")])
+
+    return get
+
+
+class TestConcurrentFetch:
+    def test_session_is_shared(self):
+        assert get_session() is get_session()
+
+    def test_dependency_closure_is_fetched_concurrently(self, home_dir):
+        # Times out unless all four source requests are in flight together
+        barrier = threading.Barrier(4, timeout=5)
+
+        with patch("requests.Session.get", side_effect=_serve(barrier)):
+            deps, source = RegistryClient(version="main").get_with_dependencies("dialog")
+
+        assert list(deps) == ["utils", "button", "icon"]
+        assert deps["button"] == BUTTON_SOURCE
+        assert source == SOURCES["dialog"]
+
+    def test_prefetched_sources_are_not_refetched(self, home_dir):
+        with patch("requests.Session.get", side_effect=_serve()) as mock_get:
+            client = RegistryClient(version="main")
+            client.prefetch([("dialog", "component"), ("button", "component")])
+            fetched = mock_get.call_count
+            client.get_with_dependencies("dialog")
+            client.get_with_dependencies("button")
+
+        assert fetched == 5  # index + four sources
+        assert mock_get.call_count == fetched
+
+    def test_prefetch_includes_utils(self, home_dir):
+        with patch("requests.Session.get", side_effect=_serve()) as mock_get:
+            client = RegistryClient(version="main")
+            client.prefetch([("icon", "component")])
+            fetched = mock_get.call_count
+            client.get_source("utils")
+
+        assert fetched == 3  # index, icon and utils
+        assert mock_get.call_count == fetched
+
+    def test_stale_cached_file_fails_checksum_and_is_refetched(self, home_dir):
+        components = home_dir / ".starui" / "cache" / "registry" / "main" / "components"
+        components.mkdir(parents=True)
+        (components / "icon.py").write_text("tampered\n")
+        (components / "button.py").write_text(BUTTON_SOURCE)
+
+        with patch("requests.Session.get", side_effect=_serve()) as mock_get:
+            deps, _ = RegistryClient(version="main").get_with_dependencies("dialog")
+
+        fetched = {c.args[0].rsplit("/", 1)[1] for c in mock_get.call_args_list}
+        assert deps["icon"] == SOURCES["icon"]
+        assert "icon.py" in fetched
+        assert "button.py" not in fetched
+
+    def test_fetch_error_propagates(self, home_dir):
+        def get(url, **kwargs):
+            if url.endswith("index.json"):
+                return _make_response(json.dumps(DIALOG_INDEX))
+            return _make_response("", status=500)
+
+        with (
+            patch("requests.Session.get", side_effect=get),
+            pytest.raises(ConnectionError, match="Cannot fetch"),
+        ):
+            RegistryClient(version="main").get_with_dependencies("dialog")
+
+
+def _archive(files: dict[str, str], top: str = "starUI-0.5.0") -> bytes:
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w:gz") as tar:
+        for name, text in files.items():
+            data = text.encode()
+            info = tarfile.TarInfo(f"{top}/{name}")
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+    return buf.getvalue()
+
+
+def _archive_response(payload: bytes, status: int = 200):
+    resp = _make_response("", status=status)
+    resp.iter_content = MagicMock(return_value=[payload[:100], payload[100:]])
+    return resp
+
+
+SNAPSHOT_FILES = {
+    "registry/index.json": json.dumps(DIALOG_INDEX),
+    **{f"registry/components/{name}.py": source for name, source in SOURCES.items()},
+    "docs/README.md": "not part of the registry\n",
+}
+
+
+class TestSnapshot:
+    def test_tagged_version_downloads_one_archive(self, home_dir):
+        with patch("requests.Session.get", return_value=_archive_response(_archive(SNAPSHOT_FILES))) as mock_get:
+            client = RegistryClient(version="v0.5.0")
+            deps, source = client.get_with_dependencies("dialog")
+
+        mock_get.assert_called_once()
+        assert mock_get.call_args.args[0].endswith("/tar.gz/v0.5.0")
+        assert deps == {"utils": SOURCES["utils"], "button": BUTTON_SOURCE, "icon": SOURCES["icon"]}
+        assert source == SOURCES["dialog"]
+
+        cache_dir = home_dir / ".starui" / "cache" / "registry" / "v0.5.0"
+        assert (cache_dir / "components" / "dialog.py").read_text() == SOURCES["dialog"]
+        assert not list(cache_dir.glob(".snapshot-*"))
+        assert not (cache_dir / "docs").exists()
+
+    def test_later_clients_read_from_cache(self, home_dir):
+        with patch("requests.Session.get", return_value=_archive_response(_archive(SNAPSHOT_FILES))):
+            RegistryClient(version="v0.5.0").list_items("component")
+
+        with patch("requests.Session.get") as mock_get:
+            assert RegistryClient(version="v0.5.0").get_source("icon") == SOURCES["icon"]
+        mock_get.assert_not_called()
+
+    def test_checksum_mismatch_is_fetched_individually(self, home_dir):
+        files = {**SNAPSHOT_FILES, "registry/components/icon.py": "tampered\n"}
+
+        def get(url, **kwargs):
+            if "/tar.gz/" in url:
+                return _archive_response(_archive(files))
+            return _make_response(SOURCES["icon"])
+
+        with patch("requests.Session.get", side_effect=get) as mock_get:
+            source = RegistryClient(version="v0.5.0").get_source("icon")
+
+        assert source == SOURCES["icon"]
+        assert mock_get.call_args.args[0].endswith("/registry/components/icon.py")
+
+    def test_falls_back_to_per_file_fetch(self, home_dir):
+        def get(url, **kwargs):
+            if "/tar.gz/" in url:
+                return _archive_response(b"", status=404)
+            return _make_response(json.dumps(DIALOG_INDEX))
+
+        with patch("requests.Session.get", side_effect=get):
+            components = RegistryClient(version="v0.5.0").list_items("component")
+
+        assert "dialog" in components
+
+    def test_archive_without_registry_falls_back(self, home_dir):
+        def get(url, **kwargs):
+            if "/tar.gz/" in url:
+                return _archive_response(_archive({"README.md": "hi"}))
+            return _make_response(json.dumps(DIALOG_INDEX))
+
+        with patch("requests.Session.get", side_effect=get) as mock_get:
+            RegistryClient(version="v0.5.0").list_items("component")
+
+        assert mock_get.call_args.args[0].endswith("/registry/index.json")
+
+    def test_branches_fetch_per_file_by_default(self, home_dir):
+        with patch("requests.Session.get", side_effect=_serve()) as mock_get:
+            RegistryClient(version="main").list_items("component")
+
+        assert mock_get.call_args.args[0].endswith("/registry/index.json")
+
+    def test_branch_snapshot_opt_in(self, home_dir):
+        with patch("requests.Session.get", return_value=_archive_response(_archive(SNAPSHOT_FILES))) as mock_get:
+            RegistryClient(version="main", snapshot=True).get_source("button")
+
+        mock_get.assert_called_once()
+        assert mock_get.call_args.args[0].endswith("/tar.gz/main")
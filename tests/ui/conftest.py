@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Vendored components import each other as the `components` package, as in docs/app.py
+sys.path.insert(0, str(Path(__file__).parents[2] / "registry"))
@@ -0,0 +1,76 @@
+"""Tests for server-backed Command search."""
+
+from components.command import Command, CommandEntry, CommandIndex, CommandInput, CommandList
+from starhtml import to_xml
+
+ENTRIES = [
+    CommandEntry("reset-password", "Reset password"),
+    CommandEntry("profile", "Profile", keywords="account settings"),
+    CommandEntry("user-settings", "User settings"),
+    CommandEntry("settings", "Settings"),
+    CommandEntry("sunset", "Sunset"),
+]
+
+
+def _values(entries):
+    return [e.value for e in entries]
+
+
+class TestCommandIndex:
+    def test_accepts_entries_tuples_and_strings(self):
+        index = CommandIndex([CommandEntry("a", "A"), ("b", "B"), "c"])
+        assert [(e.value, e.label) for e in index.entries] == [("a", "A"), ("b", "B"), ("c", "c")]
+        assert len(index) == 3
+
+    def test_ranks_prefix_word_start_substring_then_keywords(self):
+        index = CommandIndex(ENTRIES)
+        assert _values(index.search("set")) == ["settings", "user-settings", "reset-password", "sunset", "profile"]
+
+    def test_ties_keep_input_order(self):
+        index = CommandIndex(["b-app", "a-app", "apple", "append"])
+        assert _values(index.search("app")) == ["apple", "append", "b-app", "a-app"]
+
+    def test_label_is_not_searched(self):
+        index = CommandIndex([CommandEntry("x1", "Settings")])
+        assert index.search("settings") == []
+
+    def test_empty_query_returns_first_entries(self):
+        index = CommandIndex(ENTRIES, limit=2)
+        assert _values(index.search("")) == ["reset-password", "profile"]
+        assert _values(index.search("   ", limit=3)) == ["reset-password", "profile", "user-settings"]
+
+    def test_short_queries_use_shorter_grams(self):
+        index = CommandIndex(ENTRIES)
+        assert _values(index.search("s")) == ["settings", "sunset", "reset-password", "user-settings", "profile"]
+        assert _values(index.search("SU")) == ["sunset"]
+
+    def test_no_match(self):
+        assert CommandIndex(ENTRIES).search("zzzz") == []
+
+    def test_limit(self):
+        index = CommandIndex(ENTRIES)
+        assert _values(index.search("set", limit=2)) == ["settings", "user-settings"]
+
+
+class TestSearchUrl:
+    def test_results_stream_items_and_visible_signals(self):
+        index = CommandIndex(ENTRIES)
+        (kind, (results, *_)), (signal_kind, signals) = index.results("palette", "set", limit=2)
+        html = to_xml(results)
+
+        assert kind == "elements"
+        assert 'id="palette_results"' in html
+        assert html.index('data-value="settings"') < html.index('data-value="user-settings"')
+        assert "reset-password" not in html  # beyond the limit
+        assert signal_kind == "signals"
+        assert signals["payload"] == {
+            "palette_visible": 2,
+            "palette_visible_items": [{"index": 0}, {"index": 1}],
+            "palette_selected": 0,
+        }
+
+    def test_command_fetches_from_search_url(self):
+        html = to_xml(Command(CommandInput(), CommandList(), signal="palette", search_url="/palette/search"))
+
+        assert """data-on:input__debounce.150ms="@get('/palette/search')\"""" in html
+        assert """data-init="@get('/palette/search')" id="palette_results\"""" in html
@@ -0,0 +1,149 @@
+"""Tests for the shared component runtime."""
+
+import sys
+import threading
+
+from components.runtime import (
+    RUNTIME_JS,
+    RUNTIME_PATH,
+    VIRTUAL_PAGE_SIZE,
+    StarUIRuntime,
+    VirtualOptions,
+    register_runtime,
+    runtime_call,
+    setter,
+)
+from starhtml import js, to_xml
+from starlette.applications import Starlette
+from starlette.testclient import TestClient
+
+
+class TestRuntimeCall:
+    def test_json_encodes_python_values(self):
+        call = runtime_call("autoHide", "scroll_0", 600, True, None, ["a", 'b"'])
+        assert str(call) == 'StarUI.autoHide("scroll_0",600,true,null,["a","b\\""])'
+
+    def test_expressions_pass_through(self):
+        assert str(runtime_call("commandNav", js("evt"), setter("$cmd_selected"))) == (
+            "StarUI.commandNav(evt,v=>$cmd_selected=v)"
+        )
+
+    def test_dicts_become_object_literals_without_none(self):
+        call = runtime_call("virtualList", "list", {"url": "/o", "rowHeight": 32, "highlight": None, "select": js("f")})
+        assert str(call) == 'StarUI.virtualList("list",{url:"/o",rowHeight:32,select:f})'
+
+
+class TestRegisterRuntime:
+    def test_serves_versioned_script(self):
+        app = Starlette()
+        register_runtime(app)
+        response = TestClient(app).get(RUNTIME_PATH)
+
+        assert response.status_code == 200
+        assert response.text == RUNTIME_JS
+        assert response.headers["content-type"].startswith("text/javascript")
+        assert "immutable" in response.headers["cache-control"]
+
+    def test_registers_once_ahead_of_other_routes(self):
+        app = Starlette()
+        app.router.add_route("/{path:path}", lambda request: None)
+        register_runtime(app)
+        register_runtime(app)
+
+        assert [r.path for r in app.router.routes] == [RUNTIME_PATH, "/{path:path}"]
+
+    def test_header_script(self):
+        assert f'src="{RUNTIME_PATH}"' in to_xml(StarUIRuntime())
+        assert "window.StarUI" in to_xml(StarUIRuntime(inline=True))
+
+
+def _countries():
+    return VirtualOptions([("de", "Germany"), ("dk", "Denmark"), ("fr", "France"), "Dominica", ("nl", "Netherlands")])
+
+
+class TestVirtualOptions:
+    def test_pages_all_options(self):
+        options = VirtualOptions(f"item {i}" for i in range(250))
+        page = options.page(offset=200)
+
+        assert page["total"] == 250
+        assert len(page["items"]) == 50
+        assert page["items"][0] == {"value": "item 200", "label": "item 200"}
+        assert len(options.page()["items"]) == VIRTUAL_PAGE_SIZE
+
+    def test_clamps_offset_and_limit(self):
+        options = VirtualOptions(f"item {i}" for i in range(1000))
+
+        assert options.page(offset=-5, limit=2)["items"][0]["value"] == "item 0"
+        assert options.page(limit=-1)["items"] == []
+        assert len(options.page(limit=10_000)["items"]) == 500
+        assert options.page(offset=2000) == {"total": 1000, "items": []}
+
+    def test_filters_value_and_label(self):
+        page = _countries().page(" D ")
+
+        assert page["total"] == 4
+        assert [item["value"] for item in page["items"]] == ["de", "dk", "Dominica", "nl"]
+
+    def test_refined_query_matches_fresh_search(self):
+        options = _countries()
+        options.page("d")
+        refined = options.page("de")
+
+        assert [item["value"] for item in refined["items"]] == ["de", "dk"]
+        assert refined == _countries().page("de")
+
+    def test_paging_within_query(self):
+        page = _countries().page("d", offset=1, limit=2)
+
+        assert page["total"] == 4
+        assert [item["value"] for item in page["items"]] == ["dk", "Dominica"]
+
+    def test_evicts_least_recently_used_queries(self):
+        options = VirtualOptions(f"item {i}" for i in range(50))
+        for i in range(32):
+            options.page(f"item {i}")
+        options.page("item 0")  # refresh
+        options.page("item 40")
+
+        assert "item 0" in options._matches
+        assert "item 1" not in options._matches
+        assert len(options._matches) == 32
+
+    def test_concurrent_queries(self):
+        options = VirtualOptions(f"item {i}" for i in range(2000))
+        errors = []
+
+        def type_queries(seed):
+            try:
+                for i in range(300):
+                    query = f"item {(seed * 7 + i) % 100}"
+                    assert options.page(query)["total"] == len(options._filter(query))
+            except Exception as e:
+                errors.append(e)
+
+        # Switch threads as often as possible so cache reads and evictions interleave
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            threads = [threading.Thread(target=type_queries, args=(n,)) for n in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(interval)
+
+        assert errors == []
+
+    def test_response_parses_query_params(self):
+        app = Starlette()
+        options = _countries()
+        app.router.add_route("/options", options.response)
+        client = TestClient(app)
+
+        assert client.get("/options", params={"q": "fr", "offset": 0, "limit": 5}).json() == {
+            "total": 1,
+            "items": [{"value": "fr", "label": "France"}],
+        }
+        assert client.get("/options", params={"offset": "x"}).json()["total"] == 5
@@ -0,0 +1,173 @@
+"""Tests for DataTable paging, sorting and row streaming."""
+
+import json
+import re
+from urllib.parse import urlencode
+
+from components.table import (
+    DataColumn,
+    DataTable,
+    DataTableParams,
+    TableBody,
+    TableCell,
+    TableRow,
+    data_table_rows,
+    table_body_from_rows,
+)
+from starhtml import B, NotStr, to_xml
+from starlette.requests import Request
+
+COLUMNS = [DataColumn("name", "Name", sortable=True), DataColumn("age", "Age", sortable=True), "city"]
+ROWS = [
+    {"name": "Cleo", "age": 31, "city": "Oslo"},
+    {"name": "Ada", "age": 36, "city": "London"},
+    {"name": "Bo", "age": 24, "city": "Lund"},
+]
+
+
+def _request(**signals):
+    query = urlencode({"datastar": json.dumps(signals)}) if signals else ""
+    return Request({"type": "http", "query_string": query.encode(), "headers": []})
+
+
+def _markup(element):
+    # Row chunks are pre-rendered NotStr markup; spacers are regular elements
+    return str(element) if isinstance(element, NotStr) else to_xml(element)
+
+
+def _html(items):
+    return "".join(_markup(item[1][0]) for item in items if item[0] == "elements")
+
+
+class TestDataTableParams:
+    def test_defaults_without_signals(self):
+        assert DataTableParams.from_request("t", _request(), COLUMNS) == DataTableParams()
+
+    def test_reads_signals(self):
+        params = DataTableParams.from_request(
+            "t", _request(t_offset=20, t_limit=30, t_sort="age", t_desc=True, t_row_height=32), COLUMNS
+        )
+
+        assert params == DataTableParams(offset=20, limit=30, sort="age", desc=True, row_height=32)
+
+    def test_drops_unsortable_and_unknown_sort_keys(self):
+        assert DataTableParams.from_request("t", _request(t_sort="city"), COLUMNS).sort is None
+        assert DataTableParams.from_request("t", _request(t_sort="__class__"), COLUMNS).sort is None
+
+    def test_out_of_range_values_are_clamped(self):
+        params = DataTableParams.from_request("t", _request(t_offset=-10, t_limit=10_000, t_row_height=0), COLUMNS)
+
+        assert (params.offset, params.limit, params.row_height) == (0, 1000, 40)
+        assert DataTableParams.from_request("t", _request(t_limit=0), COLUMNS).limit == 50
+
+    def test_invalid_values_fall_back_to_defaults(self):
+        params = DataTableParams.from_request("t", _request(t_offset="abc", t_limit=None), COLUMNS)
+        assert (params.offset, params.limit) == (0, 50)
+
+        request = Request({"type": "http", "query_string": b"datastar=not-json", "headers": []})
+        assert DataTableParams.from_request("t", request, COLUMNS) == DataTableParams()
+
+    def test_apply_sorts_and_pages(self):
+        assert [r["name"] for r in DataTableParams(sort="name").apply(ROWS)] == ["Ada", "Bo", "Cleo"]
+        assert [r["age"] for r in DataTableParams(offset=1, limit=1, sort="age", desc=True).apply(ROWS)] == [31]
+        assert [r["name"] for r in DataTableParams(offset=1).apply(iter(ROWS))] == ["Ada", "Bo"]
+
+
+class TestDataTableRows:
+    def test_streams_window_in_chunks(self):
+        params = DataTableParams(offset=1, limit=2, row_height=10)
+        items = list(data_table_rows("t", COLUMNS, params.apply(ROWS), params=params, total=3, chunk_size=1))
+
+        spacers, first, second, total = items
+        assert 'id="t_top" style="height:10px"' in to_xml(spacers[1][0][0])
+        assert 'id="t_bottom" style="height:0px"' in to_xml(spacers[1][0][1])
+        assert ">Ada<" in _markup(first[1][0]) and ">Bo<" in _markup(second[1][0])
+        assert total[1]["payload"] == {"t_total": 3}
+
+    def test_aria_rowindex_counts_header_row(self):
+        params = DataTableParams(offset=5, limit=2)
+        html = _html(data_table_rows("t", COLUMNS, ROWS, params=params, total=20))
+
+        assert re.findall(r'aria-rowindex="(\d+)"', html) == ["7", "8"]
+
+    def test_first_row_follows_header(self):
+        html = _html(data_table_rows("t", COLUMNS, ROWS[:1], params=DataTableParams(), total=1))
+        assert 'aria-rowindex="2"' in html
+
+    def test_short_generator_resizes_bottom_spacer(self):
+        params = DataTableParams(limit=10, row_height=10)
+        items = list(data_table_rows("t", COLUMNS, iter(ROWS), params=params))
+
+        assert 'id="t_bottom" style="height:0px"' in to_xml(items[-2][1][0])
+        assert items[-1][1]["payload"] == {"t_total": 3}
+
+    def test_offset_past_total_streams_nothing(self):
+        params = DataTableParams(offset=50, limit=10)
+        items = list(data_table_rows("t", COLUMNS, iter([]), params=params, total=3))
+
+        assert "<td" not in _html(items)
+        assert items[-1][1]["payload"] == {"t_total": 3}
+
+    def test_escapes_cell_values(self):
+        rows = [{"name": "<b>&</b>", "age": 1, "city": None}]
+        html = _html(data_table_rows("t", COLUMNS, rows, params=DataTableParams(), total=1))
+
+        assert "&lt;b&gt;&amp;&lt;/b&gt;" in html
+        assert "<b>" not in html
+
+
+class TestDataTable:
+    def test_rowcount_includes_header(self):
+        html = to_xml(DataTable(COLUMNS, src="/rows", signal="t", total=3))
+
+        assert 'aria-rowcount="4"' in html
+        assert 'data-attr:aria-rowcount="($t_total + 1)"' in html
+
+
+class TestTableBodyFromRows:
+    COLUMNS = [
+        DataColumn("name", "Name", cls="font-medium [&_b]:text-primary"),
+        DataColumn("qty", "Qty", render=lambda v: f"{v} pcs"),
+        "note",
+    ]
+    ROWS = [
+        {"name": '<script>alert("x")</script> & co', "qty": 0, "note": None},
+        {"name": B("bold"), "qty": 3, "note": ("it's ", B("mixed"))},
+    ]
+
+    def _composed(self, rows, row_cls=""):
+        return to_xml(
+            TableBody(
+                *[
+                    TableRow(
+                        TableCell(row["name"], cls="font-medium [&_b]:text-primary"),
+                        TableCell(f"{row['qty']} pcs"),
+                        TableCell(row["note"]),
+                        cls=row_cls,
+                    )
+                    for row in rows
+                ]
+            ),
+            indent=False,
+        )
+
+    def test_matches_component_markup(self):
+        assert to_xml(table_body_from_rows(self.ROWS, self.COLUMNS), indent=False) == self._composed(self.ROWS)
+
+    def test_escapes_like_components(self):
+        html = to_xml(table_body_from_rows(self.ROWS, self.COLUMNS), indent=False)
+
+        assert "<script>" not in html
+        assert '&lt;script&gt;alert("x")&lt;/script&gt; &amp; co' in html
+
+    def test_row_cls(self):
+        html = to_xml(table_body_from_rows(self.ROWS, self.COLUMNS, row_cls="h-8"), indent=False)
+        assert html == self._composed(self.ROWS, row_cls="h-8")
+
+    def test_columnar_and_object_rows(self):
+        columnar = {key: [row[key] for row in self.ROWS] for key in ("name", "qty", "note")}
+        objects = [type("Row", (), row)() for row in self.ROWS]
+        expected = self._composed(self.ROWS)
+
+        assert to_xml(table_body_from_rows(columnar, self.COLUMNS), indent=False) == expected
+        assert to_xml(table_body_from_rows(objects, self.COLUMNS), indent=False) == expected
@@ -0,0 +1,290 @@
+"""Tests for class merging, variant and ID utilities."""
+
+import asyncio
+
+import pytest
+from starhtml import to_xml
+from starlette.applications import Starlette
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.responses import HTMLResponse, JSONResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from starui.utils import (
+    CN_CACHE_SIZE,
+    DeterministicIdMiddleware,
+    StyleCollectorMiddleware,
+    cn,
+    cn_cache_info,
+    collect_styles,
+    component_style,
+    configure_cn_cache,
+    cva,
+    deterministic_ids,
+    gen_id,
+    hoist_component_styles,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_cn_cache():
+    configure_cn_cache()
+    yield
+    configure_cn_cache()
+
+
+class TestCn:
+    def test_strings(self):
+        assert cn("px-2 py-1", "text-sm") == "px-2 py-1 text-sm"
+
+    def test_conflicting_classes_resolved(self):
+        assert cn("px-2", "px-4") == "px-4"
+
+    def test_falsy_inputs_skipped(self):
+        assert cn(None, "", False, "flex") == "flex"
+        assert cn() == ""
+        assert cn(None, "") == ""
+
+    def test_dict_includes_truthy_keys(self):
+        assert cn("flex", {"hidden": False, "gap-2": True}) == "flex gap-2"
+
+    def test_nested_list_and_tuple(self):
+        assert cn(["flex", ("gap-2", {"p-4": True})]) == "flex gap-2 p-4"
+
+    def test_non_string_coerced(self):
+        assert cn("z", 10) == "z 10"
+
+
+class TestCnCache:
+    def test_repeat_calls_hit_cache(self):
+        cn("flex items-center", "gap-2")
+        cn("flex items-center", "gap-2")
+        info = cn_cache_info()
+        assert info.hits == 1
+        assert info.misses == 1
+        assert info.maxsize == CN_CACHE_SIZE
+
+    def test_dict_inputs_keyed_on_resolved_classes(self):
+        assert cn("p-2", {"p-4": True}) == "p-4"
+        assert cn("p-2", {"p-4": False}) == "p-2"
+        assert cn_cache_info().misses == 2
+
+    def test_size_bounded(self):
+        configure_cn_cache(2)
+        for i in range(5):
+            cn(f"p-{i}")
+        assert cn_cache_info().currsize == 2
+
+    def test_zero_disables_cache(self):
+        configure_cn_cache(0)
+        cn("flex")
+        cn("flex")
+        info = cn_cache_info()
+        assert info.hits == 0
+        assert info.currsize == 0
+        assert cn("px-2", "px-4") == "px-4"
+
+    def test_configure_clears_entries(self):
+        cn("flex")
+        configure_cn_cache()
+        assert cn_cache_info().currsize == 0
+
+    def test_negative_size_rejected(self):
+        with pytest.raises(ValueError, match="maxsize"):
+            configure_cn_cache(-1)
+
+
+def _config():
+    return {
+        "variants": {
+            "variant": {"default": "bg-primary", "outline": "border bg-background"},
+            "size": {"sm": "h-8 px-3", "lg": "h-10 px-6"},
+        },
+        "compoundVariants": [
+            {"variant": "outline", "size": "lg", "class": "border-2"},
+            {"tone": "loud", "class": "font-bold"},
+        ],
+        "defaultVariants": {"variant": "default", "size": "sm"},
+    }
+
+
+class TestCva:
+    def test_defaults_applied(self):
+        fn = cva("inline-flex", _config())
+        assert fn() == "inline-flex bg-primary h-8 px-3"
+
+    def test_compound_variant(self):
+        fn = cva("inline-flex", _config())
+        assert fn(variant="outline", size="lg") == "inline-flex bg-background h-10 px-6 border-2"
+
+    def test_cls_merged_last(self):
+        fn = cva("inline-flex", _config())
+        assert fn(size="lg", cls="px-2") == "inline-flex bg-primary h-10 px-2"
+
+
+class TestCvaPrecompile:
+    @pytest.mark.parametrize(
+        "props",
+        [
+            {},
+            {"variant": "outline"},
+            {"variant": "outline", "size": "lg"},
+            {"size": "lg", "cls": "px-2 border-4"},
+            {"variant": "unknown"},
+            {"variant": None},
+            {"tone": "loud"},
+            {"variant": "outline", "size": "lg", "tone": "loud"},
+        ],
+    )
+    def test_matches_dynamic_resolution(self, props):
+        dynamic = cva("inline-flex", _config())
+        compiled = cva("inline-flex", _config(), precompile=True)
+        assert compiled(**props) == dynamic(**props)
+
+    def test_declared_combinations_skip_merging(self):
+        compiled = cva("inline-flex", _config(), precompile=True)
+        before = cn_cache_info()
+        compiled(variant="outline", size="lg")
+        after = cn_cache_info()
+        assert (after.hits, after.misses) == (before.hits, before.misses)
+
+    def test_too_many_combinations_rejected(self):
+        config = {"variants": {k: {str(i): f"c{i}" for i in range(100)} for k in ("a", "b")}}
+        with pytest.raises(ValueError, match="combinations"):
+            cva(config=config, precompile=True)
+
+
+class TestGenId:
+    def test_random_outside_scope(self):
+        assert gen_id("select") != gen_id("select")
+        assert len(gen_id("select")) == len("select_") + 8
+
+    def test_sequential_base36_in_scope(self):
+        with deterministic_ids():
+            ids = [gen_id("x") for _ in range(37)]
+        assert ids[:3] == ["x_0", "x_1", "x_2"]
+        assert ids[10] == "x_a"
+        assert ids[36] == "x_10"
+
+    def test_identical_renders_match(self):
+        def render():
+            with deterministic_ids():
+                return [gen_id("dialog"), gen_id("select")]
+
+        assert render() == render()
+
+    def test_nested_scope_restores_outer_counter(self):
+        with deterministic_ids():
+            assert gen_id("a") == "a_0"
+            with deterministic_ids():
+                assert gen_id("b") == "b_0"
+            assert gen_id("a") == "a_1"
+        assert gen_id("a") != "a_2"
+
+    def test_middleware_scopes_each_request(self):
+        seen = []
+
+        async def app(scope, receive, send):
+            seen.append(gen_id("req"))
+
+        middleware = DeterministicIdMiddleware(app)
+        asyncio.run(middleware({"type": "http"}, None, None))
+        asyncio.run(middleware({"type": "http"}, None, None))
+        asyncio.run(middleware({"type": "lifespan"}, None, None))
+        assert seen[:2] == ["req_0", "req_0"]
+        assert seen[2] != "req_0"
+
+    def test_namespaced_scope(self):
+        with deterministic_ids("frag"):
+            assert [gen_id("select"), gen_id("select")] == ["select_frag_0", "select_frag_1"]
+
+    def test_middleware_namespaces_datastar_requests(self):
+        seen = []
+
+        async def app(scope, receive, send):
+            seen.append(gen_id("select"))
+
+        middleware = DeterministicIdMiddleware(app)
+        datastar = {"type": "http", "headers": [(b"datastar-request", b"true")]}
+        asyncio.run(middleware(datastar, None, None))
+        asyncio.run(middleware(datastar, None, None))
+        asyncio.run(middleware({"type": "http", "headers": []}, None, None))
+        assert seen[0] != seen[1]
+        assert all(id_.startswith("select_") and id_.endswith("_0") and id_ != "select_0" for id_ in seen[:2])
+        assert seen[2] == "select_0"
+
+    def test_vendored_utils_share_scope(self):
+        from components import utils as vendored
+
+        with vendored.deterministic_ids():
+            assert gen_id("a") == "a_0"
+        with deterministic_ids():
+            assert vendored.gen_id("a") == "a_0"
+
+
+def _page_app(response=HTMLResponse):
+    def render():
+        parts = [component_style(".a{}"), component_style(".b{}"), component_style(".a{}")]
+        return "".join(to_xml(p) for p in parts if p is not None)
+
+    async def page(request):
+        html = render()
+        return JSONResponse({"html": html}) if response is JSONResponse else HTMLResponse(f"<body>{html}</body>")
+
+    return Starlette(routes=[Route("/", page)])
+
+
+class TestStyleCollection:
+    def test_inline_outside_scope(self):
+        assert to_xml(component_style(".a{}")) == "<style>.a{}</style>\n"
+
+    def test_collects_and_dedupes(self):
+        with collect_styles() as styles:
+            assert component_style(".a{}") is None
+            component_style(".b{}")
+            component_style("\n.a{}\n")
+        assert len(styles) == 2
+        assert styles.css == ".a{}\n.b{}"
+        assert to_xml(styles.style()) == "<style>.a{}\n.b{}</style>\n"
+
+    def test_empty_collector(self):
+        with collect_styles() as styles:
+            pass
+        assert styles.style() is None
+
+    def test_inline_first_keeps_first_use(self):
+        with collect_styles(inline_first=True) as styles:
+            assert to_xml(component_style(".a{}")) == "<style>.a{}</style>\n"
+            assert component_style(".a{}") is None
+        assert styles.css == ".a{}"
+
+    def test_middleware_emits_each_style_once(self):
+        app = StyleCollectorMiddleware(_page_app())
+        body = TestClient(app).get("/").text
+        assert body.count(".a{}") == 1
+        assert body.count(".b{}") == 1
+
+    def test_middleware_keeps_css_with_inner_gzip(self):
+        app = StyleCollectorMiddleware(GZipMiddleware(_page_app(), minimum_size=0))
+        response = TestClient(app).get("/", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.text.count(".a{}") == 1
+        assert ".b{}" in response.text
+
+    def test_middleware_keeps_css_in_non_html_responses(self):
+        app = StyleCollectorMiddleware(_page_app(JSONResponse))
+        html = TestClient(app).get("/").json()["html"]
+        assert html == "<style>.a{}</style>\n<style>.b{}</style>\n"
+
+
+class TestHoistComponentStyles:
+    def test_hoisted_styles_not_emitted(self):
+        hoist_component_styles()
+        try:
+            assert component_style(".a{}") is None
+            with collect_styles() as styles:
+                component_style(".a{}")
+            assert len(styles) == 0
+        finally:
+            hoist_component_styles(False)
+        assert component_style(".a{}") is not None